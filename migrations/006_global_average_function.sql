@@ -0,0 +1,21 @@
+-- Migration: 006_global_average_function.sql
+-- Description: Compute global average percentage in the database instead of in the bot
+-- Date: 2026-10-15
+
+-- Average of all non-null snapshot percentages (period_days = 0 means all-time).
+-- Called via PostgREST RPC: rpc("global_average", {"period_days": N})
+CREATE OR REPLACE FUNCTION global_average(period_days INTEGER)
+RETURNS DOUBLE PRECISION AS $$
+    SELECT AVG(percentage)::DOUBLE PRECISION
+    FROM daily_snapshots
+    WHERE percentage IS NOT NULL
+      AND (
+          period_days = 0
+          OR snapshot_date BETWEEN CURRENT_DATE - period_days AND CURRENT_DATE
+      );
+$$ LANGUAGE sql STABLE;
+
+-- Partial covering index so the aggregate can be answered from the index alone
+CREATE INDEX IF NOT EXISTS idx_daily_snapshots_date_percentage
+    ON daily_snapshots(snapshot_date, percentage)
+    WHERE percentage IS NOT NULL;
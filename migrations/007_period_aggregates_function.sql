@@ -0,0 +1,29 @@
+-- Migration: 007_period_aggregates_function.sql
+-- Description: Per-user snapshot aggregates for a date range, computed in the database
+-- Date: 2026-10-15
+
+-- One row per user: average percentage (NULLs ignored), snapshot count and date bounds.
+-- Called via PostgREST RPC: rpc("period_aggregates", {"p_start_date": ..., "p_end_date": ..., "p_user_id": ...})
+CREATE OR REPLACE FUNCTION period_aggregates(
+    p_start_date DATE,
+    p_end_date DATE,
+    p_user_id INTEGER DEFAULT NULL
+)
+RETURNS TABLE (
+    user_id INTEGER,
+    avg_percentage DOUBLE PRECISION,
+    snapshot_count BIGINT,
+    min_date DATE,
+    max_date DATE
+) AS $$
+    SELECT
+        s.user_id,
+        AVG(s.percentage)::DOUBLE PRECISION,
+        COUNT(*),
+        MIN(s.snapshot_date),
+        MAX(s.snapshot_date)
+    FROM daily_snapshots s
+    WHERE s.snapshot_date BETWEEN p_start_date AND p_end_date
+      AND (p_user_id IS NULL OR s.user_id = p_user_id)
+    GROUP BY s.user_id;
+$$ LANGUAGE sql STABLE;
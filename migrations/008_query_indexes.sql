@@ -0,0 +1,15 @@
+-- Migration: 008_query_indexes.sql
+-- Description: Indexes for keyset leaderboard pagination and recent title history
+-- Date: 2026-10-15
+--
+-- Note: migrations run inside a transaction, so CONCURRENTLY cannot be used here.
+-- On a large live table, create these indexes CONCURRENTLY by hand first; the
+-- IF NOT EXISTS clauses then make this migration a no-op.
+
+-- Leaderboard ordering / keyset pagination on (title_letter_count, id).
+-- Supersedes the single-column idx_users_title_letter_count.
+CREATE INDEX IF NOT EXISTS idx_users_title_letter_count_id ON users(title_letter_count, id);
+DROP INDEX IF EXISTS idx_users_title_letter_count;
+
+-- Recent title changes across all users (get_recent)
+CREATE INDEX IF NOT EXISTS idx_title_history_created_at ON title_history(created_at DESC);
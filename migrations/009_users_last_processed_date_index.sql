@@ -0,0 +1,12 @@
+-- Migration: 009_users_last_processed_date_index.sql
+-- Description: Index users by last_processed_date for the daily snapshot job
+-- Date: 2026-10-15
+--
+-- Note: migrations run inside a transaction, so CONCURRENTLY cannot be used here.
+-- On a large live table, create this index CONCURRENTLY by hand first; the
+-- IF NOT EXISTS clause then makes this migration a no-op.
+
+-- Users active on a given day (find_by_last_processed_date); users who never
+-- sent a percentage message are left out of the index
+CREATE INDEX IF NOT EXISTS idx_users_last_processed_date ON users(last_processed_date)
+    WHERE last_processed_date IS NOT NULL;
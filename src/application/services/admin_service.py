@@ -15,6 +15,9 @@ class AdminService:
         """
         Check if user is admin by user_id (primary) or username (fallback).
         
+        Compares against ADMIN_USER_ID / ADMIN_USERNAME loaded at startup; no
+        I/O is involved, so callers need not cache the result.
+        
         Args:
             telegram_user_id: Telegram user ID
             username: Telegram username (optional fallback)
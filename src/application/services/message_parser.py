@@ -9,6 +9,9 @@ from ...domain.exceptions import InvalidPercentageError
 if TYPE_CHECKING:
     from telegram import Message
 
+# Usernames whose messages (sent by or via the bot) carry a percentage
+HOWGAYBOT_USERNAMES = frozenset({"HowGayBot"})
+
 
 class MessageParser:
     """Service for parsing messages from @HowGayBot."""
@@ -33,16 +36,13 @@ class MessageParser:
         """
         if not message:
             return False
-        
-        # Check if message is directly from HowGayBot
-        if message.from_user and message.from_user.username == "HowGayBot":
-            return True
-        
-        # Check if message is sent via HowGayBot
-        if message.via_bot and message.via_bot.username == "HowGayBot":
-            return True
-        
-        return False
+
+        # Most messages come from neither, so keep this to two attribute
+        # lookups and set membership tests
+        return (
+            getattr(message.from_user, "username", None) in HOWGAYBOT_USERNAMES
+            or getattr(message.via_bot, "username", None) in HOWGAYBOT_USERNAMES
+        )
 
     @classmethod
     def extract_percentage(cls, message_text: str) -> Percentage:
@@ -1,7 +1,7 @@
 """Calculate statistics use case."""
 
 from typing import Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from ...domain.repositories.statistics_repository import IStatisticsRepository
 from ...domain.repositories.settings_repository import ISettingsRepository
@@ -57,7 +57,7 @@ class CalculateStatisticsUseCase:
 
         if global_average is not None:
             # Cache with expiration (+1 day from now)
-            expires_at = datetime.now() + timedelta(days=1)
+            expires_at = datetime.now(timezone.utc) + timedelta(days=1)
             await self._statistics_repository.cache_statistics(
                 cache_key, period_days, global_average, expires_at
             )
@@ -60,3 +60,39 @@ class DeleteUserUseCase:
             raise UserNotFoundError(
                 f"User with Telegram ID {target_telegram_user_id} not found"
             )
+
+    async def execute_by_username(
+        self,
+        username: str,
+        admin_telegram_user_id: int,
+        admin_username: Optional[str] = None,
+    ) -> bool:
+        """
+        Delete the user with the given Telegram username.
+
+        Resolves the username and deletes in two queries, without the separate
+        existence check execute() does by Telegram ID. An unknown username is
+        the usual bad input here, so it is reported by the return value rather
+        than by raising UserNotFoundError.
+
+        Args:
+            username: Telegram username of the user to delete (without @)
+            admin_telegram_user_id: Telegram user ID of admin
+            admin_username: Admin username (optional, for fallback validation)
+
+        Returns:
+            True if the user was deleted, False if no user has that username
+
+        Raises:
+            PermissionError: If user is not admin
+        """
+        if not self._admin_service.is_admin(admin_telegram_user_id, admin_username):
+            raise PermissionError("Admin access required")
+
+        user = await self._user_repository.get_by_username(username)
+        if not user:
+            return False
+
+        # Delete user (cascade will handle related records); a concurrent delete
+        # between the lookup and here shows up as deleted == False
+        return await self._user_repository.delete(user.telegram_user_id)
@@ -87,27 +87,21 @@ class GetLeaderboardUseCase:
         Returns:
             User's position (1-based) or None if not found
         """
-        # Get user
-        user = await self._user_repository.get_by_telegram_id(telegram_user_id)
+        # Get user (only the letter count is needed)
+        user = await self._user_repository.get_core_by_telegram_id(telegram_user_id)
         if not user:
             return None
 
         # Count users with better (lower or higher) letter count
         if sort_order == "asc":
             # Position = count of users with fewer letters + 1
-            better_users = await self._user_repository.find_by_title_letter_count_range(
+            better_count = await self._user_repository.count_by_title_letter_count_range(
                 max_count=user.title_letter_count - 1,
-                limit=None,
-                offset=0,
-                sort_order="asc",
             )
         else:
             # Position = count of users with more letters + 1
-            better_users = await self._user_repository.find_by_title_letter_count_range(
+            better_count = await self._user_repository.count_by_title_letter_count_range(
                 min_count=user.title_letter_count + 1,
-                limit=None,
-                offset=0,
-                sort_order="desc",
             )
 
-        return len(better_users) + 1
+        return better_count + 1
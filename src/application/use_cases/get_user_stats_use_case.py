@@ -1,5 +1,6 @@
 """Get user stats use case."""
 
+import asyncio
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 from datetime import date, timedelta
@@ -67,24 +68,25 @@ class GetUserStatsUseCase:
         if not user:
             return None
 
-        # Get position in leaderboard
-        position = await self._get_leaderboard_use_case.get_user_position(
-            telegram_user_id, sort_order="asc"
-        )
-
-        # Get recent title changes (last 5)
-        recent_changes = await self._title_history_repository.get_by_user(
-            user.id or 0, limit=5
-        )
-
-        # Calculate trends from daily snapshots
+        # Everything below depends only on the user row, so run the queries
+        # concurrently: leaderboard position, recent title changes (last 5)
+        # and trends from daily snapshots
+        user_id = user.id or 0
         today = date.today()
-        daily_trend = await self._calculate_trend(user.id or 0, today, today)
-        weekly_trend = await self._calculate_trend(
-            user.id or 0, today - timedelta(days=7), today
-        )
-        monthly_trend = await self._calculate_trend(
-            user.id or 0, today - timedelta(days=30), today
+        (
+            position,
+            recent_changes,
+            daily_trend,
+            weekly_trend,
+            monthly_trend,
+        ) = await asyncio.gather(
+            self._get_leaderboard_use_case.get_user_position(
+                telegram_user_id, sort_order="asc"
+            ),
+            self._title_history_repository.get_by_user(user_id, limit=5),
+            self._calculate_trend(user_id, today, today),
+            self._calculate_trend(user_id, today - timedelta(days=7), today),
+            self._calculate_trend(user_id, today - timedelta(days=30), today),
         )
 
         return UserStats(
@@ -105,18 +107,11 @@ class GetUserStatsUseCase:
         self, user_id: int, start_date: date, end_date: date
     ) -> Optional[float]:
         """Calculate average percentage trend for period."""
-        snapshots = await self._statistics_repository.get_snapshots_by_period(
+        aggregates = await self._statistics_repository.get_period_aggregates(
             start_date, end_date, user_id=user_id
         )
 
-        if not snapshots:
-            return None
-
-        percentages = [
-            s["percentage"] for s in snapshots if s.get("percentage") is not None
-        ]
-
-        if not percentages:
+        if not aggregates or aggregates[0].get("avg_percentage") is None:
             return None
 
-        return sum(percentages) / len(percentages)
+        return float(aggregates[0]["avg_percentage"])
@@ -64,25 +64,24 @@ class MigrateUsersToDefaultTitleUseCase:
         
         default_title = Title(default_title_str.strip())
         
-        # Get all users
-        all_users = await self._user_repository.find_all()
-        
         updated_count = 0
         
         # Update each user's full_title and recalculate displayed title if they have percentage
-        for user in all_users:
-            # Update full_title to default title
-            user.set_full_title(default_title)
-            
-            # Recalculate displayed title if user has percentage
-            if user.last_percentage is not None:
-                new_displayed_title = await self._title_calculation_service.calculate_displayed_title(
-                    user.full_title, user.last_percentage, user.title
-                )
-                user.update_title(new_displayed_title)
+        # (keyset pages, so large tables are not truncated by the API row limit)
+        async for users in self._user_repository.iter_all():
+            for user in users:
+                # Update full_title to default title
+                user.set_full_title(default_title)
             
-            # Save user
-            await self._user_repository.save(user)
-            updated_count += 1
+                # Recalculate displayed title if user has percentage
+                if user.last_percentage is not None:
+                    new_displayed_title = await self._title_calculation_service.calculate_displayed_title(
+                        user.full_title, user.last_percentage, user.title
+                    )
+                    user.update_title(new_displayed_title)
+
+            # Save the whole page in one batched upsert
+            await self._user_repository.save_many(users)
+            updated_count += len(users)
         
         return updated_count
@@ -1,6 +1,6 @@
 """Register user use case for user registration with default title."""
 
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from ...domain.repositories.user_repository import IUserRepository
 from ...domain.repositories.settings_repository import ISettingsRepository
@@ -59,12 +59,56 @@ class RegisterUserUseCase:
             return False  # User already exists, return success (idempotent)
         
         # Get default title from settings
-        default_title_str = await self._settings_repository.get_default_title()
-        default_title = Title(default_title_str if default_title_str else "")
+        default_title = await self._get_default_title()
+        user = self._new_user(default_title, telegram_user_id, telegram_username, display_name)
+        
+        # Save user to repository
+        try:
+            await self._user_repository.save(user)
+            return True  # User created successfully
+        except Exception as e:
+            # Handle database errors
+            if "connection" in str(e).lower() or "network" in str(e).lower():
+                raise ConnectionError(f"Database connection failed: {str(e)}")
+            raise  # Re-raise other exceptions
+
+    async def execute_many(
+        self, candidates: List[Tuple[int, Optional[str], Optional[str]]]
+    ) -> int:
+        """
+        Register many users at once (one bulk insert, existing users are skipped).
         
-        # Create new user
+        Args:
+            candidates: (telegram_user_id, telegram_username, display_name) tuples
+            
+        Returns:
+            Number of users actually created
+        """
+        candidates = [c for c in candidates if c[0] > 0]
+        if not candidates:
+            return 0
+        default_title = await self._get_default_title()
+        users = [
+            self._new_user(default_title, telegram_user_id, telegram_username, display_name)
+            for telegram_user_id, telegram_username, display_name in candidates
+        ]
+        return await self._user_repository.create_many(users)
+
+    async def _get_default_title(self) -> Title:
+        """Default title from settings (empty if unset)."""
+        default_title_str = await self._settings_repository.get_default_title()
+        return Title(default_title_str if default_title_str else "")
+
+    @staticmethod
+    def _new_user(
+        default_title: Title,
+        telegram_user_id: int,
+        telegram_username: Optional[str],
+        display_name: Optional[str],
+    ) -> User:
+        """Build a new user with the default title."""
         # Note: id, created_at, and updated_at are auto-generated by the database
-        user = User(
+        return User(
             telegram_user_id=telegram_user_id,
             telegram_username=telegram_username,
             display_name=display_name,
@@ -78,13 +122,3 @@ class RegisterUserUseCase:
             last_processed_date=None,
             # id, created_at, and updated_at are set by database
         )
-        
-        # Save user to repository
-        try:
-            await self._user_repository.save(user)
-            return True  # User created successfully
-        except Exception as e:
-            # Handle database errors
-            if "connection" in str(e).lower() or "network" in str(e).lower():
-                raise ConnectionError(f"Database connection failed: {str(e)}")
-            raise  # Re-raise other exceptions
@@ -56,46 +56,52 @@ class SetFullTitleForAllUseCase:
         # Create Title value object from string
         full_title_vo = Title(full_title)
 
-        # Get all users
-        users = await self._user_repository.find_all(limit=None, offset=0)
-        
         updated_count = 0
         
-        # Update each user
-        for user in users:
-            # Save old full_title for history
-            old_full_title_str = str(user.full_title)
+        # Update each user (keyset pages, so large tables are not truncated by the API row limit)
+        async for users in self._user_repository.iter_all():
+            old_full_titles = {}
+            for user in users:
+                # Save old full_title for history
+                old_full_titles[user.telegram_user_id] = str(user.full_title)
+
+                # Set full_title
+                user.set_full_title(full_title_vo)
+
+                # Recalculate displayed title if user has a last_percentage
+                if user.last_percentage:
+                    displayed_title = await self._title_calculation_service.calculate_displayed_title(
+                        full_title_vo, user.last_percentage, user.title
+                    )
+                    user.update_title(displayed_title)
+                else:
+                    # If no last_percentage, preserve current title (will be calculated on next message)
+                    # Don't set to empty to avoid losing the current title
+                    pass
+
+            # Save the whole page in one batched upsert
+            saved_users = await self._user_repository.save_many(users)
 
-            # Set full_title
-            user.set_full_title(full_title_vo)
+            history_entries = []
+            for saved_user in saved_users:
+                if not saved_user.id:
+                    continue  # Skip if ID not set (shouldn't happen, but safe guard)
 
-            # Recalculate displayed title if user has a last_percentage
-            if user.last_percentage:
-                from ...domain.value_objects.percentage import Percentage
-                displayed_title = await self._title_calculation_service.calculate_displayed_title(
-                    full_title_vo, user.last_percentage, user.title
+                old_full_title_str = old_full_titles.get(saved_user.telegram_user_id)
+
+                # Title history entry for full_title change
+                history_entries.append(
+                    {
+                        "user_id": saved_user.id,
+                        "old_title": old_full_title_str if old_full_title_str else None,
+                        "new_title": str(full_title_vo),
+                        "percentage": None,  # Full title change is not triggered by percentage
+                        "change_type": "manual_admin",
+                    }
                 )
-                user.update_title(displayed_title)
-            else:
-                # If no last_percentage, preserve current title (will be calculated on next message)
-                # Don't set to empty to avoid losing the current title
-                pass
 
-            # Save user
-            saved_user = await self._user_repository.save(user)
-            
-            if not saved_user.id:
-                continue  # Skip if ID not set (shouldn't happen, but safe guard)
-            
-            # Create title history entry for full_title change
-            await self._title_history_repository.save(
-                user_id=saved_user.id,
-                old_title=old_full_title_str if old_full_title_str else None,
-                new_title=str(full_title_vo),
-                percentage=None,  # Full title change is not triggered by percentage
-                change_type="manual_admin",
-            )
-            
-            updated_count += 1
+            # Write the page's history in one batched insert
+            await self._title_history_repository.save_many(history_entries)
+            updated_count += len(history_entries)
         
         return updated_count
@@ -2,6 +2,7 @@
 
 from typing import Optional
 from datetime import date, datetime
+import logging
 import structlog
 import pytz
 
@@ -102,15 +103,17 @@ class UpdateTitleUseCase:
             return
 
         # Calculate displayed title by incrementing/decrementing from current title based on percentage
-        logger.debug(
-            "Starting title calculation",
-            telegram_user_id=telegram_user_id,
-            percentage=int(percentage),
-            current_title=str(user.title),
-            current_title_letter_count=user.title.letter_count(),
-            full_title=str(user.full_title),
-            full_title_letter_count=user.full_title.letter_count()
-        )
+        debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug(
+                "Starting title calculation",
+                telegram_user_id=telegram_user_id,
+                percentage=int(percentage),
+                current_title=str(user.title),
+                current_title_letter_count=user.title.letter_count(),
+                full_title=str(user.full_title),
+                full_title_letter_count=user.full_title.letter_count()
+            )
         
         displayed_title = await self._title_calculation_service.calculate_displayed_title(
             user.full_title, percentage, user.title
@@ -119,15 +122,16 @@ class UpdateTitleUseCase:
         # Save old displayed title for history (not full_title)
         old_title_str = str(user.title)
 
-        logger.debug(
-            "Title calculation completed",
-            telegram_user_id=telegram_user_id,
-            percentage=int(percentage),
-            old_title=old_title_str,
-            old_title_letter_count=user.title.letter_count(),
-            new_title=str(displayed_title),
-            new_title_letter_count=displayed_title.letter_count()
-        )
+        if debug_enabled:
+            logger.debug(
+                "Title calculation completed",
+                telegram_user_id=telegram_user_id,
+                percentage=int(percentage),
+                old_title=old_title_str,
+                old_title_letter_count=user.title.letter_count(),
+                new_title=str(displayed_title),
+                new_title_letter_count=displayed_title.letter_count()
+            )
 
         # Update displayed title (full_title remains unchanged)
         # The calculation service returns a valid substring of full_title (can be empty)
@@ -136,8 +140,15 @@ class UpdateTitleUseCase:
         user.last_percentage = percentage
         user.update_last_processed_date(message_date_aware)
 
-        # Save user (upsert returns user with ID set)
-        saved_user = await self._user_repository.save(user)
+        # Conditional write: only lands if the title is still unlocked and this date
+        # was not processed in the meantime (e.g. a concurrent message)
+        saved_user = await self._user_repository.apply_title_update(user)
+        if saved_user is None:
+            logger.debug(
+                "Title update skipped: user locked or already processed concurrently",
+                telegram_user_id=telegram_user_id,
+            )
+            return
         if not saved_user.id:
             raise ValueError("User ID not set after save")
 
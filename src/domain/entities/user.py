@@ -9,7 +9,7 @@ from ..value_objects.percentage import Percentage
 from ..value_objects.timezone import Timezone
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """User entity with title management and preferences."""
 
@@ -99,3 +99,15 @@ class User:
         if self.last_processed_date is None:
             return True
         return self.last_processed_date < message_date
+
+
+@dataclass(frozen=True)
+class UserCore:
+    """Read-only projection of the user fields needed on hot paths (no full title, no metadata)."""
+
+    id: Optional[int]
+    telegram_user_id: int
+    title: Title
+    title_letter_count: int
+    timezone: Timezone
+    language: str
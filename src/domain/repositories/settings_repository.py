@@ -17,6 +17,11 @@ class ISettingsRepository(ABC):
         """Set setting value."""
         pass
 
+    @abstractmethod
+    async def preload(self) -> None:
+        """Load all settings into the read cache in one query (startup warm-up)."""
+        pass
+
     @abstractmethod
     async def get_global_average_period(self) -> int:
         """Get global average period in days (0 = all-time)."""
@@ -28,6 +28,24 @@ class IStatisticsRepository(ABC):
         """Create daily snapshot for user."""
         pass
 
+    @abstractmethod
+    async def create_daily_snapshots_bulk(
+        self, rows: List[Dict[str, Any]]
+    ) -> int:
+        """
+        Create daily snapshots for many users (idempotent).
+
+        Rows are written in batches; a failing batch does not stop the others.
+
+        Args:
+            rows: Snapshot rows with keys user_id, snapshot_date (date),
+                percentage, title, title_letter_count
+
+        Returns:
+            Number of rows written (len(rows) minus rows in failed batches)
+        """
+        pass
+
     @abstractmethod
     async def get_snapshots_by_period(
         self, start_date: date, end_date: date, user_id: Optional[int] = None
@@ -35,6 +53,19 @@ class IStatisticsRepository(ABC):
         """Get snapshots for period (optionally filtered by user)."""
         pass
 
+    @abstractmethod
+    async def get_period_aggregates(
+        self, start_date: date, end_date: date, user_id: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get per-user snapshot aggregates for period (optionally for one user).
+
+        Returns:
+            One dict per user with keys user_id, avg_percentage, snapshot_count,
+            min_date, max_date
+        """
+        pass
+
     @abstractmethod
     async def get_global_average(
         self, period_days: int = 0
@@ -25,6 +25,16 @@ class ITitleHistoryRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def save_many(self, entries: List[Dict[str, Any]]) -> None:
+        """
+        Save many title history entries in batched requests.
+
+        Args:
+            entries: Dicts with the same keys as save()'s arguments
+        """
+        pass
+
     @abstractmethod
     async def get_by_user(
         self, user_id: int, limit: Optional[int] = None
@@ -1,10 +1,10 @@
 """User repository interface."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from datetime import date
 
-from ..entities.user import User
+from ..entities.user import User, UserCore
 
 
 class IUserRepository(ABC):
@@ -15,27 +15,122 @@ class IUserRepository(ABC):
         """Get user by Telegram user ID."""
         pass
 
+    @abstractmethod
+    async def get_core_by_telegram_id(self, telegram_user_id: int) -> Optional[UserCore]:
+        """Get the core fields of a user by Telegram user ID (lighter than get_by_telegram_id)."""
+        pass
+
+    @abstractmethod
+    async def get_language_by_telegram_id(self, telegram_user_id: int) -> str:
+        """Get a user's language code ('en' if the user is not registered)."""
+        pass
+
+    @abstractmethod
+    def get_cached_language(self, telegram_user_id: int) -> Optional[str]:
+        """Get a user's language code only if it is known without a query (None otherwise)."""
+        pass
+
     @abstractmethod
     async def get_by_username(self, username: str) -> Optional[User]:
         """Get user by Telegram username."""
         pass
 
+    @abstractmethod
+    async def get_by_usernames(self, usernames: List[str]) -> Dict[str, User]:
+        """
+        Get users by Telegram username with a single query.
+
+        Returns:
+            Mapping of username to user; usernames without a user are omitted
+        """
+        pass
+
     @abstractmethod
     async def save(self, user: User) -> User:
         """Save or update user."""
         pass
 
     @abstractmethod
-    async def find_all(self, limit: Optional[int] = None, offset: int = 0) -> List[User]:
-        """Find all users with pagination."""
+    async def save_many(self, users: List[User]) -> List[User]:
+        """
+        Save or update many users with batched requests.
+
+        Intended for bulk jobs over existing users (all with id set); rows in
+        one batch must carry the same columns.
+
+        Returns:
+            Saved users as returned by the database
+        """
+        pass
+
+    @abstractmethod
+    async def create_many(self, users: List[User]) -> int:
+        """
+        Insert new users in one request, skipping those already registered.
+
+        Returns:
+            Number of users actually inserted
+        """
+        pass
+
+    @abstractmethod
+    async def apply_title_update(self, user: User) -> Optional[User]:
+        """
+        Persist an automatic title update in a single conditional write.
+
+        Writes the user's title, full title, last percentage and last processed
+        date, but only while the stored title is unlocked and the stored
+        last_processed_date is earlier than user.last_processed_date.
+
+        Args:
+            user: User entity carrying the new title state
+
+        Returns:
+            Updated user, or None if the row is missing, locked or was already
+            processed for that date (e.g. by a concurrent update)
+        """
+        pass
+
+    @abstractmethod
+    async def find_all(
+        self, limit: Optional[int] = None, offset: int = 0, after_id: Optional[int] = None
+    ) -> List[User]:
+        """
+        Find all users with pagination.
+
+        Pass after_id (last seen id) for keyset pagination instead of offset.
+        """
+        pass
+
+    @abstractmethod
+    def iter_all(self, page_size: int = 500) -> AsyncIterator[List[User]]:
+        """Iterate over all users in pages of up to page_size, ordered by id (keyset)."""
+        pass
+
+    @abstractmethod
+    async def find_by_last_processed_date(self, processed_date: date) -> List[User]:
+        """Find users whose last processed message falls on processed_date."""
         pass
 
     @abstractmethod
     async def find_by_title_letter_count_range(
         self, min_count: Optional[int] = None, max_count: Optional[int] = None,
-        limit: Optional[int] = None, offset: int = 0, sort_order: str = "asc"
+        limit: Optional[int] = None, offset: int = 0, sort_order: str = "asc",
+        cursor: Optional[Tuple[int, int]] = None,
     ) -> List[User]:
-        """Find users by title letter count range with sorting."""
+        """
+        Find users by title letter count range with sorting.
+
+        Pass cursor = (title_letter_count, id) of the last row seen for keyset
+        pagination instead of offset.
+        """
+        pass
+
+    @abstractmethod
+    async def count_by_title_letter_count_range(
+        self, min_count: Optional[int] = None, max_count: Optional[int] = None
+    ) -> int:
+        """Count users whose title letter count falls in the range (without fetching rows)."""
         pass
 
     @abstractmethod
@@ -1,5 +1,6 @@
 """Title calculation service based on percentage rules."""
 
+import logging
 from typing import Protocol
 import structlog
 from ..value_objects.title import Title
@@ -55,15 +56,18 @@ class TitleCalculationService:
         percent_value = int(percentage)
         current_letter_count = current_title.letter_count()
         full_title_letters = full_title.letter_count()
+        # Checked once; the debug records below stringify titles and count letters
+        debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
         
-        logger.debug(
-            "Calculating displayed title",
-            percent_value=percent_value,
-            current_title=str(current_title),
-            current_letter_count=current_letter_count,
-            full_title=str(full_title),
-            full_title_letters=full_title_letters
-        )
+        if debug_enabled:
+            logger.debug(
+                "Calculating displayed title",
+                percent_value=percent_value,
+                current_title=str(current_title),
+                current_letter_count=current_letter_count,
+                full_title=str(full_title),
+                full_title_letters=full_title_letters
+            )
         
         # If full_title is empty, preserve current title (can't calculate from empty full_title)
         if not full_title.value or full_title_letters == 0:
@@ -82,13 +86,14 @@ class TitleCalculationService:
             # Can be 0 (empty) if current was empty or negative
             target_count = max(0, target_count)
             result_title = full_title.substring_by_letter_count(target_count)
-            logger.debug(
-                "Percentage 0%: Adding 3 letters",
-                current_letter_count=current_letter_count,
-                target_count=target_count,
-                result_title=str(result_title),
-                result_letter_count=result_title.letter_count()
-            )
+            if debug_enabled:
+                logger.debug(
+                    "Percentage 0%: Adding 3 letters",
+                    current_letter_count=current_letter_count,
+                    target_count=target_count,
+                    result_title=str(result_title),
+                    result_letter_count=result_title.letter_count()
+                )
             return result_title
         elif 1 <= percent_value <= 5:
             # Add 1 letter to current title
@@ -98,14 +103,15 @@ class TitleCalculationService:
             # Can be 0 (empty) if current was -1
             target_count = max(0, target_count)
             result_title = full_title.substring_by_letter_count(target_count)
-            logger.debug(
-                "Percentage 1-5%: Adding 1 letter",
-                percent_value=percent_value,
-                current_letter_count=current_letter_count,
-                target_count=target_count,
-                result_title=str(result_title),
-                result_letter_count=result_title.letter_count()
-            )
+            if debug_enabled:
+                logger.debug(
+                    "Percentage 1-5%: Adding 1 letter",
+                    percent_value=percent_value,
+                    current_letter_count=current_letter_count,
+                    target_count=target_count,
+                    result_title=str(result_title),
+                    result_letter_count=result_title.letter_count()
+                )
             return result_title
         elif 95 <= percent_value <= 99:
             # Remove 1 letter from current title (can become empty)
@@ -113,14 +119,15 @@ class TitleCalculationService:
             # Can be negative, but we'll treat negative as 0 (empty)
             target_count = max(0, target_count)
             result_title = full_title.substring_by_letter_count(target_count)
-            logger.debug(
-                "Percentage 95-99%: Removing 1 letter",
-                percent_value=percent_value,
-                current_letter_count=current_letter_count,
-                target_count=target_count,
-                result_title=str(result_title),
-                result_letter_count=result_title.letter_count()
-            )
+            if debug_enabled:
+                logger.debug(
+                    "Percentage 95-99%: Removing 1 letter",
+                    percent_value=percent_value,
+                    current_letter_count=current_letter_count,
+                    target_count=target_count,
+                    result_title=str(result_title),
+                    result_letter_count=result_title.letter_count()
+                )
             return result_title
         elif percent_value == 100:
             # Remove N letters (active_user_count) from current title
@@ -129,14 +136,15 @@ class TitleCalculationService:
             # If negative, make it empty (0)
             target_count = max(0, target_count)
             result_title = full_title.substring_by_letter_count(target_count)
-            logger.debug(
-                "Percentage 100%: Removing N letters",
-                current_letter_count=current_letter_count,
-                active_user_count=active_user_count,
-                target_count=target_count,
-                result_title=str(result_title),
-                result_letter_count=result_title.letter_count()
-            )
+            if debug_enabled:
+                logger.debug(
+                    "Percentage 100%: Removing N letters",
+                    current_letter_count=current_letter_count,
+                    active_user_count=active_user_count,
+                    target_count=target_count,
+                    result_title=str(result_title),
+                    result_letter_count=result_title.letter_count()
+                )
             return result_title
         else:
             # No change for other percentages - return current title
@@ -152,12 +160,13 @@ class TitleCalculationService:
                     result_title=str(result_title)
                 )
                 return result_title
-            logger.debug(
-                "Percentage outside rules: No change",
-                percent_value=percent_value,
-                current_title=str(current_title),
-                current_letter_count=current_letter_count
-            )
+            if debug_enabled:
+                logger.debug(
+                    "Percentage outside rules: No change",
+                    percent_value=percent_value,
+                    current_title=str(current_title),
+                    current_letter_count=current_letter_count
+                )
             return current_title
 
     async def calculate_new_title(
@@ -0,0 +1,142 @@
+"""In-process TTL + LRU cache with in-flight request coalescing."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Awaitable, Callable, Coroutine, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# Sentinel returned by TTLCache.get() on a miss, so cached None values stay distinguishable
+MISSING: Any = object()
+
+
+class SingleFlight(Generic[K, V]):
+    """
+    Coalesce concurrent calls for the same key into a single in-flight call.
+
+    While a loader for a key is running, further callers await the same task
+    instead of issuing their own request (cache stampede protection).
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: Dict[K, "asyncio.Task[V]"] = {}
+
+    async def run(self, key: K, loader: Callable[[], Coroutine[Any, Any, V]]) -> V:
+        """
+        Run loader for key, or join the call already in flight for it.
+
+        Args:
+            key: Coalescing key
+            loader: Zero-argument coroutine factory producing the value
+
+        Returns:
+            Value produced by the (shared) loader call
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            # Own task, so cancelling any caller (the first one included) leaves the
+            # shared call running for the others
+            task = asyncio.create_task(loader())
+            self._in_flight[key] = task
+            task.add_done_callback(partial(self._forget, key))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: K, task: "asyncio.Task[V]") -> None:
+        """Drop a finished call so the next run() for key loads again."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Mark retrieved so a failure whose callers were all cancelled is not
+            # reported as unhandled
+            task.exception()
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Bounded in-process cache with per-entry expiry.
+
+    Entries expire after ttl seconds (time.monotonic based) and the least recently
+    used entry is evicted once maxsize is reached. Not thread-safe; intended for use
+    from the single asyncio event loop the bot runs on.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            ttl: Default time-to-live in seconds
+            maxsize: Maximum number of entries kept
+        """
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._data: "OrderedDict[K, Tuple[V, float]]" = OrderedDict()
+        self._single_flight: SingleFlight[K, V] = SingleFlight()
+        # Bumped on every external write so a load that raced with a write does not store stale data
+        self._version = 0
+
+    def get(self, key: K, default: Any = MISSING) -> Any:
+        """Get cached value, or default if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        """Store value, optionally overriding the default TTL for this entry."""
+        self._version += 1
+        self._store(key, value, ttl)
+
+    def _store(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + (self._ttl if ttl is None else ttl)
+        self._data[key] = (value, expires_at)
+        self._data.move_to_end(key)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        """Drop a single entry (no-op if absent)."""
+        self._version += 1
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._version += 1
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    async def get_or_load(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        """
+        Return cached value for key, loading and caching it on a miss.
+
+        Concurrent misses for the same key share a single loader call.
+
+        Args:
+            key: Cache key
+            loader: Zero-argument coroutine factory producing the value
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        value = self.get(key)
+        if value is not MISSING:
+            return value
+
+        async def _load_and_store() -> V:
+            version = self._version
+            loaded = await loader()
+            if self._version == version:
+                self._store(key, loaded)
+            return loaded
+
+        return await self._single_flight.run(key, _load_and_store)
@@ -17,11 +17,23 @@ class Settings:
         int(os.getenv("ADMIN_USER_ID", 0)) if os.getenv("ADMIN_USER_ID") else None
     )
     ADMIN_USERNAME: Optional[str] = os.getenv("ADMIN_USERNAME")
+    # Bot API HTTP pool: connections for outgoing requests, and seconds a request
+    # may wait for a free connection during bursts (PTB's own default is 1s)
+    TELEGRAM_CONNECTION_POOL_SIZE: int = int(os.getenv("TELEGRAM_CONNECTION_POOL_SIZE", "256"))
+    TELEGRAM_POOL_TIMEOUT: float = float(os.getenv("TELEGRAM_POOL_TIMEOUT", "20"))
+    # Updates processed at the same time (PTB's default is one at a time)
+    TELEGRAM_CONCURRENT_UPDATES: int = int(os.getenv("TELEGRAM_CONCURRENT_UPDATES", "64"))
+
+    # Register unknown users from @HowGayBot messages instead of ignoring them
+    AUTO_REGISTER_USERS: bool = os.getenv("AUTO_REGISTER_USERS", "false").lower() in ("1", "true", "yes")
 
     # Supabase configuration
     SUPABASE_URL: str = os.getenv("SUPABASE_URL", "")
     SUPABASE_KEY: str = os.getenv("SUPABASE_KEY", "")
 
+    # In-process cache for bot_settings reads (seconds)
+    SETTINGS_CACHE_TTL: float = float(os.getenv("SETTINGS_CACHE_TTL", "60"))
+
     # Google Sheets migration (optional, migration only)
     GOOGLE_SHEET_ID: Optional[str] = os.getenv("GOOGLE_SHEET_ID")
     GOOGLE_CREDENTIALS: Optional[str] = os.getenv("GOOGLE_CREDENTIALS")
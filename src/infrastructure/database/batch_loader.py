@@ -0,0 +1,92 @@
+"""DataLoader-style request coalescing for repository lookups."""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, List, Optional, Set, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class BatchLoader(Generic[K, V]):
+    """
+    Coalesce concurrent single-key lookups into batched queries.
+
+    Keys requested while a batch is being collected are deduplicated and handed
+    to batch_load_fn together (e.g. one ``WHERE id IN (...)`` query instead of
+    one query per key). Nothing is cached once the batch resolves.
+    """
+
+    def __init__(
+        self,
+        batch_load_fn: Callable[[List[K]], Awaitable[Dict[K, V]]],
+        max_batch_size: int = 100,
+        window: float = 0.0,
+    ) -> None:
+        """
+        Initialize batch loader.
+
+        Args:
+            batch_load_fn: Coroutine taking a list of keys and returning a dict
+                of found values (missing keys resolve to None)
+            max_batch_size: Maximum number of keys passed to one batch_load_fn call
+            window: Seconds to wait for more keys before dispatching
+                (0 = dispatch on the next event loop iteration)
+        """
+        self._batch_load_fn = batch_load_fn
+        self._max_batch_size = max_batch_size
+        self._window = window
+        self._pending: Dict[K, "asyncio.Future[Optional[V]]"] = {}
+        self._scheduled = False
+        # Strong references to running batch queries so they are not garbage collected
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def load(self, key: K) -> Optional[V]:
+        """Load a single value, sharing the query with concurrent callers."""
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = future
+            if len(self._pending) >= self._max_batch_size:
+                self._dispatch()
+            elif not self._scheduled:
+                self._scheduled = True
+                if self._window > 0:
+                    loop.call_later(self._window, self._dispatch)
+                else:
+                    loop.call_soon(self._dispatch)
+        # Shield so one cancelled caller does not cancel the lookup for the others
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        """Hand the collected keys to batch_load_fn."""
+        self._scheduled = False
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, {}
+        keys = list(batch)
+        for start in range(0, len(keys), self._max_batch_size):
+            chunk = {key: batch[key] for key in keys[start:start + self._max_batch_size]}
+            task = asyncio.ensure_future(self._resolve(chunk))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, batch: Dict[K, "asyncio.Future[Optional[V]]"]) -> None:
+        """Run one batch query and settle its futures."""
+        try:
+            results = await self._batch_load_fn(list(batch))
+        except asyncio.CancelledError:
+            # e.g. at shutdown; unsettled futures would leave load() callers waiting forever
+            for future in batch.values():
+                future.cancel()
+            raise
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+                    # Mark retrieved; callers that were cancelled will never await it
+                    future.exception()
+            return
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(results.get(key))
@@ -1,49 +1,69 @@
 """Supabase implementation of settings repository."""
 
-import asyncio
+import re
 from typing import Optional, Dict
 
+from src.infrastructure.cache.ttl_cache import TTLCache
+from src.infrastructure.config.settings import settings as app_settings
 from src.infrastructure.database.supabase_client import get_supabase_client
 from ....domain.repositories.settings_repository import ISettingsRepository
 
+# Cache key for the get_all() snapshot (cannot collide with a real setting key)
+_ALL_SETTINGS_KEY = ("__all__",)
+
+# ASCII control characters except tab, LF and CR
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
 
 class SupabaseSettingsRepository(ISettingsRepository):
-    """Supabase implementation of settings repository."""
+    """
+    Supabase implementation of settings repository.
+
+    Settings change rarely (admin-initiated) but are read on most interactions, so
+    reads are served from a class-level TTL cache shared by all instances. Writes
+    through this repository update the cache immediately.
+    """
+
+    _cache: TTLCache = TTLCache(ttl=app_settings.SETTINGS_CACHE_TTL, maxsize=1000)
 
     async def get(self, key: str) -> Optional[str]:
         """Get setting value by key."""
-        client = await get_supabase_client()
-        
-        def _query():
-            response = (
-                client.table("bot_settings")
-                .select("value")
-                .eq("key", key)
-                .execute()
-            )
-            return response.data[0]["value"] if response.data else None
-        
-        value = await asyncio.to_thread(_query)
-        return value
+        return await self._cache.get_or_load(key, lambda: self._fetch(key))
+
+    async def _fetch(self, key: str) -> Optional[str]:
+        """Fetch setting value from the database, bypassing the cache."""
+        client = get_supabase_client()
+        response = await (
+            client.table("bot_settings")
+            .select("value")
+            .eq("key", key)
+            .execute()
+        )
+        return response.data[0]["value"] if response.data else None
 
     async def set(
         self, key: str, value: str, description: Optional[str] = None
     ) -> None:
         """Set setting value."""
-        client = await get_supabase_client()
-        
-        def _upsert():
-            data = {"key": key, "value": value}
-            if description:
-                data["description"] = description
-            response = (
-                client.table("bot_settings")
-                .upsert(data, on_conflict="key")
-                .execute()
-            )
-            return response.data
-        
-        await asyncio.to_thread(_upsert)
+        client = get_supabase_client()
+        data = {"key": key, "value": value}
+        if description:
+            data["description"] = description
+        await (
+            client.table("bot_settings")
+            .upsert(data, on_conflict="key")
+            .execute()
+        )
+        # Write-through; the get_all() snapshot is rebuilt on next read
+        self._cache.set(key, value)
+        self._cache.invalidate(_ALL_SETTINGS_KEY)
+
+    async def preload(self) -> None:
+        """Seed the cache with every stored setting, so first reads need no query."""
+        settings_dict = await self._fetch_all()
+        for key, value in settings_dict.items():
+            self._cache.set(key, value)
+        self._cache.set(_ALL_SETTINGS_KEY, settings_dict)
 
     async def get_global_average_period(self) -> int:
         """Get global average period in days (0 = all-time)."""
@@ -65,14 +85,15 @@ class SupabaseSettingsRepository(ISettingsRepository):
 
     async def get_all(self) -> Dict[str, str]:
         """Get all settings as dictionary."""
-        client = await get_supabase_client()
-        
-        def _query():
-            response = client.table("bot_settings").select("key, value").execute()
-            return {row["key"]: row["value"] for row in response.data}
-        
-        settings_dict = await asyncio.to_thread(_query)
-        return settings_dict or {}
+        settings_dict = await self._cache.get_or_load(_ALL_SETTINGS_KEY, self._fetch_all)
+        # Copy so callers cannot mutate the cached snapshot
+        return dict(settings_dict)
+
+    async def _fetch_all(self) -> Dict[str, str]:
+        """Fetch all settings from the database, bypassing the cache."""
+        client = get_supabase_client()
+        response = await client.table("bot_settings").select("key, value").execute()
+        return {row["key"]: row["value"] for row in response.data or []}
 
     async def get_default_title(self) -> str:
         """Get default title from bot_settings (key: 'default_title'). Returns empty string if not set."""
@@ -86,8 +107,7 @@ class SupabaseSettingsRepository(ISettingsRepository):
             raise ValueError("Title too long (max 500 characters)")
         
         # Check for control characters (excluding newlines and spaces which are allowed)
-        control_chars = [chr(i) for i in range(32) if i not in [9, 10, 13]]  # Exclude tab, LF, CR
-        if any(char in title for char in control_chars):
+        if _CONTROL_CHARS_RE.search(title):
             raise ValueError("Title contains invalid characters (control characters not allowed)")
         
         await self.set(
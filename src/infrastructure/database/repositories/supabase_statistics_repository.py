@@ -1,16 +1,40 @@
 """Supabase implementation of statistics repository."""
 
-import asyncio
 from typing import List, Optional, Dict, Any
-from datetime import date, datetime
+from datetime import date, datetime, timezone
+import structlog
 
+from src.infrastructure.cache.ttl_cache import MISSING, SingleFlight, TTLCache
 from src.infrastructure.database.supabase_client import get_supabase_client
 from ....domain.repositories.statistics_repository import IStatisticsRepository
 
+logger = structlog.get_logger(__name__)
+
+# Max rows per bulk upsert request (keeps PostgREST payloads small)
+MERGE_BATCH_LIMIT = 500
+
+# Columns returned by raw snapshot reads (title is not needed by callers)
+_SNAPSHOT_COLUMNS = "user_id, snapshot_date, percentage, title_letter_count"
+
+
+def _seconds_until(expires_at: datetime) -> float:
+    """Seconds from now until expires_at (naive datetimes are taken as UTC)."""
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    return (expires_at - datetime.now(timezone.utc)).total_seconds()
+
 
 class SupabaseStatisticsRepository(IStatisticsRepository):
     """Supabase implementation of statistics repository."""
 
+    def __init__(self) -> None:
+        # Process-local mirror of statistics_cache: (calculation_type, period_days) -> value,
+        # expiring together with the DB row. Only misses (e.g. after restart) hit the table.
+        self._local_cache: TTLCache = TTLCache(ttl=0, maxsize=64)
+        # Concurrent aggregations for the same period (e.g. right after the cache
+        # expires) share a single database call
+        self._aggregations: SingleFlight = SingleFlight()
+
     async def create_daily_snapshot(
         self,
         user_id: int,
@@ -20,27 +44,60 @@ class SupabaseStatisticsRepository(IStatisticsRepository):
         title_letter_count: int,
     ) -> None:
         """Create daily snapshot for user (idempotent)."""
-        client = await get_supabase_client()
-        
-        def _insert():
-            # Use upsert to handle idempotency (UNIQUE constraint on user_id, snapshot_date)
-            response = (
-                client.table("daily_snapshots")
-                .upsert(
-                    {
-                        "user_id": user_id,
-                        "snapshot_date": snapshot_date.isoformat(),
-                        "percentage": percentage,
-                        "title": title,
-                        "title_letter_count": title_letter_count,
-                    },
-                    on_conflict="user_id,snapshot_date",
-                )
-                .execute()
+        client = get_supabase_client()
+        # Use upsert to handle idempotency (UNIQUE constraint on user_id, snapshot_date)
+        await (
+            client.table("daily_snapshots")
+            .upsert(
+                {
+                    "user_id": user_id,
+                    "snapshot_date": snapshot_date.isoformat(),
+                    "percentage": percentage,
+                    "title": title,
+                    "title_letter_count": title_letter_count,
+                },
+                on_conflict="user_id,snapshot_date",
             )
-            return response.data
-        
-        await asyncio.to_thread(_insert)
+            .execute()
+        )
+
+    async def create_daily_snapshots_bulk(
+        self, rows: List[Dict[str, Any]]
+    ) -> int:
+        """Create daily snapshots for many users in ceil(N / MERGE_BATCH_LIMIT) requests."""
+        if not rows:
+            return 0
+        client = get_supabase_client()
+        payload = [
+            {
+                "user_id": row["user_id"],
+                "snapshot_date": row["snapshot_date"].isoformat(),
+                "percentage": row["percentage"],
+                "title": row["title"],
+                "title_letter_count": row["title_letter_count"],
+            }
+            for row in rows
+        ]
+        written = 0
+        for start in range(0, len(payload), MERGE_BATCH_LIMIT):
+            batch = payload[start:start + MERGE_BATCH_LIMIT]
+            try:
+                await (
+                    client.table("daily_snapshots")
+                    .upsert(batch, on_conflict="user_id,snapshot_date")
+                    .execute()
+                )
+            except Exception as e:
+                logger.error(
+                    "Error upserting snapshot batch",
+                    batch_start=start,
+                    batch_size=len(batch),
+                    error=str(e),
+                    exc_info=True
+                )
+                continue
+            written += len(batch)
+        return written
 
     async def get_snapshots_by_period(
         self,
@@ -49,59 +106,58 @@ class SupabaseStatisticsRepository(IStatisticsRepository):
         user_id: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """Get snapshots for period (optionally filtered by user)."""
-        client = await get_supabase_client()
-        
-        def _query():
-            query = (
-                client.table("daily_snapshots")
-                .select("*")
-                .gte("snapshot_date", start_date.isoformat())
-                .lte("snapshot_date", end_date.isoformat())
-            )
-            
-            if user_id:
-                query = query.eq("user_id", user_id)
-            
-            query = query.order("snapshot_date", desc=True)
-            response = query.execute()
-            return response.data
-        
-        data = await asyncio.to_thread(_query)
-        return data or []
+        client = get_supabase_client()
+        query = (
+            client.table("daily_snapshots")
+            .select(_SNAPSHOT_COLUMNS)
+            .gte("snapshot_date", start_date.isoformat())
+            .lte("snapshot_date", end_date.isoformat())
+        )
+
+        if user_id:
+            query = query.eq("user_id", user_id)
+
+        query = query.order("snapshot_date", desc=True)
+        response = await query.execute()
+        return response.data or []
+
+    async def get_period_aggregates(
+        self,
+        start_date: date,
+        end_date: date,
+        user_id: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get per-user snapshot aggregates for period (see migrations/007_period_aggregates_function.sql)."""
+        client = get_supabase_client()
+        response = await client.rpc(
+            "period_aggregates",
+            {
+                "p_start_date": start_date.isoformat(),
+                "p_end_date": end_date.isoformat(),
+                "p_user_id": user_id,
+            },
+        ).execute()
+        return response.data or []
 
     async def get_global_average(
         self, period_days: int = 0
     ) -> Optional[float]:
         """Get global average percentage for period (0 = all-time)."""
-        client = await get_supabase_client()
-        
-        def _calculate():
-            query = client.table("daily_snapshots").select("percentage")
-            
-            if period_days > 0:
-                # Calculate start date
-                from datetime import timedelta
-                end_date = date.today()
-                start_date = end_date - timedelta(days=period_days)
-                query = (
-                    query.gte("snapshot_date", start_date.isoformat())
-                    .lte("snapshot_date", end_date.isoformat())
-                )
-            
-            # Filter out NULL percentages
-            query = query.not_.is_("percentage", "null")
-            response = query.execute()
-            
-            if not response.data:
-                return None
-            
-            percentages = [row["percentage"] for row in response.data if row.get("percentage") is not None]
-            if not percentages:
-                return None
-            
-            return sum(percentages) / len(percentages)
-        
-        return await asyncio.to_thread(_calculate)
+        return await self._aggregations.run(
+            ("global_average", period_days),
+            lambda: self._fetch_global_average(period_days),
+        )
+
+    async def _fetch_global_average(self, period_days: int) -> Optional[float]:
+        """Run the global average aggregation in the database."""
+        client = get_supabase_client()
+        # Aggregated in Postgres (see migrations/006_global_average_function.sql)
+        response = await client.rpc(
+            "global_average", {"period_days": period_days}
+        ).execute()
+        if response.data is None:
+            return None
+        return float(response.data)
 
     async def cache_statistics(
         self,
@@ -111,52 +167,53 @@ class SupabaseStatisticsRepository(IStatisticsRepository):
         expires_at: datetime,
     ) -> None:
         """Cache statistics calculation."""
-        client = await get_supabase_client()
-        
-        def _upsert():
-            response = (
-                client.table("statistics_cache")
-                .upsert(
-                    {
-                        "calculation_type": calculation_type,
-                        "period_days": period_days,
-                        "calculated_value": float(value),
-                        "expires_at": expires_at.isoformat(),
-                    },
-                    on_conflict="calculation_type,period_days",
-                )
-                .execute()
+        self._local_cache.set(
+            (calculation_type, period_days), float(value), ttl=_seconds_until(expires_at)
+        )
+        client = get_supabase_client()
+        await (
+            client.table("statistics_cache")
+            .upsert(
+                {
+                    "calculation_type": calculation_type,
+                    "period_days": period_days,
+                    "calculated_value": float(value),
+                    "expires_at": expires_at.isoformat(),
+                },
+                on_conflict="calculation_type,period_days",
             )
-            return response.data
-        
-        await asyncio.to_thread(_upsert)
+            .execute()
+        )
 
     async def get_cached_statistics(
         self, calculation_type: str, period_days: int
     ) -> Optional[float]:
         """Get cached statistics if valid."""
-        client = await get_supabase_client()
-        
-        def _query():
-            response = (
-                client.table("statistics_cache")
-                .select("*")
-                .eq("calculation_type", calculation_type)
-                .eq("period_days", period_days)
-                .execute()
-            )
-            return response.data[0] if response.data else None
-        
-        cache_entry = await asyncio.to_thread(_query)
+        cache_key = (calculation_type, period_days)
+        cached_value = self._local_cache.get(cache_key)
+        if cached_value is not MISSING:
+            return cached_value
+
+        client = get_supabase_client()
+        response = await (
+            client.table("statistics_cache")
+            .select("calculated_value, expires_at")
+            .eq("calculation_type", calculation_type)
+            .eq("period_days", period_days)
+            .execute()
+        )
+        cache_entry = response.data[0] if response.data else None
         if not cache_entry:
             return None
-        
+
         # Check if cache is expired
-        expires_at = datetime.fromisoformat(cache_entry["expires_at"])
-        if datetime.now() >= expires_at:
+        ttl = _seconds_until(datetime.fromisoformat(cache_entry["expires_at"]))
+        if ttl <= 0:
             return None
-        
-        return float(cache_entry["calculated_value"])
+
+        value = float(cache_entry["calculated_value"])
+        self._local_cache.set(cache_key, value, ttl=ttl)
+        return value
 
     async def is_cache_valid(
         self, calculation_type: str, period_days: int
@@ -169,16 +226,16 @@ class SupabaseStatisticsRepository(IStatisticsRepository):
         self, calculation_type: str, period_days: Optional[int] = None
     ) -> None:
         """Invalidate cache entries (delete expired or specific entries)."""
-        client = await get_supabase_client()
-        
-        def _delete():
-            query = client.table("statistics_cache").delete()
-            query = query.eq("calculation_type", calculation_type)
-            
-            if period_days is not None:
-                query = query.eq("period_days", period_days)
-            
-            response = query.execute()
-            return response.data
-        
-        await asyncio.to_thread(_delete)
+        if period_days is None:
+            # Few entries; dropping the whole local mirror is simplest
+            self._local_cache.clear()
+        else:
+            self._local_cache.invalidate((calculation_type, period_days))
+        client = get_supabase_client()
+        query = client.table("statistics_cache").delete()
+        query = query.eq("calculation_type", calculation_type)
+
+        if period_days is not None:
+            query = query.eq("period_days", period_days)
+
+        await query.execute()
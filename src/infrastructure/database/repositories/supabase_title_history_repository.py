@@ -1,11 +1,16 @@
 """Supabase implementation of title history repository."""
 
-import asyncio
 from typing import List, Optional, Dict, Any
 
 from src.infrastructure.database.supabase_client import get_supabase_client
 from ....domain.repositories.title_history_repository import ITitleHistoryRepository
 
+# Columns returned by history reads (user_id is implied by get_by_user's filter)
+_HISTORY_COLUMNS = "old_title, new_title, percentage, change_type, created_at"
+
+# Max rows per bulk insert request in save_many
+SAVE_BATCH_LIMIT = 500
+
 
 class SupabaseTitleHistoryRepository(ITitleHistoryRepository):
     """Supabase implementation of title history repository."""
@@ -19,62 +24,59 @@ class SupabaseTitleHistoryRepository(ITitleHistoryRepository):
         change_type: str,
     ) -> None:
         """Save title history entry."""
-        client = await get_supabase_client()
-        
-        def _insert():
-            response = (
+        client = get_supabase_client()
+        await (
+            client.table("title_history")
+            .insert(
+                {
+                    "user_id": user_id,
+                    "old_title": old_title,
+                    "new_title": new_title,
+                    "percentage": percentage,
+                    "change_type": change_type,
+                }
+            )
+            .execute()
+        )
+
+    async def save_many(self, entries: List[Dict[str, Any]]) -> None:
+        """Save many title history entries in ceil(N / SAVE_BATCH_LIMIT) insert requests."""
+        if not entries:
+            return
+        client = get_supabase_client()
+        for start in range(0, len(entries), SAVE_BATCH_LIMIT):
+            await (
                 client.table("title_history")
-                .insert(
-                    {
-                        "user_id": user_id,
-                        "old_title": old_title,
-                        "new_title": new_title,
-                        "percentage": percentage,
-                        "change_type": change_type,
-                    }
-                )
+                .insert(entries[start:start + SAVE_BATCH_LIMIT])
                 .execute()
             )
-            return response.data
-        
-        await asyncio.to_thread(_insert)
 
     async def get_by_user(
         self, user_id: int, limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """Get title history for user (most recent first)."""
-        client = await get_supabase_client()
-        
-        def _query():
-            query = (
-                client.table("title_history")
-                .select("*")
-                .eq("user_id", user_id)
-                .order("created_at", desc=True)
-            )
-            if limit:
-                query = query.limit(limit)
-            response = query.execute()
-            return response.data
-        
-        data = await asyncio.to_thread(_query)
-        return data or []
+        client = get_supabase_client()
+        query = (
+            client.table("title_history")
+            .select(_HISTORY_COLUMNS)
+            .eq("user_id", user_id)
+            .order("created_at", desc=True)
+        )
+        if limit:
+            query = query.limit(limit)
+        response = await query.execute()
+        return response.data or []
 
     async def get_recent(
         self, limit: int = 10
     ) -> List[Dict[str, Any]]:
         """Get recent title changes across all users."""
-        client = await get_supabase_client()
-        
-        def _query():
-            response = (
-                client.table("title_history")
-                .select("*")
-                .order("created_at", desc=True)
-                .limit(limit)
-                .execute()
-            )
-            return response.data
-        
-        data = await asyncio.to_thread(_query)
-        return data or []
+        client = get_supabase_client()
+        response = await (
+            client.table("title_history")
+            .select(f"user_id, {_HISTORY_COLUMNS}")
+            .order("created_at", desc=True)
+            .limit(limit)
+            .execute()
+        )
+        return response.data or []
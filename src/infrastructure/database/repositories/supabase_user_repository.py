@@ -1,11 +1,12 @@
 """Supabase implementation of user repository."""
 
-import asyncio
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from datetime import date, datetime
 
+from src.infrastructure.cache.ttl_cache import MISSING, TTLCache
+from src.infrastructure.database.batch_loader import BatchLoader
 from src.infrastructure.database.supabase_client import get_supabase_client
-from ....domain.entities.user import User
+from ....domain.entities.user import User, UserCore
 from ....domain.repositories.user_repository import IUserRepository
 from ....domain.value_objects.title import Title
 from ....domain.value_objects.percentage import Percentage
@@ -13,77 +14,305 @@ from ....domain.value_objects.timezone import Timezone
 from ....domain.exceptions import UserNotFoundError
 
 
+# Active user count only changes on registration/deletion; cache it briefly
+_ACTIVE_USERS_CACHE_TTL = 30.0
+_ACTIVE_USERS_KEY = "active_users"
+
+# Telegram IDs with no users row are remembered briefly, so an unregistered
+# user sending many messages does not cost one query per message
+_MISSING_USER_CACHE_TTL = 10.0
+
+# Language codes are read on nearly every update but change only through saves
+# (which invalidate them); bound the cache by entries rather than by user count
+_LANGUAGE_CACHE_TTL = 300.0
+_LANGUAGE_CACHE_MAXSIZE = 10000
+
+# Max rows per bulk upsert request in save_many
+SAVE_BATCH_LIMIT = 500
+
+# Timezone value objects are immutable and validated via pytz on construction;
+# rows share a handful of distinct strings, so reuse one instance per string
+_TZ_CACHE: Dict[str, Timezone] = {}
+
+
+def _timezone_from_string(value: str) -> Timezone:
+    """Memoized Timezone.from_string."""
+    timezone = _TZ_CACHE.get(value)
+    if timezone is None:
+        timezone = Timezone.from_string(value)
+        if len(_TZ_CACHE) < 1024:
+            _TZ_CACHE[value] = timezone
+    return timezone
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO timestamp column, keeping NULL/empty as None."""
+    return datetime.fromisoformat(value) if value else None
+
+
+# Every query below uses one of these fixed column lists, so each method always
+# produces the same PostgREST request shape and SQL text, which PostgREST can
+# serve from its per-connection prepared statement cache.
+# Columns read by _to_user
+_USER_COLUMNS = (
+    "id, telegram_user_id, telegram_username, display_name, full_title, title, "
+    "title_letter_count, title_locked, timezone, language, last_percentage, "
+    "last_processed_date, migration_batch_id, migration_timestamp, created_at, updated_at"
+)
+# Columns backing UserCore (see get_core_by_telegram_id)
+_USER_CORE_COLUMNS = "id, telegram_user_id, title, title_letter_count, timezone, language"
+
+
 class SupabaseUserRepository(IUserRepository):
     """Supabase implementation of user repository."""
 
+    def __init__(self) -> None:
+        self._count_cache: TTLCache = TTLCache(ttl=_ACTIVE_USERS_CACHE_TTL, maxsize=1)
+        # Concurrent lookups by Telegram ID share one IN (...) query. The loader
+        # yields raw rows so every caller gets its own (mutable) User entity.
+        self._telegram_id_loader: BatchLoader[int, dict] = BatchLoader(
+            self._load_rows_by_telegram_ids, max_batch_size=100
+        )
+        self._username_loader: BatchLoader[str, dict] = BatchLoader(
+            self._load_rows_by_usernames, max_batch_size=100
+        )
+        # Negative cache: telegram_user_id -> None for IDs known to have no row
+        self._missing_users: TTLCache = TTLCache(ttl=_MISSING_USER_CACHE_TTL, maxsize=1024)
+        # Bumped after every save so a lookup that raced with it does not cache a stale miss
+        self._write_generation = 0
+        # telegram_user_id -> language code (including the "en" default for unregistered IDs)
+        self._languages: TTLCache = TTLCache(ttl=_LANGUAGE_CACHE_TTL, maxsize=_LANGUAGE_CACHE_MAXSIZE)
+
     async def get_by_telegram_id(self, telegram_user_id: int) -> Optional[User]:
         """Get user by Telegram user ID."""
-        client = await get_supabase_client()
-        
-        def _query():
-            response = (
-                client.table("users")
-                .select("*")
-                .eq("telegram_user_id", telegram_user_id)
-                .execute()
-            )
-            return response.data[0] if response.data else None
-        
-        data = await asyncio.to_thread(_query)
+        if self._missing_users.get(telegram_user_id) is not MISSING:
+            return None
+        generation = self._write_generation
+        data = await self._telegram_id_loader.load(telegram_user_id)
         if not data:
+            if generation == self._write_generation:
+                self._missing_users.set(telegram_user_id, None)
             return None
         return self._to_user(data)
 
+    def _forget_missing(self, telegram_user_id: int) -> None:
+        """Drop cached lookups for a Telegram ID once its row may have been written."""
+        self._write_generation += 1
+        self._missing_users.invalidate(telegram_user_id)
+        self._languages.invalidate(telegram_user_id)
+
+    async def _load_rows_by_telegram_ids(self, telegram_user_ids: List[int]) -> Dict[int, dict]:
+        """Batch function for the Telegram ID loader: fetch many users in one query."""
+        client = get_supabase_client()
+        # Always IN (...), even for one id, so single and batched lookups share one query shape
+        response = await (
+            client.table("users")
+            .select(_USER_COLUMNS)
+            .in_("telegram_user_id", telegram_user_ids)
+            .execute()
+        )
+        return {data["telegram_user_id"]: data for data in response.data or []}
+
+    async def get_core_by_telegram_id(self, telegram_user_id: int) -> Optional[UserCore]:
+        """Get core user fields by Telegram user ID (projected query, no full row)."""
+        client = get_supabase_client()
+        response = await (
+            client.table("users")
+            .select(_USER_CORE_COLUMNS)
+            .eq("telegram_user_id", telegram_user_id)
+            .execute()
+        )
+        if not response.data:
+            return None
+        return self._to_user_core(response.data[0])
+
+    async def get_language_by_telegram_id(self, telegram_user_id: int) -> str:
+        """Get a user's language code ('en' if not registered), cached until the user is saved."""
+        return await self._languages.get_or_load(
+            telegram_user_id, lambda: self._fetch_language(telegram_user_id)
+        )
+
+    def get_cached_language(self, telegram_user_id: int) -> Optional[str]:
+        """Get a user's language code from the language cache only (None on a miss)."""
+        language = self._languages.get(telegram_user_id)
+        return None if language is MISSING else language
+
+    async def _fetch_language(self, telegram_user_id: int) -> str:
+        """Load a user's language code, selecting only that column."""
+        client = get_supabase_client()
+        response = await (
+            client.table("users")
+            .select("language")
+            .eq("telegram_user_id", telegram_user_id)
+            .limit(1)
+            .execute()
+        )
+        if not response.data:
+            return "en"
+        return response.data[0].get("language") or "en"
+
     async def get_by_username(self, username: str) -> Optional[User]:
-        """Get user by Telegram username."""
-        client = await get_supabase_client()
-        
-        def _query():
-            response = (
-                client.table("users")
-                .select("*")
-                .eq("telegram_username", username)
-                .execute()
-            )
-            return response.data[0] if response.data else None
-        
-        data = await asyncio.to_thread(_query)
+        """Get user by Telegram username (concurrent lookups share one query)."""
+        data = await self._username_loader.load(username)
         if not data:
             return None
         return self._to_user(data)
 
+    async def get_by_usernames(self, usernames: List[str]) -> Dict[str, User]:
+        """Get users by Telegram username in one query (usernames without a row are omitted)."""
+        if not usernames:
+            return {}
+        rows = await self._load_rows_by_usernames(list(dict.fromkeys(usernames)))
+        return {username: self._to_user(data) for username, data in rows.items()}
+
+    async def _load_rows_by_usernames(self, usernames: List[str]) -> Dict[str, dict]:
+        """Batch function for the username loader: fetch many users in one query."""
+        client = get_supabase_client()
+        response = await (
+            client.table("users")
+            .select(_USER_COLUMNS)
+            .in_("telegram_username", usernames)
+            .execute()
+        )
+        rows: Dict[str, dict] = {}
+        for data in response.data or []:
+            # Usernames are not unique in the table; keep the first row, as .eq()[0] did
+            rows.setdefault(data["telegram_username"], data)
+        return rows
+
     async def save(self, user: User) -> User:
         """Save or update user."""
-        client = await get_supabase_client()
+        client = get_supabase_client()
         user_dict = self._to_dict(user)
-        
-        def _upsert():
-            # Use upsert to handle both insert and update
-            response = (
+        # Use upsert to handle both insert and update
+        response = await (
+            client.table("users")
+            .upsert(user_dict, on_conflict="telegram_user_id")
+            .execute()
+        )
+        data = response.data[0] if response.data else user_dict
+        self._forget_missing(user.telegram_user_id)
+        if user.id is None:
+            # Possibly a new row; drop the cached active user count
+            self._count_cache.clear()
+        return self._to_user(data)
+
+    async def save_many(self, users: List[User]) -> List[User]:
+        """Save or update many users in ceil(N / SAVE_BATCH_LIMIT) upsert requests."""
+        if not users:
+            return []
+        client = get_supabase_client()
+        to_dict = self._to_dict
+        payload = [to_dict(user) for user in users]
+        saved: List[User] = []
+        for start in range(0, len(payload), SAVE_BATCH_LIMIT):
+            response = await (
                 client.table("users")
-                .upsert(user_dict, on_conflict="telegram_user_id")
+                .upsert(payload[start:start + SAVE_BATCH_LIMIT], on_conflict="telegram_user_id")
                 .execute()
             )
-            return response.data[0] if response.data else user_dict
-        
-        data = await asyncio.to_thread(_upsert)
-        return self._to_user(data)
+            saved.extend(self._to_users_bulk(response.data))
+        for user in users:
+            self._forget_missing(user.telegram_user_id)
+        if any(user.id is None for user in users):
+            self._count_cache.clear()
+        return saved
+
+    async def create_many(self, users: List[User]) -> int:
+        """Insert new users with one INSERT ... ON CONFLICT DO NOTHING per SAVE_BATCH_LIMIT rows."""
+        if not users:
+            return 0
+        client = get_supabase_client()
+        to_dict = self._to_dict
+        payload = [to_dict(user) for user in users]
+        inserted = 0
+        for start in range(0, len(payload), SAVE_BATCH_LIMIT):
+            response = await (
+                client.table("users")
+                .upsert(
+                    payload[start:start + SAVE_BATCH_LIMIT],
+                    on_conflict="telegram_user_id",
+                    ignore_duplicates=True,
+                )
+                .execute()
+            )
+            # Only inserted rows are returned
+            inserted += len(response.data)
+        for user in users:
+            self._forget_missing(user.telegram_user_id)
+        if inserted:
+            self._count_cache.clear()
+        return inserted
+
+    async def apply_title_update(self, user: User) -> Optional[User]:
+        """Persist an automatic title update; None if the row's guard conditions fail."""
+        if user.last_processed_date is None:
+            raise ValueError("last_processed_date must be set for a title update")
+        processed_date = user.last_processed_date.isoformat()
+        client = get_supabase_client()
+        # One UPDATE ... WHERE ... RETURNING: the lock and first-message-today checks
+        # are re-evaluated by Postgres, so a concurrent update for the same day
+        # matches no row instead of overwriting it
+        response = await (
+            client.table("users")
+            .update(
+                {
+                    "full_title": str(user.full_title),
+                    "title": str(user.title),
+                    "title_letter_count": user.title_letter_count,
+                    "last_percentage": (
+                        int(user.last_percentage) if user.last_percentage is not None else None
+                    ),
+                    "last_processed_date": processed_date,
+                }
+            )
+            .eq("telegram_user_id", user.telegram_user_id)
+            .eq("title_locked", False)
+            .or_(f"last_processed_date.is.null,last_processed_date.lt.{processed_date}")
+            .execute()
+        )
+        if not response.data:
+            return None
+        return self._to_user(response.data[0])
 
     async def find_all(
-        self, limit: Optional[int] = None, offset: int = 0
+        self, limit: Optional[int] = None, offset: int = 0, after_id: Optional[int] = None
     ) -> List[User]:
-        """Find all users with pagination."""
-        client = await get_supabase_client()
-        
-        def _query():
-            query = client.table("users").select("*")
+        """Find all users with pagination (keyset when after_id is given)."""
+        client = get_supabase_client()
+        query = client.table("users").select(_USER_COLUMNS)
+        if after_id is not None:
+            # Keyset: index seek on the primary key instead of scanning offset rows
+            query = query.gt("id", after_id).order("id")
             if limit:
-                query = query.limit(limit).offset(offset)
-            response = query.execute()
-            return response.data
-        
-        data_list = await asyncio.to_thread(_query)
-        return [self._to_user(data) for data in data_list]
+                query = query.limit(limit)
+        elif limit:
+            query = query.limit(limit).offset(offset)
+        response = await query.execute()
+        return self._to_users_bulk(response.data)
+
+    async def iter_all(self, page_size: int = 500) -> AsyncIterator[List[User]]:
+        """Iterate over all users in id order, one keyset page per request."""
+        after_id = 0
+        while True:
+            page = await self.find_all(limit=page_size, after_id=after_id)
+            if not page:
+                return
+            yield page
+            if len(page) < page_size:
+                return
+            after_id = page[-1].id or 0
+
+    async def find_by_last_processed_date(self, processed_date: date) -> List[User]:
+        """Find users whose last processed message falls on processed_date (indexed)."""
+        client = get_supabase_client()
+        response = await (
+            client.table("users")
+            .select(_USER_COLUMNS)
+            .eq("last_processed_date", processed_date.isoformat())
+            .execute()
+        )
+        return self._to_users_bulk(response.data)
 
     async def find_by_title_letter_count_range(
         self,
@@ -92,49 +321,73 @@ class SupabaseUserRepository(IUserRepository):
         limit: Optional[int] = None,
         offset: int = 0,
         sort_order: str = "asc",
+        cursor: Optional[Tuple[int, int]] = None,
     ) -> List[User]:
-        """Find users by title letter count range with sorting."""
-        client = await get_supabase_client()
-        
-        def _query():
-            query = client.table("users").select("*")
-            
-            if min_count is not None:
-                query = query.gte("title_letter_count", min_count)
-            if max_count is not None:
-                query = query.lte("title_letter_count", max_count)
-            
-            # Sort by title_letter_count
-            order_desc = sort_order.lower() == "desc"
-            query = query.order("title_letter_count", desc=order_desc)
-            
-            if limit:
-                query = query.limit(limit).offset(offset)
-            
-            response = query.execute()
-            return response.data
-        
-        data_list = await asyncio.to_thread(_query)
-        return [self._to_user(data) for data in data_list]
+        """Find users by title letter count range with sorting (keyset when cursor is given)."""
+        client = get_supabase_client()
+        query = client.table("users").select(_USER_COLUMNS)
+
+        if min_count is not None:
+            query = query.gte("title_letter_count", min_count)
+        if max_count is not None:
+            query = query.lte("title_letter_count", max_count)
+
+        order_desc = sort_order.lower() == "desc"
+        if cursor is not None:
+            # Row-value comparison (title_letter_count, id) > / < cursor, spelled as a PostgREST or-filter
+            last_count, last_id = cursor
+            op = "lt" if order_desc else "gt"
+            query = query.or_(
+                f"title_letter_count.{op}.{last_count},"
+                f"and(title_letter_count.eq.{last_count},id.{op}.{last_id})"
+            )
+
+        # Sort by title_letter_count, id as tiebreaker so pages are stable
+        query = query.order("title_letter_count", desc=order_desc).order("id", desc=order_desc)
+
+        if limit:
+            query = query.limit(limit)
+            if cursor is None:
+                query = query.offset(offset)
+
+        response = await query.execute()
+        return self._to_users_bulk(response.data)
+
+    async def count_by_title_letter_count_range(
+        self, min_count: Optional[int] = None, max_count: Optional[int] = None
+    ) -> int:
+        """Count users in title letter count range (HEAD request, no rows transferred)."""
+        client = get_supabase_client()
+        query = client.table("users").select("id", count="exact", head=True)
+        if min_count is not None:
+            query = query.gte("title_letter_count", min_count)
+        if max_count is not None:
+            query = query.lte("title_letter_count", max_count)
+        response = await query.execute()
+        return response.count or 0
 
     async def count_active_users(self) -> int:
         """
         Count active users (all users in database).
         
         Note: Active users = all users who have used the bot at least once.
-        For 100% rule, this count is always queried fresh (never cached).
+        The count is cached for 30 seconds and dropped whenever this
+        repository inserts or deletes a user, so the 100% rule still sees
+        registrations and deletions immediately.
         """
-        client = await get_supabase_client()
-        
-        def _count():
-            # Use SELECT COUNT(*) for atomic operation
-            # Note: supabase-py doesn't have direct COUNT, so we select all and count
-            # For better performance in production, use a database function or raw SQL
-            response = client.table("users").select("id", count="exact").execute()
-            return response.count if hasattr(response, "count") else len(response.data)
-        
-        count = await asyncio.to_thread(_count)
-        return count or 0
+        return await self._count_cache.get_or_load(_ACTIVE_USERS_KEY, self._fetch_active_user_count)
+
+    async def _fetch_active_user_count(self) -> int:
+        """Count users in the database, bypassing the cache."""
+        client = get_supabase_client()
+        # HEAD request with count=exact: PostgREST returns only the Content-Range
+        # header, so no rows are transferred
+        response = await (
+            client.table("users")
+            .select("id", count="exact", head=True)
+            .execute()
+        )
+        return response.count or 0
 
     async def delete(self, telegram_user_id: int) -> bool:
         """
@@ -150,58 +403,61 @@ class SupabaseUserRepository(IUserRepository):
             Due to ON DELETE CASCADE in database schema, related records
             (snapshots, title_history) will be automatically deleted.
         """
-        client = await get_supabase_client()
-        
-        def _delete():
-            # Delete user (cascade will handle related records)
-            # Supabase returns deleted rows in response.data
-            response = (
-                client.table("users")
-                .delete()
-                .eq("telegram_user_id", telegram_user_id)
-                .execute()
-            )
-            # Check if any rows were actually deleted
-            return len(response.data) > 0 if response.data else False
-        
-        deleted = await asyncio.to_thread(_delete)
+        client = get_supabase_client()
+        # Delete user (cascade will handle related records)
+        # Supabase returns deleted rows in response.data
+        response = await (
+            client.table("users")
+            .delete()
+            .eq("telegram_user_id", telegram_user_id)
+            .execute()
+        )
+        # Check if any rows were actually deleted
+        deleted = len(response.data) > 0 if response.data else False
+        if deleted:
+            self._count_cache.clear()
+            self._languages.invalidate(telegram_user_id)
         return deleted
 
     def _to_user(self, data: dict) -> User:
         """Convert database row to User entity."""
+        get = data.get
+        last_processed_date = get("last_processed_date")
         return User(
+            id=get("id"),
+            telegram_user_id=data["telegram_user_id"],
+            telegram_username=get("telegram_username"),
+            display_name=get("display_name"),
+            full_title=Title(get("full_title") or ""),
+            title=Title(get("title", "")),
+            title_letter_count=get("title_letter_count", 0),
+            title_locked=get("title_locked", False),
+            timezone=_timezone_from_string(get("timezone", "UTC")),
+            language=get("language", "en"),
+            last_percentage=Percentage.from_optional(get("last_percentage")),
+            last_processed_date=(
+                date.fromisoformat(last_processed_date) if last_processed_date else None
+            ),
+            migration_batch_id=get("migration_batch_id"),
+            migration_timestamp=_parse_datetime(get("migration_timestamp")),
+            created_at=_parse_datetime(get("created_at")),
+            updated_at=_parse_datetime(get("updated_at")),
+        )
+
+    def _to_users_bulk(self, rows: Optional[List[dict]]) -> List[User]:
+        """Convert many database rows to User entities (listing fast path)."""
+        to_user = self._to_user
+        return [to_user(data) for data in rows or []]
+
+    def _to_user_core(self, data: dict) -> UserCore:
+        """Convert projected database row to UserCore."""
+        return UserCore(
             id=data.get("id"),
             telegram_user_id=data["telegram_user_id"],
-            telegram_username=data.get("telegram_username"),
-            display_name=data.get("display_name"),
-            full_title=Title(data.get("full_title") or ""),
             title=Title(data.get("title", "")),
             title_letter_count=data.get("title_letter_count", 0),
-            title_locked=data.get("title_locked", False),
-            timezone=Timezone.from_string(data.get("timezone", "UTC")),
+            timezone=_timezone_from_string(data.get("timezone", "UTC")),
             language=data.get("language", "en"),
-            last_percentage=Percentage.from_optional(data.get("last_percentage")),
-            last_processed_date=(
-                date.fromisoformat(data["last_processed_date"])
-                if data.get("last_processed_date")
-                else None
-            ),
-            migration_batch_id=data.get("migration_batch_id"),
-            migration_timestamp=(
-                datetime.fromisoformat(data["migration_timestamp"])
-                if data.get("migration_timestamp")
-                else None
-            ),
-            created_at=(
-                datetime.fromisoformat(data["created_at"])
-                if data.get("created_at")
-                else None
-            ),
-            updated_at=(
-                datetime.fromisoformat(data["updated_at"])
-                if data.get("updated_at")
-                else None
-            ),
         )
 
     def _to_dict(self, user: User) -> dict:
@@ -1,35 +1,59 @@
 """Supabase client configuration with connection pooling and retry logic."""
 
-import asyncio
 from typing import Optional
-from supabase import create_client, Client
+import httpx
+from supabase import acreate_client, AsyncClient, AsyncClientOptions
 
 from ..config.settings import settings
 
+# HTTP connection pool shared by all PostgREST requests. Keep-alive connections are
+# reused across queries so bursts do not pay a TCP/TLS handshake per request.
+HTTP_POOL_LIMITS = httpx.Limits(
+    max_connections=20,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+
+# Shared client, created once at startup by SupabaseClient.initialize()
+_client: Optional[AsyncClient] = None
+_http_client: Optional[httpx.AsyncClient] = None
+
 
 class SupabaseClient:
-    """Singleton Supabase client (synchronous client wrapped for async use)."""
+    """Singleton Supabase client (native async client, queries run on the event loop)."""
 
-    _client: Optional[Client] = None
-    _lock = asyncio.Lock()
+    @classmethod
+    async def initialize(cls) -> AsyncClient:
+        """Create the shared client (call once at startup, before handling updates)."""
+        global _client
+        if _client is None:
+            _client = await cls._create_client()
+        return _client
 
     @classmethod
-    async def get_client(cls) -> Client:
-        """Get or create Supabase client instance (singleton pattern)."""
-        if cls._client is None:
-            async with cls._lock:
-                if cls._client is None:
-                    # Run synchronous client creation in thread pool
-                    cls._client = await asyncio.to_thread(cls._create_client)
-        return cls._client
+    async def close(cls) -> None:
+        """Close pooled HTTP connections (call on shutdown)."""
+        global _client, _http_client
+        if _http_client is not None:
+            await _http_client.aclose()
+        _client = None
+        _http_client = None
 
     @classmethod
-    def _create_client(cls) -> Client:
-        """Create Supabase client with configuration (synchronous)."""
+    async def _create_client(cls) -> AsyncClient:
+        """Create Supabase client with a tuned keep-alive HTTP/2 connection pool."""
+        global _http_client
         try:
-            client = create_client(
+            _http_client = httpx.AsyncClient(
+                limits=HTTP_POOL_LIMITS,
+                timeout=HTTP_TIMEOUT,
+                http2=True,
+            )
+            client = await acreate_client(
                 settings.SUPABASE_URL,
                 settings.SUPABASE_KEY,
+                options=AsyncClientOptions(httpx_client=_http_client),
             )
             return client
         except Exception as e:
@@ -48,11 +72,9 @@ class SupabaseClient:
             ConnectionError: If connection fails with detailed error message
         """
         try:
-            client = await cls.get_client()
-            # Simple query to test connection (run in thread pool)
-            await asyncio.to_thread(
-                lambda: client.table("bot_settings").select("key").limit(1).execute()
-            )
+            client = await cls.initialize()
+            # Simple query to test connection
+            await client.table("bot_settings").select("key").limit(1).execute()
             return True
         except Exception as e:
             # Re-raise with more context
@@ -65,6 +87,14 @@ class SupabaseClient:
 
 
 # Convenience function for getting client
-async def get_supabase_client() -> Client:
-    """Get Supabase client instance."""
-    return await SupabaseClient.get_client()
+def get_supabase_client() -> AsyncClient:
+    """Get the shared Supabase client instance.
+
+    Raises:
+        RuntimeError: If SupabaseClient.initialize() has not run yet
+    """
+    if _client is None:
+        raise RuntimeError(
+            "Supabase client is not initialized; await SupabaseClient.initialize() at startup"
+        )
+    return _client
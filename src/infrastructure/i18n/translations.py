@@ -1,6 +1,7 @@
 """Translation dictionaries for localization."""
 
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, Tuple
 
 # Translation dictionaries
 TRANSLATIONS: Dict[str, Dict[str, str]] = {
@@ -21,6 +22,16 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
             "/set_global_average_period <days> - Set statistics period (0 = all-time)"
         ),
         "commands.welcome": "Welcome to the Title Tracker Bot!",
+        "welcome_group": (
+            "👋 Welcome! To use this bot, please run /register to register yourself.\n\n"
+            "Available commands:\n"
+            "• /register - Register yourself with the bot\n"
+            "• /me - View your stats\n"
+            "• /who @username - View another user's stats\n"
+            "• /leaderboard - View leaderboard\n"
+            "• /stats - View statistics\n"
+            "• /help - Show help message"
+        ),
         "commands.available_commands": "Available Commands",
         "commands.admin_commands": "Admin Commands",
         "commands.me": "Show my stats",
@@ -36,6 +47,7 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "errors.permission_denied": "❌ Permission denied. Admin access required.",
         "errors.title_locked": "Title is locked and cannot be updated automatically",
         "errors.invalid_percentage": "Invalid percentage value",
+        "errors.invalid_period": "Invalid number of days (0-{max}, 0 = all-time)",
         # Messages
         "messages.title_locked": "✅ Title locked for user",
         "messages.title_unlocked": "✅ Title unlocked for user. Auto-updates enabled.",
@@ -74,6 +86,16 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
             "/set_global_average_period <days> - Установить период статистики (0 = за всё время)"
         ),
         "commands.welcome": "Добро пожаловать в бота отслеживания званий!",
+        "welcome_group": (
+            "👋 Добро пожаловать! Чтобы пользоваться ботом, выполните /register для регистрации.\n\n"
+            "Доступные команды:\n"
+            "• /register - Зарегистрироваться в боте\n"
+            "• /me - Показать вашу статистику\n"
+            "• /who @username - Показать статистику другого пользователя\n"
+            "• /leaderboard - Показать таблицу лидеров\n"
+            "• /stats - Показать статистику\n"
+            "• /help - Показать справку"
+        ),
         "commands.available_commands": "Доступные команды",
         "commands.admin_commands": "Команды администратора",
         "commands.me": "Показать мою статистику",
@@ -89,6 +111,7 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "errors.permission_denied": "❌ Доступ запрещён. Требуются права администратора.",
         "errors.title_locked": "Звание заблокировано и не может быть обновлено автоматически",
         "errors.invalid_percentage": "Неверное значение процента",
+        "errors.invalid_period": "Неверное количество дней (0-{max}, 0 = за всё время)",
         # Messages
         "messages.title_locked": "✅ Звание заблокировано для пользователя",
         "messages.title_unlocked": "✅ Звание разблокировано для пользователя. Автообновление включено.",
@@ -112,11 +135,22 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
     },
 }
 
+# (language, key) -> string, built once so a lookup is a single hash probe
+_FLAT: Dict[Tuple[str, str], str] = {
+    (language, key): value
+    for language, messages in TRANSLATIONS.items()
+    for key, value in messages.items()
+}
 
+
+@lru_cache(maxsize=4096)
 def translate(key: str, language: str = "en") -> str:
     """
     Translate key to language with fallback to English.
     
+    Results are memoized per (key, language): TRANSLATIONS must not be
+    modified at runtime (call translate.cache_clear() if it ever is).
+    
     Args:
         key: Translation key (dot notation: category.key)
         language: Language code ('en' or 'ru')
@@ -124,8 +158,10 @@ def translate(key: str, language: str = "en") -> str:
     Returns:
         Translated string or key if not found
     """
-    translations = TRANSLATIONS.get(language, TRANSLATIONS["en"])
-    return translations.get(key, TRANSLATIONS["en"].get(key, key))
+    message = _FLAT.get((language, key))
+    if message is None:
+        message = _FLAT.get(("en", key), key)
+    return message
 
 
 def format_translated_message(key: str, language: str = "en", **kwargs) -> str:
@@ -10,6 +10,9 @@ from ...domain.repositories.statistics_repository import IStatisticsRepository
 
 logger = structlog.get_logger(__name__)
 
+# Max days backfilled at once by check_missed_days
+MISSED_DAYS_CONCURRENCY = 4
+
 
 class DailySnapshotJob:
     """Job for creating daily snapshots."""
@@ -35,39 +38,64 @@ class DailySnapshotJob:
         """
         logger.info("Starting daily snapshot job", snapshot_date=snapshot_date.isoformat())
 
-        # Get all users (would need to filter by last_processed_date = snapshot_date)
-        # For now, get all users and check their last_processed_date
-        all_users = await self._user_repository.find_all(limit=10000)
+        # Only users active on snapshot_date (indexed on last_processed_date)
+        users = await self._user_repository.find_by_last_processed_date(snapshot_date)
 
-        created_count = 0
-        for user in all_users:
-            if user.last_processed_date == snapshot_date:
-                # Create snapshot for this user
-                try:
-                    await self._statistics_repository.create_daily_snapshot(
-                        user_id=user.id or 0,
-                        snapshot_date=snapshot_date,
-                        percentage=int(user.last_percentage) if user.last_percentage else None,
-                        title=str(user.title),
-                        title_letter_count=user.title_letter_count,
-                    )
-                    created_count += 1
-                except Exception as e:
-                    logger.error(
-                        "Error creating snapshot for user",
-                        user_id=user.id,
-                        error=str(e),
-                        exc_info=True
-                    )
+        # Collect rows and write them with one bulk upsert per batch
+        rows = [
+            {
+                "user_id": user.id or 0,
+                "snapshot_date": snapshot_date,
+                "percentage": int(user.last_percentage) if user.last_percentage else None,
+                "title": str(user.title),
+                "title_letter_count": user.title_letter_count,
+            }
+            for user in users
+        ]
+
+        # Failed batches are logged by the repository; report how many rows they held
+        created_count = await self._statistics_repository.create_daily_snapshots_bulk(rows)
+        failed_count = len(rows) - created_count
+        if failed_count:
+            logger.error(
+                "Error creating snapshots",
+                snapshot_date=snapshot_date.isoformat(),
+                row_count=len(rows),
+                failed_count=failed_count,
+            )
 
         logger.info("Daily snapshot job complete", created_count=created_count)
         return created_count
 
     async def check_missed_days(self, days_back: int = 7) -> None:
-        """Check for missed snapshots and backfill."""
+        """Check for missed snapshots and backfill (days run concurrently)."""
         logger.info("Checking for missed snapshots", days_back=days_back)
         
         today = date.today()
-        for i in range(days_back):
-            check_date = today - timedelta(days=i)
-            await self.create_daily_snapshots(check_date)
+        # Days are independent; cap concurrency so the HTTP pool is not exhausted
+        semaphore = asyncio.Semaphore(MISSED_DAYS_CONCURRENCY)
+
+        async def backfill_day(check_date: date) -> int:
+            async with semaphore:
+                return await self.create_daily_snapshots(check_date)
+
+        check_dates = [today - timedelta(days=i) for i in range(days_back)]
+        results = await asyncio.gather(
+            *(backfill_day(check_date) for check_date in check_dates),
+            return_exceptions=True,
+        )
+
+        created_count = 0
+        for check_date, result in zip(check_dates, results):
+            if isinstance(result, BaseException):
+                logger.error(
+                    "Error backfilling snapshots",
+                    snapshot_date=check_date.isoformat(),
+                    error=str(result),
+                    exc_info=result
+                )
+            else:
+                created_count += result
+        logger.info(
+            "Missed snapshot check complete", days_back=days_back, created_count=created_count
+        )
@@ -1,8 +1,8 @@
-"""Job scheduler setup using APScheduler."""
+"""Job scheduler for background tasks (asyncio based)."""
 
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.cron import CronTrigger
-from datetime import date
+import asyncio
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional, Set
 import structlog
 
 from .daily_snapshot_job import DailySnapshotJob
@@ -10,6 +10,20 @@ from .daily_snapshot_job import DailySnapshotJob
 logger = structlog.get_logger(__name__)
 
 
+def _next_utc_midnight(now: datetime) -> datetime:
+    """First midnight UTC strictly after now."""
+    return (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+async def _sleep_until(moment: datetime) -> None:
+    """Sleep until the wall clock reaches moment (re-checked, since sleep can wake early)."""
+    while True:
+        remaining = (moment - datetime.now(timezone.utc)).total_seconds()
+        if remaining <= 0:
+            return
+        await asyncio.sleep(remaining)
+
+
 class JobScheduler:
     """Job scheduler for background tasks."""
 
@@ -18,21 +32,22 @@ class JobScheduler:
         daily_snapshot_job: DailySnapshotJob,
     ):
         """Initialize job scheduler."""
-        # AsyncIOScheduler will use the current event loop when started
-        self._scheduler = AsyncIOScheduler()
         self._daily_snapshot_job = daily_snapshot_job
-        self._setup_jobs()
-
-    def _setup_jobs(self) -> None:
-        """Setup scheduled jobs."""
-        # Daily snapshot job - run at midnight UTC
-        self._scheduler.add_job(
-            self._run_daily_snapshot,
-            CronTrigger(hour=0, minute=0, timezone="UTC"),
-            id="daily_snapshot",
-            name="Daily Snapshot Creation",
-            replace_existing=True,
-        )
+        self._task: Optional[asyncio.Task] = None
+        # Strong references to running jobs so they are not garbage collected mid-run
+        self._running_jobs: Set[asyncio.Task] = set()
+
+    async def _daily_snapshot_loop(self) -> None:
+        """Run the daily snapshot job at midnight UTC, every day."""
+        run_at = _next_utc_midnight(datetime.now(timezone.utc))
+        while True:
+            await _sleep_until(run_at)
+            # From the current time, so missed midnights (e.g. host suspend) fire once
+            run_at = _next_utc_midnight(datetime.now(timezone.utc))
+            # Run detached so a slow job never delays the next trigger
+            job = asyncio.create_task(self._run_daily_snapshot())
+            self._running_jobs.add(job)
+            job.add_done_callback(self._running_jobs.discard)
 
     async def _run_daily_snapshot(self) -> None:
         """Run daily snapshot job."""
@@ -44,11 +59,16 @@ class JobScheduler:
             logger.error("Daily snapshot job failed", error=str(e), exc_info=True)
 
     def start(self) -> None:
-        """Start the scheduler."""
-        self._scheduler.start()
+        """Start the scheduler (must be called from the running event loop)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._daily_snapshot_loop())
         logger.info("Job scheduler started")
 
     def shutdown(self) -> None:
         """Shutdown the scheduler."""
-        self._scheduler.shutdown()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        for job in self._running_jobs:
+            job.cancel()
         logger.info("Job scheduler shut down")
@@ -35,7 +35,10 @@ def configure_logging(log_level: str = "INFO") -> None:
         ),
         context_class=dict,
         logger_factory=structlog.PrintLoggerFactory(),
-        cache_logger_on_first_use=False,
+        # Module-level loggers are lazy proxies; without caching, every log call
+        # re-assembles the bound logger. configure_logging runs before any logging
+        # (at main import), so caching cannot pin a pre-configuration logger.
+        cache_logger_on_first_use=True,
     )
 
 
@@ -0,0 +1,167 @@
+"""Outgoing message queue drained by a bounded pool of worker tasks."""
+
+import asyncio
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Callable, List, Optional, Union
+
+import structlog
+from telegram import Bot, ReplyParameters
+from telegram.error import BadRequest, NetworkError, RetryAfter
+
+from ..cache.ttl_cache import MISSING, TTLCache
+from .token_bucket import AsyncTokenBucket
+
+logger = structlog.get_logger(__name__)
+
+# Telegram Bot API limits: ~30 messages/second overall, ~1 message/second per chat
+GLOBAL_SEND_RATE = 30.0
+PER_CHAT_SEND_RATE = 1.0
+
+
+@dataclass(frozen=True)
+class OutgoingMessage:
+    """A text message waiting to be sent."""
+
+    chat_id: int
+    text: str
+    reply_to_message_id: Optional[int] = None
+    # Called from the worker with the error when delivery finally fails
+    on_error: Optional[Callable[[Exception], None]] = None
+
+
+def _retry_after_seconds(retry_after: Union[int, float, timedelta]) -> float:
+    """RetryAfter.retry_after as seconds (PTB may report int or timedelta)."""
+    if isinstance(retry_after, timedelta):
+        return retry_after.total_seconds()
+    return float(retry_after)
+
+
+class SendQueue:
+    """
+    Decouple handlers from Telegram's sendMessage latency.
+
+    Handlers enqueue messages and return immediately; a fixed number of worker
+    tasks deliver them, honouring RetryAfter (HTTP 429) and retrying transient
+    network errors. Sends are paced by token buckets (global and per chat) to
+    stay under Telegram's rate limits instead of running into 429s. The queue is bounded, so a burst applies backpressure to
+    enqueuers instead of growing memory without limit.
+    """
+
+    def __init__(
+        self,
+        bot: Bot,
+        workers: int = 4,
+        maxsize: int = 1000,
+        max_retries: int = 3,
+    ) -> None:
+        """
+        Initialize send queue.
+
+        Args:
+            bot: Bot used to send messages
+            workers: Number of concurrent sender tasks
+            maxsize: Maximum number of queued messages (enqueue waits when full)
+            max_retries: Attempts per message for RetryAfter / network errors
+        """
+        self._bot = bot
+        self._worker_count = workers
+        self._max_retries = max_retries
+        self._queue: "asyncio.Queue[OutgoingMessage]" = asyncio.Queue(maxsize=maxsize)
+        self._workers: List[asyncio.Task] = []
+        self._global_bucket = AsyncTokenBucket(rate=GLOBAL_SEND_RATE, capacity=GLOBAL_SEND_RATE)
+        # An idle chat's bucket is full again after 1/PER_CHAT_SEND_RATE seconds,
+        # so dropping it after a minute without sends loses nothing
+        self._chat_buckets: TTLCache = TTLCache(ttl=60.0, maxsize=10000)
+
+    def start(self) -> None:
+        """Start worker tasks (must be called from the running event loop)."""
+        if self._workers:
+            return
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"send-queue-worker-{i}")
+            for i in range(self._worker_count)
+        ]
+        logger.info("Send queue started", workers=self._worker_count)
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        """Deliver what is queued (up to timeout seconds), then stop the workers."""
+        if not self._workers:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Send queue stopped with undelivered messages", pending=self._queue.qsize())
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        logger.info("Send queue stopped")
+
+    async def send_message(
+        self,
+        chat_id: int,
+        text: str,
+        reply_to_message_id: Optional[int] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ) -> None:
+        """Queue a text message (waits only while the queue is full)."""
+        await self._queue.put(OutgoingMessage(chat_id, text, reply_to_message_id, on_error))
+
+    async def _worker(self) -> None:
+        """Deliver queued messages until cancelled."""
+        while True:
+            message = await self._queue.get()
+            try:
+                await self._deliver(message)
+            except Exception as e:
+                logger.error(
+                    "Error sending queued message",
+                    chat_id=message.chat_id,
+                    error=str(e),
+                    exc_info=True
+                )
+                if message.on_error is not None:
+                    message.on_error(e)
+            finally:
+                self._queue.task_done()
+
+    def _chat_bucket(self, chat_id: int) -> AsyncTokenBucket:
+        """Rate limiter for one chat."""
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is MISSING:
+            bucket = AsyncTokenBucket(rate=PER_CHAT_SEND_RATE, capacity=1)
+        # Re-set on every use to restart the TTL, so only idle chats' buckets expire
+        self._chat_buckets.set(chat_id, bucket)
+        return bucket
+
+    async def _deliver(self, message: OutgoingMessage) -> None:
+        """Send one message, retrying on RetryAfter and transient network errors."""
+        reply_parameters = None
+        if message.reply_to_message_id is not None:
+            reply_parameters = ReplyParameters(
+                message_id=message.reply_to_message_id, allow_sending_without_reply=True
+            )
+        for attempt in range(1, self._max_retries + 1):
+            # Per chat first, so a message waiting on its chat does not hold a global token
+            await self._chat_bucket(message.chat_id).acquire()
+            await self._global_bucket.acquire()
+            try:
+                await self._bot.send_message(
+                    chat_id=message.chat_id,
+                    text=message.text,
+                    reply_parameters=reply_parameters,
+                )
+                return
+            except RetryAfter as e:
+                if attempt == self._max_retries:
+                    raise
+                await asyncio.sleep(_retry_after_seconds(e.retry_after))
+            except BadRequest:
+                # Subclass of NetworkError in PTB, but retrying cannot fix it
+                raise
+            except NetworkError:
+                # Transient (e.g. TimedOut); back off 1s, 2s, ...
+                if attempt == self._max_retries:
+                    raise
+                await asyncio.sleep(2 ** (attempt - 1))
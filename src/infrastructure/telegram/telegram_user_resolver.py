@@ -1,11 +1,33 @@
 """Telegram user resolver service for resolving usernames to user IDs."""
 
+import re
 from typing import Optional
 from telegram import Bot
 from telegram.error import TelegramError, BadRequest
 
+from ..cache.ttl_cache import MISSING, TTLCache
 from ...domain.exceptions import UserNotFoundError
 
+# Seconds a resolved (chat_id, username) -> user ID mapping is reused
+RESOLVED_USERNAME_TTL = 300.0
+
+# Categorizes lowercased BadRequest messages (see lastgroup below). Anchored
+# lookahead alternatives are tried in order at the start of the message, so a
+# message containing phrases from several categories maps to the first category
+# listed here, whatever their positions in the text
+_BAD_REQUEST_PATTERN = re.compile(
+    r"^(?:(?=.*(?P<user_not_found>user not found))"
+    r"|(?=.*(?P<chat_not_found>chat not found|chat_id))"
+    r"|(?=.*(?P<invalid_user>invalid user|user_id)))",
+    re.DOTALL,
+)
+
+
+def _classify_bad_request(message: str) -> Optional[str]:
+    """BadRequest category for an error message, or None if unrecognized."""
+    match = _BAD_REQUEST_PATTERN.search(message.lower())
+    return match.lastgroup if match else None
+
 
 class TelegramUserResolver:
     """Service for resolving Telegram usernames to user IDs via Bot API."""
@@ -17,10 +39,16 @@ class TelegramUserResolver:
             bot_instance: Telegram Bot instance for API calls
         """
         self._bot = bot_instance
+        # Successful lookups only; failures are retried on the next call
+        self._resolved: TTLCache = TTLCache(ttl=RESOLVED_USERNAME_TTL, maxsize=1024)
 
     async def resolve_username_to_user_id(self, username: str, chat_id: int) -> int:
         """Resolve username to Telegram user ID using Bot API.
         
+        Successful resolutions are cached per (chat_id, username) for
+        RESOLVED_USERNAME_TTL seconds, so repeated admin commands for the same
+        user skip the get_chat_member request.
+        
         Args:
             username: Telegram username (without @)
             chat_id: Chat ID where username should be resolved (required by Telegram API)
@@ -39,6 +67,17 @@ class TelegramUserResolver:
             3. The user must have started/interacted with the bot
             4. For channels, bot must have admin privileges
         """
+        # Usernames are case-insensitive in Telegram
+        cache_key = (chat_id, username.lstrip("@").strip().lower())
+        user_id = self._resolved.get(cache_key)
+        if user_id is not MISSING:
+            return user_id
+        user_id = await self._resolve_username_to_user_id(username, chat_id)
+        self._resolved.set(cache_key, user_id)
+        return user_id
+
+    async def _resolve_username_to_user_id(self, username: str, chat_id: int) -> int:
+        """Resolve username via get_chat_member (uncached)."""
         try:
             # Remove @ if present and validate
             username = username.lstrip("@").strip()
@@ -53,24 +92,9 @@ class TelegramUserResolver:
             # 1. User must be a member of the chat
             # 2. User must have started/interacted with the bot (for private chats)
             # 3. Bot must have admin rights (for channels)
-            try:
-                # First, try with username as string (some bot API versions support this)
-                chat_member = await self._bot.get_chat_member(chat_id, username)
-            except (BadRequest, ValueError, TypeError) as e:
-                # If username doesn't work, the error suggests the API might need user_id
-                # This happens when username resolution isn't supported in this context
-                error_msg = str(e).lower()
-                if "invalid user" in error_msg or "user_id" in error_msg:
-                    raise UserNotFoundError(
-                        f"Cannot resolve username @{username} in chat {chat_id}. "
-                        f"Possible reasons:\n"
-                        f"• User @{username} is not a member of this chat\n"
-                        f"• User hasn't started/interacted with the bot (required for username resolution)\n"
-                        f"• Bot doesn't have admin rights in this chat/channel\n"
-                        f"• Try adding the user to the chat first, or use the user's ID directly"
-                    )
-                # Re-raise other errors
-                raise
+            # Username as chat member id (some bot API versions support this);
+            # BadRequest is classified once below
+            chat_member = await self._bot.get_chat_member(chat_id, username)
             
             # Extract user_id from ChatMember object
             if chat_member and chat_member.user:
@@ -79,20 +103,23 @@ class TelegramUserResolver:
                 raise UserNotFoundError(f"User @{username} not found in chat {chat_id}")
                 
         except BadRequest as e:
-            error_msg = str(e).lower()
+            category = _classify_bad_request(str(e))
             # BadRequest usually means user not found or invalid chat_id
-            if "user not found" in error_msg:
+            if category == "user_not_found":
                 raise UserNotFoundError(
                     f"User @{username} not found in chat {chat_id}. "
                     f"The user must be a member of this chat and have started the bot."
                 )
-            elif "chat not found" in error_msg or "chat_id" in error_msg:
+            elif category == "chat_not_found":
                 raise UserNotFoundError(f"Chat {chat_id} not found or bot is not a member")
-            elif "invalid user" in error_msg or "user_id" in error_msg:
+            elif category == "invalid_user":
                 raise UserNotFoundError(
                     f"Cannot resolve username @{username} in chat {chat_id}. "
-                    f"The user must be a member of the chat and have started/interacted with the bot. "
-                    f"Try: 1) Add the user to the chat, 2) Ask the user to start the bot, 3) Use user ID directly if available"
+                    f"Possible reasons:\n"
+                    f"• User @{username} is not a member of this chat\n"
+                    f"• User hasn't started/interacted with the bot (required for username resolution)\n"
+                    f"• Bot doesn't have admin rights in this chat/channel\n"
+                    f"• Try adding the user to the chat first, or use the user's ID directly"
                 )
             else:
                 # Other BadRequest errors
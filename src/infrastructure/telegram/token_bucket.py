@@ -0,0 +1,36 @@
+"""Asyncio token bucket rate limiter."""
+
+import asyncio
+import time
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket allowing `rate` acquisitions per second with bursts up to `capacity`.
+
+    acquire() reserves a token immediately and sleeps until it would have been
+    available, so concurrent callers are served in call order without a lock
+    (the event loop runs the bookkeeping atomically).
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """
+        Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of stored tokens (burst size)
+        """
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+
+    async def acquire(self) -> None:
+        """Take one token, waiting until it is available."""
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self._rate)
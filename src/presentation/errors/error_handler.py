@@ -1,5 +1,7 @@
 """Global error handler for Telegram bot."""
 
+import time
+
 import structlog
 from telegram import Update
 from telegram.ext import ContextTypes
@@ -17,6 +19,31 @@ from ...infrastructure.i18n.translations import translate
 
 logger = structlog.get_logger(__name__)
 
+# Minimum seconds between error DMs to the admin (an error storm sends one message)
+ADMIN_NOTIFY_INTERVAL = 60.0
+# Telegram message text limit
+_MAX_MESSAGE_LENGTH = 4096
+
+_last_admin_notification = float("-inf")
+
+
+async def _reply_language(update: Update, context: ContextTypes.DEFAULT_TYPE) -> str:
+    """
+    Language for the error reply; English if the user or repository is unavailable.
+
+    The user repository is read from context.bot_data["user_repository"] (set in main).
+    """
+    user_repository = context.bot_data.get("user_repository") if context.bot_data is not None else None
+    user = update.effective_user if isinstance(update, Update) else None
+    if user_repository is None or user is None:
+        return "en"
+    try:
+        return await get_user_language(user_repository, user.id)
+    except Exception:
+        # The error being handled may itself be a database failure
+        logger.warning("Could not determine user language for error reply", exc_info=True)
+        return "en"
+
 
 async def error_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Global error handler for Telegram updates."""
@@ -31,27 +58,33 @@ async def error_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
         exc_info=error
     )
 
-    # Map domain exceptions to user-friendly messages
+    # Map domain exceptions to user-friendly messages (in the user's language)
+    language = "en"
+    if update and update.message and isinstance(
+        error, (UserNotFoundError, TitleLockedError, InvalidPercentageError, PermissionError)
+    ):
+        language = await _reply_language(update, context)
+
     if isinstance(error, UserNotFoundError):
-        user_message = translate("errors.user_not_found", "en")  # Default to English
+        user_message = translate("errors.user_not_found", language)
         if update and update.message:
             await update.message.reply_text(user_message)
         return
 
     if isinstance(error, TitleLockedError):
-        user_message = translate("errors.title_locked", "en")
+        user_message = translate("errors.title_locked", language)
         if update and update.message:
             await update.message.reply_text(user_message)
         return
 
     if isinstance(error, InvalidPercentageError):
-        user_message = translate("errors.invalid_percentage", "en")
+        user_message = translate("errors.invalid_percentage", language)
         if update and update.message:
             await update.message.reply_text(user_message)
         return
 
     if isinstance(error, PermissionError):
-        user_message = translate("errors.permission_denied", "en")
+        user_message = translate("errors.permission_denied", language)
         if update and update.message:
             await update.message.reply_text(user_message)
         return
@@ -62,15 +95,17 @@ async def error_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
             "❌ An error occurred. Please try again later."
         )
 
-    # Notify admin on critical errors (if configured)
-    if app_settings.ADMIN_USER_ID:
+    # Notify admin on critical errors (if configured), at most once per interval
+    if app_settings.ADMIN_USER_ID and context.bot:
+        global _last_admin_notification
+        now = time.monotonic()
+        if now - _last_admin_notification < ADMIN_NOTIFY_INTERVAL:
+            return
+        _last_admin_notification = now
         try:
-            # Would need bot instance to send DM to admin
-            # For now, just log it
-            logger.warning(
-                "Critical error - admin should be notified",
-                admin_user_id=app_settings.ADMIN_USER_ID,
-                error=str(error)
+            await context.bot.send_message(
+                chat_id=app_settings.ADMIN_USER_ID,
+                text=f"⚠️ Bot error: {error!r}"[:_MAX_MESSAGE_LENGTH],
             )
         except Exception:
             logger.error("Failed to notify admin", exc_info=True)
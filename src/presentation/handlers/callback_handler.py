@@ -1,20 +1,32 @@
 """Callback query handler for inline button clicks."""
 
-from telegram import Update
+import asyncio
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from telegram import InlineKeyboardMarkup, Update
+from telegram.error import BadRequest
 from telegram.ext import ContextTypes
 
 from ...domain.repositories.user_repository import IUserRepository
-from ...application.use_cases.get_user_stats_use_case import GetUserStatsUseCase
+from ...application.use_cases.get_user_stats_use_case import GetUserStatsUseCase, UserStats
 from ...application.use_cases.get_leaderboard_use_case import GetLeaderboardUseCase
 from ...application.services.admin_service import AdminService
 from ..keyboards.inline_keyboard_builder import InlineKeyboardBuilder
 from ..utils.localization import get_user_language
+from ..utils.rendered_texts import get_lock_title_text, get_settings_text, get_stats_templates
 from ...infrastructure.i18n.translations import translate
 
 
 class CallbackHandler:
     """Handler for callback queries (inline button clicks)."""
 
+    __slots__ = (
+        "_user_repository",
+        "_get_user_stats_use_case",
+        "_get_leaderboard_use_case",
+        "_admin_service",
+    )
+
     def __init__(
         self,
         user_repository: IUserRepository,
@@ -36,129 +48,137 @@ class CallbackHandler:
 
         await query.answer()
 
+        handler = self._DISPATCH.get(query.data)
+        if handler is None:
+            return
+
         user = query.from_user
-        language = await get_user_language(self._user_repository, user.id)
         is_admin = self._admin_service.is_admin(user.id, user.username)
-
-        callback_data = query.data
-
-        if callback_data == "me":
-            await self._handle_me_callback(query, user, language, is_admin)
-        elif callback_data == "leaderboard":
-            await self._handle_leaderboard_callback(query, language, is_admin)
-        elif callback_data == "help":
-            await self._handle_help_callback(query, language, is_admin)
-        elif callback_data == "settings":
-            if is_admin:
-                await self._handle_settings_callback(query, language, is_admin)
-        elif callback_data == "lock_title":
-            if is_admin:
-                await self._handle_lock_title_callback(query, language, is_admin)
-        elif callback_data == "back":
-            await self._handle_back_callback(query, user, language, is_admin)
-
-    async def _handle_me_callback(self, query, user, language: str, is_admin: bool):
-        """Handle 'me' callback."""
-        stats = await self._get_user_stats_use_case.execute(user.id)
-        if not stats:
-            await query.message.edit_text(
-                translate("messages.not_in_table", language),
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin, language=language
-                )
+        if query.data in self._ADMIN_CALLBACKS and not is_admin:
+            return
+        if query.data in self._STATS_CALLBACKS:
+            # Language and stats are independent lookups; run them concurrently
+            language, stats = await asyncio.gather(
+                get_user_language(self._user_repository, user.id),
+                self._get_user_stats_use_case.execute(user.id),
             )
+            await handler(self, query, user, language, is_admin, stats=stats)
             return
+        language = await get_user_language(self._user_repository, user.id)
+        await handler(self, query, user, language, is_admin)
+
+    @staticmethod
+    async def _safe_edit(query, text: str, reply_markup: InlineKeyboardMarkup) -> None:
+        """Edit the callback message, skipping the API call when nothing would change."""
+        message = query.message
+        # Telegram stores message text with surrounding whitespace stripped
+        if message.text == text.strip() and message.reply_markup == reply_markup:
+            return
+        try:
+            await message.edit_text(text, reply_markup=reply_markup)
+        except BadRequest as e:
+            # Raced with another click that already rendered the same content
+            if "not modified" not in str(e):
+                raise
+
+    async def _handle_me_callback(
+        self, query, user, language: str, is_admin: bool, stats: Optional[UserStats] = None
+    ):
+        """Handle 'me' callback (stats are prefetched by handle_callback)."""
+        text, keyboard = self._render_user_stats_menu(stats, language, is_admin)
+        await self._safe_edit(query, text, keyboard)
+
+    @staticmethod
+    def _render_user_stats_menu(
+        stats: Optional[UserStats], language: str, is_admin: bool
+    ) -> Tuple[str, InlineKeyboardMarkup]:
+        """Render the main menu text (user stats) and keyboard."""
+        keyboard = InlineKeyboardBuilder.build_main_keyboard(is_admin=is_admin, language=language)
+        if not stats:
+            return translate("messages.not_in_table", language), keyboard
 
-        stats_text = f"📊 {translate('stats.user_stats', language)}\n\n"
-        stats_text += f"{translate('stats.title', language)}: {stats.title}\n"
+        header, title_line, percentage_line, position_line = get_stats_templates(language)
+        lines = [header, title_line.format(title=stats.title)]
         if stats.current_percentage:
-            stats_text += f"{translate('stats.percentage', language)}: {stats.current_percentage}%\n"
+            lines.append(percentage_line.format(percentage=stats.current_percentage))
         if stats.position_in_leaderboard:
-            stats_text += f"{translate('stats.position', language)}: #{stats.position_in_leaderboard}\n"
-
-        await query.message.edit_text(
-            stats_text,
-            reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                is_admin=is_admin, language=language
-            )
-        )
+            lines.append(position_line.format(position=stats.position_in_leaderboard))
+        return "\n".join(lines), keyboard
 
-    async def _handle_leaderboard_callback(self, query, language: str, is_admin: bool):
+    async def _handle_leaderboard_callback(self, query, user, language: str, is_admin: bool):
         """Handle 'leaderboard' callback."""
         entries = await self._get_leaderboard_use_case.execute(limit=10, sort_order="asc")
 
         if not entries:
-            await query.message.edit_text(
+            await self._safe_edit(
+                query,
                 translate("messages.not_in_table", language),
-                reply_markup=InlineKeyboardBuilder.build_back_keyboard(language)
+                InlineKeyboardBuilder.build_back_keyboard(language),
             )
             return
 
-        leaderboard_text = f"👥 {translate('commands.leaderboard', language)}\n\n"
-        for entry in entries:
-            username = entry.telegram_username or entry.display_name or "Unknown"
-            leaderboard_text += f"{entry.position}. @{username} - {entry.title} ({entry.title_letter_count})\n"
+        lines = [f"👥 {translate('commands.leaderboard', language)}", ""]
+        lines.extend(
+            f"{entry.position}. @{entry.telegram_username or entry.display_name or 'Unknown'}"
+            f" - {entry.title} ({entry.title_letter_count})"
+            for entry in entries
+        )
+        leaderboard_text = "\n".join(lines)
 
-        await query.message.edit_text(
+        await self._safe_edit(
+            query,
             leaderboard_text,
-            reply_markup=InlineKeyboardBuilder.build_back_keyboard(language)
+            InlineKeyboardBuilder.build_back_keyboard(language),
         )
 
-    async def _handle_help_callback(self, query, language: str, is_admin: bool):
+    async def _handle_help_callback(self, query, user, language: str, is_admin: bool):
         """Handle 'help' callback."""
         help_text = translate("commands.help", language)
-        await query.message.edit_text(
+        await self._safe_edit(
+            query,
             help_text,
-            reply_markup=InlineKeyboardBuilder.build_back_keyboard(language)
+            InlineKeyboardBuilder.build_back_keyboard(language),
         )
 
-    async def _handle_settings_callback(self, query, language: str, is_admin: bool):
+    async def _handle_settings_callback(self, query, user, language: str, is_admin: bool):
         """Handle 'settings' callback (admin only)."""
-        settings_text = f"⚙️ {translate('buttons.settings', language)}\n\n"
-        settings_text += f"{translate('commands.available_commands', language)}:\n"
-        settings_text += f"• /lock_title @username - {translate('commands.lock_title', language)}\n"
-        settings_text += f"• /unlock_title @username - {translate('commands.unlock_title', language)}\n"
-        settings_text += f"• /set_full_title @username <title> - {translate('commands.set_full_title', language)}\n"
-        settings_text += f"• /set_global_average_period <days> - {translate('commands.set_global_average_period', language)}\n"
-        
-        await query.message.edit_text(
+        settings_text = get_settings_text(language)
+
+        await self._safe_edit(
+            query,
             settings_text,
-            reply_markup=InlineKeyboardBuilder.build_settings_keyboard(language)
+            InlineKeyboardBuilder.build_settings_keyboard(language),
         )
 
-    async def _handle_lock_title_callback(self, query, language: str, is_admin: bool):
+    async def _handle_lock_title_callback(self, query, user, language: str, is_admin: bool):
         """Handle 'lock_title' callback (admin only)."""
-        lock_text = f"🔒 {translate('buttons.lock_title', language)}\n\n"
-        lock_text += f"Use /lock_title @username to lock a user's title\n\n"
-        lock_text += f"Example: /lock_title @john_doe"
-        
-        await query.message.edit_text(
+        lock_text = get_lock_title_text(language)
+
+        await self._safe_edit(
+            query,
             lock_text,
-            reply_markup=InlineKeyboardBuilder.build_settings_keyboard(language)
+            InlineKeyboardBuilder.build_settings_keyboard(language),
         )
     
-    async def _handle_back_callback(self, query, user, language: str, is_admin: bool):
-        """Handle 'back' callback to return to main menu."""
-        # Get user stats to show main menu
-        stats = await self._get_user_stats_use_case.execute(user.id)
-        if stats:
-            stats_text = f"📊 {translate('stats.user_stats', language)}\n\n"
-            stats_text += f"{translate('stats.title', language)}: {stats.title}\n"
-            if stats.current_percentage:
-                stats_text += f"{translate('stats.percentage', language)}: {stats.current_percentage}%\n"
-            if stats.position_in_leaderboard:
-                stats_text += f"{translate('stats.position', language)}: #{stats.position_in_leaderboard}\n"
-            
-            await query.message.edit_text(
-                stats_text,
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin, language=language
-                )
-            )
-        else:
-            await query.message.edit_text(
-                translate("messages.not_in_table", language),
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin, language=language
-                )
-            )
+    async def _handle_back_callback(
+        self, query, user, language: str, is_admin: bool, stats: Optional[UserStats] = None
+    ):
+        """Handle 'back' callback to return to main menu (stats are prefetched by handle_callback)."""
+        text, keyboard = self._render_user_stats_menu(stats, language, is_admin)
+        await self._safe_edit(query, text, keyboard)
+
+    # Callbacks rendering the user stats menu; handle_callback fetches their stats
+    _STATS_CALLBACKS = frozenset({"me", "back"})
+
+    # Callbacks only admins may trigger
+    _ADMIN_CALLBACKS = frozenset({"settings", "lock_title"})
+
+    # callback_data -> handler; all handlers take (query, user, language, is_admin)
+    _DISPATCH: Dict[str, Callable[..., Awaitable[None]]] = {
+        "me": _handle_me_callback,
+        "leaderboard": _handle_leaderboard_callback,
+        "help": _handle_help_callback,
+        "settings": _handle_settings_callback,
+        "lock_title": _handle_lock_title_callback,
+        "back": _handle_back_callback,
+    }
@@ -1,89 +1,167 @@
 """Chat member handler for bot-added-to-group events."""
 
-from typing import Optional
+import asyncio
+from functools import partial
+from types import MappingProxyType
+from typing import Mapping, Optional, Set
 from telegram import Update
 from telegram.ext import ContextTypes
 import structlog
 
 from ...domain.repositories.user_repository import IUserRepository
+from ...infrastructure.cache.ttl_cache import MISSING, TTLCache
+from ...infrastructure.telegram.send_queue import SendQueue
 from ..utils.localization import get_user_language
-from ...infrastructure.i18n.translations import translate
+from ...infrastructure.i18n.translations import TRANSLATIONS, translate
 
-logger = structlog.get_logger(__name__)
+# Static context bound once instead of being passed on every call
+logger = structlog.get_logger(__name__).bind(handler="chat_member")
+
+# Chat types where a welcome message is sent when the bot is added
+_GROUP_CHAT_TYPES = frozenset({"group", "supergroup"})
+
+# Seconds during which a repeated bot-added event for the same chat is ignored
+WELCOME_DEDUP_WINDOW = 60.0
+
+# Welcome message per language, translated once; read-only view for safe sharing
+_WELCOME_TEXTS: Mapping[str, str] = MappingProxyType(
+    {language: translate("welcome_group", language) for language in TRANSLATIONS}
+)
 
 
 class ChatMemberHandler:
     """Handler for processing bot-added-to-group events."""
 
-    def __init__(self, user_repository: IUserRepository):
+    __slots__ = (
+        "_user_repository",
+        "_send_queue",
+        "_recent_welcomes",
+        "_pending_sends",
+        "_bot_id",
+    )
+
+    def __init__(
+        self, user_repository: IUserRepository, send_queue: Optional[SendQueue] = None
+    ):
         """
         Initialize chat member handler.
         
         Args:
             user_repository: User repository interface (for language detection)
+            send_queue: Outgoing message queue; when given, welcome messages are
+                queued instead of sent in a background task
         """
         self._user_repository = user_repository
+        self._send_queue = send_queue
+        # Chats welcomed recently (chat_id -> True), to drop redelivered updates
+        self._recent_welcomes: TTLCache = TTLCache(ttl=WELCOME_DEDUP_WINDOW, maxsize=1024)
+        # Strong references to in-flight welcome sends so they are not garbage collected
+        self._pending_sends: Set[asyncio.Task] = set()
+        # Bot identity never changes within a process; read once from the first update
+        self._bot_id: Optional[int] = None
 
     async def handle_new_chat_members(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle NEW_CHAT_MEMBERS status update - detect when bot is added to group."""
+        """
+        Handle NEW_CHAT_MEMBERS status update - detect when bot is added to group.
+        
+        Updates from chats other than groups/supergroups return immediately,
+        before the member scan and any database lookup.
+        """
         message = update.message
         if not message or not message.new_chat_members:
             return
 
-        # Check if bot itself is in new_chat_members list
-        bot_id = context.bot.id if context.bot else None
-        if not bot_id:
-            logger.warning("Cannot determine bot ID, skipping new_chat_members handler")
+        chat = message.chat
+        if not chat:
+            logger.warning("Cannot determine chat for new_chat_members handler")
             return
+        if chat.type not in _GROUP_CHAT_TYPES:
+            return
+
+        # Check if bot itself is in new_chat_members list
+        # (context.bot is always set while the application is dispatching updates)
+        bot_id = self._bot_id
+        if bot_id is None:
+            bot_id = self._bot_id = context.bot.id
 
         # Check if bot was added to the group
-        bot_was_added = any(member.id == bot_id for member in message.new_chat_members)
-        
-        if not bot_was_added:
+        for member in message.new_chat_members:
+            if member.id == bot_id:
+                break
+        else:
             # Bot was not added, skip
             return
 
-        # Bot was added to group - send welcome message
-        chat = message.chat
-        if not chat:
-            logger.warning("Cannot determine chat for new_chat_members handler")
+        # Bot was added to group - send welcome message (once per chat per window;
+        # redelivered updates are dropped). Check-and-set happens before any await,
+        # so concurrent duplicates cannot both pass.
+        if self._recent_welcomes.get(chat.id) is not MISSING:
+            logger.info("Skipping duplicate welcome message", chat_id=chat.id)
             return
+        self._recent_welcomes.set(chat.id, True)
 
         # Determine language (default to English for group messages)
         # Try to get language from message sender if available, otherwise default to English
         sender_language = "en"
         if message.from_user:
             try:
-                sender_user = await self._user_repository.get_by_telegram_id(message.from_user.id)
-                if sender_user:
-                    sender_language = sender_user.language
+                sender_language = await get_user_language(
+                    self._user_repository, message.from_user.id
+                )
             except Exception:
-                # If error getting user language, use default
-                pass
-
-        # Build welcome message
-        welcome_text = "👋 Welcome! To use this bot, please run /register to register yourself.\n\n"
-        welcome_text += "Available commands:\n"
-        welcome_text += "• /register - Register yourself with the bot\n"
-        welcome_text += "• /me - View your stats\n"
-        welcome_text += "• /who @username - View another user's stats\n"
-        welcome_text += "• /leaderboard - View leaderboard\n"
-        welcome_text += "• /stats - View statistics\n"
-        welcome_text += "• /help - Show help message"
-
-        try:
-            # Send welcome message to the group
-            await message.reply_text(welcome_text)
+                # Unregistered senders already resolve to "en" without raising; this
+                # only catches database failures, which should not block the welcome
+                logger.warning("Could not determine sender language", exc_info=True)
+
+        welcome_text = _WELCOME_TEXTS.get(sender_language) or _WELCOME_TEXTS["en"]
+
+        if self._send_queue is not None:
+            # A queue worker delivers it; the put only waits while the queue is full
+            await self._send_queue.send_message(
+                chat.id,
+                welcome_text,
+                reply_to_message_id=message.message_id,
+                on_error=partial(self._forget_welcome, chat.id),
+            )
             logger.info(
-                "Welcome message sent after bot was added to group",
+                "Welcome message queued after bot was added to group",
                 chat_id=chat.id,
                 chat_type=chat.type
             )
-        except Exception as e:
+            return
+
+        # Send in the background so the update handler returns immediately
+        task = asyncio.create_task(self._send_welcome(message, welcome_text))
+        self._pending_sends.add(task)
+        task.add_done_callback(partial(self._on_welcome_sent, chat.id))
+
+    async def _send_welcome(self, message, welcome_text: str) -> None:
+        """Send the welcome message to the group."""
+        await message.reply_text(welcome_text)
+        logger.info(
+            "Welcome message sent after bot was added to group",
+            chat_id=message.chat.id,
+            chat_type=message.chat.type
+        )
+
+    def _on_welcome_sent(self, chat_id: int, task: "asyncio.Task[None]") -> None:
+        """Release a finished send task and log its failure, if any."""
+        self._pending_sends.discard(task)
+        if task.cancelled():
+            self._recent_welcomes.invalidate(chat_id)
+            return
+        error = task.exception()
+        if error is not None:
+            # Not welcomed after all; let a redelivered update try again
+            self._recent_welcomes.invalidate(chat_id)
             logger.error(
                 "Error sending welcome message after bot was added to group",
-                error=str(e),
-                chat_id=chat.id,
-                chat_type=chat.type,
-                exc_info=True
+                error=str(error),
+                error_type=type(error).__name__,
+                chat_id=chat_id,
+                exc_info=error
             )
+
+    def _forget_welcome(self, chat_id: int, error: Exception) -> None:
+        """Queued welcome failed; let a redelivered update try again."""
+        self._recent_welcomes.invalidate(chat_id)
@@ -1,6 +1,8 @@
 """Command handlers for Telegram bot."""
 
-from typing import Optional
+import asyncio
+import re
+from typing import Awaitable, Optional, TypeVar
 from telegram import Update
 from telegram.ext import ContextTypes
 
@@ -22,13 +24,70 @@ from ...application.use_cases.migrate_users_to_default_title_use_case import Mig
 from ...application.use_cases.delete_user_use_case import DeleteUserUseCase
 from ...application.services.admin_service import AdminService
 from ..keyboards.inline_keyboard_builder import InlineKeyboardBuilder
-from ..utils.localization import get_user_language, format_translated_message_async
-from ...infrastructure.i18n.translations import translate
+from ..utils.localization import get_user_language
+from ..utils.timing import timed
+from ..utils.rendered_texts import get_start_text, get_stats_templates, get_usage_text
+from ...infrastructure.cache.ttl_cache import TTLCache
+from ...infrastructure.i18n.translations import TRANSLATIONS, format_translated_message, translate
+
+# Seconds a rendered /leaderboard reply is reused (automatic title updates do not
+# invalidate it, so keep this short)
+LEADERBOARD_CACHE_TTL = 30.0
+
+# Max concurrent stats/leaderboard queries from command handlers; about twice the
+# Supabase HTTP pool, so bursts queue here instead of saturating the database
+HEAVY_QUERY_CONCURRENCY = 40
+
+# Largest period accepted by /stats and /set_global_average_period (0 = all-time)
+MAX_PERIOD_DAYS = 3650
+
+T = TypeVar("T")
+
+# Telegram usernames: letters, digits and underscores (anything else cannot match a row)
+_USERNAME_RE = re.compile(r"\A[A-Za-z0-9_]{3,32}\Z")
+
+
+def _parse_username(arg: str) -> Optional[str]:
+    """Username from a command argument ("@name" or "name"), or None if it is not a valid username."""
+    username = arg[1:] if arg.startswith("@") else arg
+    return username if _USERNAME_RE.match(username) else None
+
+
+def _parse_int(arg: str, lo: Optional[int] = None, hi: Optional[int] = None) -> Optional[int]:
+    """Integer from a command argument, or None if it is not an integer within [lo, hi]."""
+    try:
+        value = int(arg)
+    except ValueError:
+        return None
+    if (lo is not None and value < lo) or (hi is not None and value > hi):
+        return None
+    return value
 
 
 class CommandHandlers:
     """Command handlers for bot commands."""
 
+    __slots__ = (
+        "_user_repository",
+        "_settings_repository",
+        "_get_user_stats_use_case",
+        "_get_leaderboard_use_case",
+        "_calculate_statistics_use_case",
+        "_lock_title_use_case",
+        "_unlock_title_use_case",
+        "_set_full_title_use_case",
+        "_set_full_title_for_all_use_case",
+        "_set_global_average_period_use_case",
+        "_register_user_use_case",
+        "_add_user_use_case",
+        "_set_default_title_use_case",
+        "_migrate_users_to_default_title_use_case",
+        "_delete_user_use_case",
+        "_admin_service",
+        "_leaderboard_texts",
+        "_heavy_queries",
+    )
+
     def __init__(
         self,
         user_repository: IUserRepository,
@@ -65,21 +124,61 @@ class CommandHandlers:
         self._migrate_users_to_default_title_use_case = migrate_users_to_default_title_use_case
         self._delete_user_use_case = delete_user_use_case
         self._admin_service = admin_service
+        # language -> rendered /leaderboard text; cleared by admin commands that
+        # change titles or membership, otherwise refreshed after the TTL
+        self._leaderboard_texts: TTLCache = TTLCache(ttl=LEADERBOARD_CACHE_TTL, maxsize=8)
+        self._heavy_queries = asyncio.Semaphore(HEAVY_QUERY_CONCURRENCY)
+
+    @staticmethod
+    async def _reply(
+        update: Update,
+        text: str,
+        is_admin: bool,
+        language: str,
+        parse_mode: Optional[str] = None,
+    ) -> None:
+        """Reply to the command message with the main keyboard attached."""
+        await update.message.reply_text(
+            text,
+            parse_mode=parse_mode,
+            reply_markup=InlineKeyboardBuilder.build_main_keyboard(
+                is_admin=is_admin,
+                language=language
+            )
+        )
+
+    async def _limited(self, awaitable: Awaitable[T]) -> T:
+        """Await a stats/leaderboard query under the heavy query semaphore."""
+        async with self._heavy_queries:
+            return await awaitable
 
+    @staticmethod
+    def _client_language(user) -> str:
+        """Language of the user's Telegram client if supported, else English (no database query)."""
+        return user.language_code if user.language_code in TRANSLATIONS else "en"
+
+    async def _deny(self, update: Update, user) -> None:
+        """
+        Reply with permission denied to a non-admin.
+
+        Admin-only commands call this before any database lookup, so the reply
+        uses the Telegram client's language instead of the stored one.
+        """
+        language = self._client_language(user)
+        await self._reply(update, translate("errors.permission_denied", language), False, language)
+
+    @timed("me")
     async def handle_me(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /me command."""
         user = update.message.from_user
-        language = await get_user_language(self._user_repository, user.id)
-
-        stats = await self._get_user_stats_use_case.execute(user.id)
+        is_admin = self._admin_service.is_admin(user.id, user.username)
+        # Language and stats are independent lookups; run them concurrently
+        language, stats = await asyncio.gather(
+            get_user_language(self._user_repository, user.id),
+            self._limited(self._get_user_stats_use_case.execute(user.id)),
+        )
         if not stats:
-            await update.message.reply_text(
-                translate("messages.not_in_table", language),
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=self._admin_service.is_admin(user.id, user.username),
-                    language=language
-                )
-            )
+            await self._reply(update, translate("messages.not_in_table", language), is_admin, language)
             return
 
         # Format stats message
@@ -91,128 +190,113 @@ class CommandHandlers:
         else:
             display_name = user.first_name or "Unknown"
         
-        stats_text = f"👤 {display_name}\n"
-        stats_text += f"📊 {translate('stats.user_stats', language)}\n\n"
-        stats_text += f"{translate('stats.title', language)}: {stats.title}\n"
-        stats_text += f"{translate('stats.percentage', language)}: {stats.current_percentage}%\n" if stats.current_percentage else ""
-        stats_text += f"{translate('stats.position', language)}: #{stats.position_in_leaderboard}\n" if stats.position_in_leaderboard else ""
-        
+        header, title_line, percentage_line, position_line = get_stats_templates(language)
+        lines = [f"👤 {display_name}", header, title_line.format(title=stats.title)]
+        if stats.current_percentage:
+            lines.append(percentage_line.format(percentage=stats.current_percentage))
+        if stats.position_in_leaderboard:
+            lines.append(position_line.format(position=stats.position_in_leaderboard))
         if stats.daily_trend:
-            stats_text += f"Daily: {stats.daily_trend:.1f}%\n"
+            lines.append(f"Daily: {stats.daily_trend:.1f}%")
         if stats.weekly_trend:
-            stats_text += f"Weekly: {stats.weekly_trend:.1f}%\n"
+            lines.append(f"Weekly: {stats.weekly_trend:.1f}%")
         if stats.monthly_trend:
-            stats_text += f"Monthly: {stats.monthly_trend:.1f}%\n"
+            lines.append(f"Monthly: {stats.monthly_trend:.1f}%")
+        stats_text = "\n".join(lines) + "\n"
 
-        await update.message.reply_text(
-            stats_text,
-            reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                is_admin=self._admin_service.is_admin(user.id, user.username),
-                language=language
-            )
-        )
+        await self._reply(update, stats_text, is_admin, language)
 
+    @timed("who")
     async def handle_who(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /who @username command."""
         user = update.message.from_user
-        language = await get_user_language(self._user_repository, user.id)
         is_admin = self._admin_service.is_admin(user.id, user.username)
         
         if not context.args:
-            await update.message.reply_text(
-                f"{translate('commands.who', language)}: /who @username",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+            language = await get_user_language(self._user_repository, user.id)
+            await self._reply(update, get_usage_text("who", language), is_admin, language)
             return
 
-        username = context.args[0].replace("@", "")
-
-        target_user = await self._user_repository.get_by_username(username)
-        if not target_user:
-            await update.message.reply_text(
-                translate("errors.user_not_found", language),
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
+        username = _parse_username(context.args[0])
+        if username is None:
+            language = await get_user_language(self._user_repository, user.id)
+            target_user = None
+        else:
+            language, target_user = await asyncio.gather(
+                get_user_language(self._user_repository, user.id),
+                self._user_repository.get_by_username(username),
             )
+        if not target_user:
+            await self._reply(update, translate("errors.user_not_found", language), is_admin, language)
             return
 
-        stats = await self._get_user_stats_use_case.execute(target_user.telegram_user_id)
+        stats = await self._limited(
+            self._get_user_stats_use_case.execute(target_user.telegram_user_id)
+        )
         if not stats:
-            await update.message.reply_text(
-                translate("errors.user_not_found", language),
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+            await self._reply(update, translate("errors.user_not_found", language), is_admin, language)
             return
 
-        user = update.message.from_user
-        is_admin = self._admin_service.is_admin(user.id, user.username)
-        
         stats_text = f"👤 {username}\n"
         stats_text += f"{translate('stats.title', language)}: {stats.title}\n"
         stats_text += f"{translate('stats.percentage', language)}: {stats.current_percentage}%\n" if stats.current_percentage else ""
         stats_text += f"{translate('stats.position', language)}: #{stats.position_in_leaderboard}\n" if stats.position_in_leaderboard else ""
 
-        await update.message.reply_text(
-            stats_text,
-            reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                is_admin=is_admin,
-                language=language
-            )
-        )
+        await self._reply(update, stats_text, is_admin, language)
 
+    @timed("leaderboard")
     async def handle_leaderboard(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /leaderboard command."""
         user = update.message.from_user
-        language = await get_user_language(self._user_repository, user.id)
         is_admin = self._admin_service.is_admin(user.id, user.username)
 
-        entries = await self._get_leaderboard_use_case.execute(limit=10, sort_order="asc")
+        language = await get_user_language(self._user_repository, user.id)
+        # Same top 10 for every caller; rendered text is cached per language
+        leaderboard_text = await self._leaderboard_texts.get_or_load(
+            language, lambda: self._render_leaderboard(language)
+        )
+        await self._reply(update, leaderboard_text, is_admin, language)
 
+    async def _render_leaderboard(self, language: str) -> str:
+        """Fetch the top 10 and render the /leaderboard reply text."""
+        entries = await self._limited(
+            self._get_leaderboard_use_case.execute(limit=10, sort_order="asc")
+        )
         if not entries:
-            await update.message.reply_text(
-                translate("messages.not_in_table", language),
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
-            return
-
-        leaderboard_text = f"👥 {translate('commands.leaderboard', language)}\n\n"
-        for entry in entries:
-            username = entry.telegram_username or entry.display_name or "Unknown"
-            leaderboard_text += f"{entry.position}. @{username} - {entry.title} ({entry.title_letter_count})\n"
+            return translate("messages.not_in_table", language)
 
-        await update.message.reply_text(
-            leaderboard_text,
-            reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                is_admin=is_admin,
-                language=language
-            )
+        lines = [f"👥 {translate('commands.leaderboard', language)}", ""]
+        lines.extend(
+            f"{entry.position}. @{entry.telegram_username or entry.display_name or 'Unknown'}"
+            f" - {entry.title} ({entry.title_letter_count})"
+            for entry in entries
         )
+        return "\n".join(lines) + "\n"
 
+    @timed("stats")
     async def handle_stats(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /stats [range] command."""
         user = update.message.from_user
-        language = await get_user_language(self._user_repository, user.id)
         is_admin = self._admin_service.is_admin(user.id, user.username)
 
         period_days = None
         if context.args:
-            try:
-                period_days = int(context.args[0])
-            except ValueError:
-                pass
+            period_days = _parse_int(context.args[0], 0, MAX_PERIOD_DAYS)
+            if period_days is None:
+                # Rejected before any query (e.g. /stats 99999999)
+                language = await get_user_language(self._user_repository, user.id)
+                await self._reply(
+                    update,
+                    format_translated_message("errors.invalid_period", language, max=MAX_PERIOD_DAYS),
+                    is_admin,
+                    language,
+                )
+                return
 
-        global_avg = await self._calculate_statistics_use_case.execute(period_days)
+        language, global_avg = await asyncio.gather(
+            get_user_language(self._user_repository, user.id),
+            self._limited(self._calculate_statistics_use_case.execute(period_days)),
+        )
 
         stats_text = f"📊 {translate('stats.global_average', language)}\n"
         if global_avg is not None:
@@ -220,50 +304,26 @@ class CommandHandlers:
         else:
             stats_text += "No data available"
 
-        await update.message.reply_text(
-            stats_text,
-            reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                is_admin=is_admin,
-                language=language
-            )
-        )
+        await self._reply(update, stats_text, is_admin, language)
 
+    @timed("lock_title")
     async def handle_lock_title(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /lock_title @username command (admin only)."""
         user = update.message.from_user
-        language = await get_user_language(self._user_repository, user.id)
         is_admin = self._admin_service.is_admin(user.id, user.username)
-
-        if not context.args:
-            await update.message.reply_text(
-                f"{translate('commands.lock_title', language)}: /lock_title @username",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+        if not is_admin:
+            await self._deny(update, user)
             return
+        language = await get_user_language(self._user_repository, user.id)
 
-        if not is_admin:
-            await update.message.reply_text(
-                translate("errors.permission_denied", language),
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=False,
-                    language=language
-                )
-            )
+        if not context.args:
+            await self._reply(update, get_usage_text("lock_title", language), is_admin, language)
             return
 
-        username = context.args[0].replace("@", "")
-        target_user = await self._user_repository.get_by_username(username)
+        username = _parse_username(context.args[0])
+        target_user = await self._user_repository.get_by_username(username) if username else None
         if not target_user:
-            await update.message.reply_text(
-                translate("errors.user_not_found", language),
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+            await self._reply(update, translate("errors.user_not_found", language), is_admin, language)
             return
 
         try:
@@ -272,58 +332,33 @@ class CommandHandlers:
                 user.id,
                 user.username
             )
-            await update.message.reply_text(
+            await self._reply(
+                update,
                 f"{translate('messages.title_locked', language)} @{username}",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
+                is_admin,
+                language,
             )
         except Exception as e:
-            await update.message.reply_text(
-                f"Error: {str(e)}",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+            await self._reply(update, f"Error: {str(e)}", is_admin, language)
 
+    @timed("unlock_title")
     async def handle_unlock_title(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /unlock_title @username command (admin only)."""
         user = update.message.from_user
-        language = await get_user_language(self._user_repository, user.id)
         is_admin = self._admin_service.is_admin(user.id, user.username)
-
-        if not context.args:
-            await update.message.reply_text(
-                f"{translate('commands.unlock_title', language)}: /unlock_title @username",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+        if not is_admin:
+            await self._deny(update, user)
             return
+        language = await get_user_language(self._user_repository, user.id)
 
-        if not is_admin:
-            await update.message.reply_text(
-                translate("errors.permission_denied", language),
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=False,
-                    language=language
-                )
-            )
+        if not context.args:
+            await self._reply(update, get_usage_text("unlock_title", language), is_admin, language)
             return
 
-        username = context.args[0].replace("@", "")
-        target_user = await self._user_repository.get_by_username(username)
+        username = _parse_username(context.args[0])
+        target_user = await self._user_repository.get_by_username(username) if username else None
         if not target_user:
-            await update.message.reply_text(
-                translate("errors.user_not_found", language),
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+            await self._reply(update, translate("errors.user_not_found", language), is_admin, language)
             return
 
         try:
@@ -332,60 +367,35 @@ class CommandHandlers:
                 user.id,
                 user.username
             )
-            await update.message.reply_text(
+            await self._reply(
+                update,
                 f"{translate('messages.title_unlocked', language)} @{username}",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
+                is_admin,
+                language,
             )
         except Exception as e:
-            await update.message.reply_text(
-                f"Error: {str(e)}",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+            await self._reply(update, f"Error: {str(e)}", is_admin, language)
 
+    @timed("set_full_title")
     async def handle_set_full_title(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /set_full_title @username <full_title> command (admin only)."""
         user = update.message.from_user
-        language = await get_user_language(self._user_repository, user.id)
         is_admin = self._admin_service.is_admin(user.id, user.username)
-
-        if not context.args or len(context.args) < 2:
-            await update.message.reply_text(
-                f"{translate('commands.set_full_title', language)}: /set_full_title @username <full_title>",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+        if not is_admin:
+            await self._deny(update, user)
             return
+        language = await get_user_language(self._user_repository, user.id)
 
-        if not is_admin:
-            await update.message.reply_text(
-                translate("errors.permission_denied", language),
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=False,
-                    language=language
-                )
-            )
+        if not context.args or len(context.args) < 2:
+            await self._reply(update, get_usage_text("set_full_title", language), is_admin, language)
             return
 
-        username = context.args[0].replace("@", "")
+        username = _parse_username(context.args[0])
         full_title = " ".join(context.args[1:])  # Join remaining args as full_title (may contain spaces)
 
-        target_user = await self._user_repository.get_by_username(username)
+        target_user = await self._user_repository.get_by_username(username) if username else None
         if not target_user:
-            await update.message.reply_text(
-                translate("errors.user_not_found", language),
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+            await self._reply(update, translate("errors.user_not_found", language), is_admin, language)
             return
 
         try:
@@ -395,53 +405,29 @@ class CommandHandlers:
                 user.id,
                 user.username
             )
-            await update.message.reply_text(
-                f"✅ Full title set for @{username}: '{full_title}'",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+            self._leaderboard_texts.clear()
+            await self._reply(update, f"✅ Full title set for @{username}: '{full_title}'", is_admin, language)
         except PermissionError as e:
-            await update.message.reply_text(
-                translate("errors.permission_denied", language),
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+            await self._reply(update, translate("errors.permission_denied", language), is_admin, language)
         except Exception as e:
-            await update.message.reply_text(
-                f"Error: {str(e)}",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+            await self._reply(update, f"Error: {str(e)}", is_admin, language)
 
+    @timed("set_full_title_for_all")
     async def handle_set_full_title_for_all(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /set_full_title_for_all <full_title> command (admin only)."""
         user = update.message.from_user
-        language = await get_user_language(self._user_repository, user.id)
         is_admin = self._admin_service.is_admin(user.id, user.username)
-
-        if not context.args:
-            await update.message.reply_text(
-                f"Usage: /set_full_title_for_all <full_title>. Title can contain spaces.",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+        if not is_admin:
+            await self._deny(update, user)
             return
+        language = await get_user_language(self._user_repository, user.id)
 
-        if not is_admin:
-            await update.message.reply_text(
-                translate("errors.permission_denied", language),
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=False,
-                    language=language
-                )
+        if not context.args:
+            await self._reply(
+                update,
+                "Usage: /set_full_title_for_all <full_title>. Title can contain spaces.",
+                is_admin,
+                language,
             )
             return
 
@@ -453,139 +439,80 @@ class CommandHandlers:
                 admin_telegram_user_id=user.id,
                 admin_username=user.username,
             )
-            await update.message.reply_text(
+            self._leaderboard_texts.clear()
+            await self._reply(
+                update,
                 f"✅ Full title set for {updated_count} user(s): '{full_title}'",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
+                is_admin,
+                language,
             )
         except PermissionError:
-            await update.message.reply_text(
-                translate("errors.permission_denied", language),
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+            await self._reply(update, translate("errors.permission_denied", language), is_admin, language)
         except Exception as e:
-            await update.message.reply_text(
-                f"Error: {str(e)}",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+            await self._reply(update, f"Error: {str(e)}", is_admin, language)
 
+    @timed("set_global_average_period")
     async def handle_set_global_average_period(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
         """Handle /set_global_average_period <days> command (admin only)."""
         user = update.message.from_user
-        language = await get_user_language(self._user_repository, user.id)
         is_admin = self._admin_service.is_admin(user.id, user.username)
+        if not is_admin:
+            await self._deny(update, user)
+            return
+        language = await get_user_language(self._user_repository, user.id)
 
         if not context.args:
-            await update.message.reply_text(
-                f"{translate('commands.set_global_average_period', language)}: /set_global_average_period <days>",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+            await self._reply(update, get_usage_text("set_global_average_period", language), is_admin, language)
             return
 
-        if not is_admin:
-            await update.message.reply_text(
-                translate("errors.permission_denied", language),
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=False,
-                    language=language
-                )
+        period_days = _parse_int(context.args[0], 0, MAX_PERIOD_DAYS)
+        if period_days is None:
+            await self._reply(
+                update,
+                format_translated_message("errors.invalid_period", language, max=MAX_PERIOD_DAYS),
+                is_admin,
+                language,
             )
             return
 
         try:
-            period_days = int(context.args[0])
             await self._set_global_average_period_use_case.execute(
                 period_days, user.id, user.username
             )
-            await update.message.reply_text(
+            await self._reply(
+                update,
                 f"✅ Global average period set to {period_days} days (0 = all-time)",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
-        except ValueError:
-            await update.message.reply_text(
-                "Invalid number format",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
+                is_admin,
+                language,
             )
+        except ValueError as e:
+            await self._reply(update, f"❌ {str(e)}", is_admin, language)
         except Exception as e:
-            await update.message.reply_text(
-                f"Error: {str(e)}",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+            await self._reply(update, f"Error: {str(e)}", is_admin, language)
 
+    @timed("start")
     async def handle_start(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /start command."""
         user = update.message.from_user
         language = await get_user_language(self._user_repository, user.id)
         is_admin = self._admin_service.is_admin(user.id, user.username)
         
-        welcome_text = f"👋 {translate('commands.welcome', language)}\n\n"
-        welcome_text += f"{translate('commands.available_commands', language)}:\n"
-        welcome_text += f"• /register - Register yourself with the bot\n"
-        welcome_text += f"• /me - {translate('commands.me', language)}\n"
-        welcome_text += f"• /who @username - {translate('commands.who', language)}\n"
-        welcome_text += f"• /leaderboard - {translate('commands.leaderboard', language)}\n"
-        welcome_text += f"• /stats [days] - {translate('commands.stats', language)}\n"
-        welcome_text += f"• /chat_id - Show current chat ID (useful for /add_user)\n"
-        welcome_text += f"• /help - Show help message\n"
-        
-        if is_admin:
-            welcome_text += f"\n🔧 {translate('commands.admin_commands', language)}:\n"
-            welcome_text += f"• /add_user @username [chat_id] - Add user manually (chat_id optional, defaults to current chat)\n"
-            welcome_text += f"• /delete_user @username - Delete user\n"
-            welcome_text += f"• /set_default_title <title> - Set default title for new users\n"
-            welcome_text += f"• /migrate_users_to_default_title - Migrate all users to default title\n"
-            welcome_text += f"• /lock_title @username - {translate('commands.lock_title', language)}\n"
-            welcome_text += f"• /unlock_title @username - {translate('commands.unlock_title', language)}\n"
-            welcome_text += f"• /set_full_title @username <title> - {translate('commands.set_full_title', language)}\n"
-            welcome_text += f"• /set_title @username <title> - {translate('commands.set_full_title', language)} (alias)\n"
-            welcome_text += f"• /set_full_title_for_all <title> - Set full title for all users\n"
-            welcome_text += f"• /set_global_average_period <days> - {translate('commands.set_global_average_period', language)}\n"
-        
-        await update.message.reply_text(
-            welcome_text,
-            reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                is_admin=is_admin,
-                language=language
-            )
-        )
+        welcome_text = get_start_text(language, is_admin)
+        await self._reply(update, welcome_text, is_admin, language)
 
+    @timed("help")
     async def handle_help(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /help command."""
+        """Handle /help command (answered without a database query)."""
         user = update.message.from_user
-        language = await get_user_language(self._user_repository, user.id)
+        language = self._user_repository.get_cached_language(user.id) or self._client_language(user)
         is_admin = self._admin_service.is_admin(user.id, user.username)
         
         help_text = translate("commands.help", language)
-        await update.message.reply_text(
-            help_text,
-            reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                is_admin=is_admin,
-                language=language
-            )
-        )
+        await self._reply(update, help_text, is_admin, language)
 
+    @timed("chat_id")
     async def handle_chat_id(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /chat_id command - displays the current chat ID."""
         chat = update.effective_chat
@@ -608,15 +535,9 @@ class CommandHandlers:
         
         chat_info += "\n💡 Use this chat_id with the /add_user command: `/add_user @username " + str(chat.id) + "`"
         
-        await update.message.reply_text(
-            chat_info,
-            parse_mode='Markdown',
-            reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                is_admin=is_admin,
-                language=language
-            )
-        )
+        await self._reply(update, chat_info, is_admin, language, parse_mode='Markdown')
 
+    @timed("register")
     async def handle_register(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /register command."""
         user = update.message.from_user
@@ -624,15 +545,20 @@ class CommandHandlers:
         is_admin = self._admin_service.is_admin(user.id, user.username)
 
         try:
-            was_created = await self._register_user_use_case.execute(
-                telegram_user_id=user.id,
-                telegram_username=user.username,
-                display_name=user.full_name,
+            # The default title read does not depend on the registration result;
+            # it is only used when the user was just created
+            was_created, default_title = await asyncio.gather(
+                self._register_user_use_case.execute(
+                    telegram_user_id=user.id,
+                    telegram_username=user.username,
+                    display_name=user.full_name,
+                ),
+                self._settings_repository.get_default_title(),
             )
             
             if was_created:
+                self._leaderboard_texts.clear()
                 # User was just created - check if default title is set
-                default_title = await self._settings_repository.get_default_title()
                 if default_title and default_title.strip():
                     message = "✅ Registration successful! Your default title is set. Use /me to check your stats."
                 else:
@@ -641,93 +567,64 @@ class CommandHandlers:
                 # User already existed (idempotent)
                 message = "✅ You're already registered! Use /me to check your stats."
                 
-            await update.message.reply_text(
-                message,
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+            await self._reply(update, message, is_admin, language)
         except ValueError as e:
-            await update.message.reply_text(
-                f"❌ Registration failed: {str(e)}",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+            await self._reply(update, f"❌ Registration failed: {str(e)}", is_admin, language)
         except ConnectionError as e:
-            await update.message.reply_text(
+            await self._reply(
+                update,
                 "❌ Registration failed due to a temporary issue. Please try again later.",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
+                is_admin,
+                language,
             )
         except Exception as e:
-            await update.message.reply_text(
-                f"❌ Registration failed: {str(e)}",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+            await self._reply(update, f"❌ Registration failed: {str(e)}", is_admin, language)
 
+    @timed("add_user")
     async def handle_add_user(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /add_user @username [chat_id] command (admin only).
         
         If chat_id is not provided, uses the current chat where the command was issued.
         """
         user = update.message.from_user
-        language = await get_user_language(self._user_repository, user.id)
         is_admin = self._admin_service.is_admin(user.id, user.username)
-
         if not is_admin:
-            await update.message.reply_text(
-                translate("errors.permission_denied", language),
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=False,
-                    language=language
-                )
-            )
+            await self._deny(update, user)
             return
+        language = await get_user_language(self._user_repository, user.id)
 
         if not context.args or len(context.args) < 1:
             current_chat_id = update.effective_chat.id
-            await update.message.reply_text(
-                f"❌ Usage: /add_user @username [chat_id]\n\n"
-                f"• @username - Required: The username to add\n"
+            await self._reply(
+                update,
+                "❌ Usage: /add_user @username [chat_id]\n\n"
+                "• @username - Required: The username to add\n"
                 f"• chat_id - Optional: Chat ID (defaults to current chat: {current_chat_id})\n\n"
-                f"💡 Tip: Use /chat_id to get the chat ID of any chat.",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
+                "💡 Tip: Use /chat_id to get the chat ID of any chat.",
+                is_admin,
+                language,
             )
             return
 
-        username = context.args[0].replace("@", "").strip()
-        if not username:
-            await update.message.reply_text(
+        username = _parse_username(context.args[0])
+        if username is None:
+            await self._reply(
+                update,
                 "❌ Invalid username. Please provide a valid username (e.g., @username).",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
+                is_admin,
+                language,
             )
             return
         
         # Use provided chat_id or default to current chat
         if len(context.args) >= 2:
-            try:
-                chat_id = int(context.args[1])
-            except ValueError:
-                await update.message.reply_text(
+            chat_id = _parse_int(context.args[1])
+            if chat_id is None:
+                await self._reply(
+                    update,
                     "❌ Invalid chat_id. Must be a valid integer. Use /chat_id to get a chat's ID.",
-                    reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                        is_admin=is_admin,
-                        language=language
-                    )
+                    is_admin,
+                    language,
                 )
                 return
         else:
@@ -743,73 +640,37 @@ class CommandHandlers:
             )
             
             if was_created:
+                self._leaderboard_texts.clear()
                 message = f"✅ User @{username} added successfully!"
             else:
                 message = f"✅ User @{username} is already registered."
                 
-            await update.message.reply_text(
-                message,
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+            await self._reply(update, message, is_admin, language)
         except PermissionError:
-            await update.message.reply_text(
-                translate("errors.permission_denied", language),
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+            await self._reply(update, translate("errors.permission_denied", language), is_admin, language)
         except UserNotFoundError as e:
-            await update.message.reply_text(
-                f"❌ {str(e)}",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+            await self._reply(update, f"❌ {str(e)}", is_admin, language)
         except ValueError as e:
-            await update.message.reply_text(
-                f"❌ Error: {str(e)}",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+            await self._reply(update, f"❌ Error: {str(e)}", is_admin, language)
         except Exception as e:
-            await update.message.reply_text(
-                f"❌ Unexpected error: {str(e)}",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+            await self._reply(update, f"❌ Unexpected error: {str(e)}", is_admin, language)
 
+    @timed("set_default_title")
     async def handle_set_default_title(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /set_default_title <title> command (admin only)."""
         user = update.message.from_user
-        language = await get_user_language(self._user_repository, user.id)
         is_admin = self._admin_service.is_admin(user.id, user.username)
-
         if not is_admin:
-            await update.message.reply_text(
-                translate("errors.permission_denied", language),
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=False,
-                    language=language
-                )
-            )
+            await self._deny(update, user)
             return
+        language = await get_user_language(self._user_repository, user.id)
 
         if not context.args:
-            await update.message.reply_text(
+            await self._reply(
+                update,
                 "❌ Usage: /set_default_title <title>. Title can contain spaces.",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
+                is_admin,
+                language,
             )
             return
 
@@ -821,163 +682,78 @@ class CommandHandlers:
                 admin_user_id=user.id,
                 admin_username=user.username,
             )
-            await update.message.reply_text(
-                f"✅ {message}",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+            await self._reply(update, f"✅ {message}", is_admin, language)
         except PermissionError:
-            await update.message.reply_text(
-                translate("errors.permission_denied", language),
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+            await self._reply(update, translate("errors.permission_denied", language), is_admin, language)
         except ValueError as e:
-            await update.message.reply_text(
-                f"❌ {str(e)}",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+            await self._reply(update, f"❌ {str(e)}", is_admin, language)
         except Exception as e:
-            await update.message.reply_text(
-                f"❌ Error: {str(e)}",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+            await self._reply(update, f"❌ Error: {str(e)}", is_admin, language)
 
+    @timed("migrate_users_to_default_title")
     async def handle_migrate_users_to_default_title(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /migrate_users_to_default_title command (admin only)."""
         user = update.message.from_user
-        language = await get_user_language(self._user_repository, user.id)
         is_admin = self._admin_service.is_admin(user.id, user.username)
-
         if not is_admin:
-            await update.message.reply_text(
-                translate("errors.permission_denied", language),
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=False,
-                    language=language
-                )
-            )
+            await self._deny(update, user)
             return
+        language = await get_user_language(self._user_repository, user.id)
 
         try:
             updated_count = await self._migrate_users_to_default_title_use_case.execute(
                 admin_user_id=user.id,
                 admin_username=user.username,
             )
-            await update.message.reply_text(
+            self._leaderboard_texts.clear()
+            await self._reply(
+                update,
                 f"✅ Migrated {updated_count} users to default title.",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
+                is_admin,
+                language,
             )
         except PermissionError:
-            await update.message.reply_text(
-                translate("errors.permission_denied", language),
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+            await self._reply(update, translate("errors.permission_denied", language), is_admin, language)
         except ValueError as e:
-            await update.message.reply_text(
-                f"❌ {str(e)}",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+            await self._reply(update, f"❌ {str(e)}", is_admin, language)
         except Exception as e:
-            await update.message.reply_text(
-                f"❌ Error: {str(e)}",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+            await self._reply(update, f"❌ Error: {str(e)}", is_admin, language)
 
+    @timed("delete_user")
     async def handle_delete_user(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /delete_user @username command (admin only)."""
         user = update.message.from_user
-        language = await get_user_language(self._user_repository, user.id)
         is_admin = self._admin_service.is_admin(user.id, user.username)
-
-        if not context.args:
-            await update.message.reply_text(
-                f"Delete user: /delete_user @username",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+        if not is_admin:
+            await self._deny(update, user)
             return
+        language = await get_user_language(self._user_repository, user.id)
 
-        if not is_admin:
-            await update.message.reply_text(
-                translate("errors.permission_denied", language),
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=False,
-                    language=language
-                )
-            )
+        if not context.args:
+            await self._reply(update, "Delete user: /delete_user @username", is_admin, language)
             return
 
-        username = context.args[0].replace("@", "")
-        target_user = await self._user_repository.get_by_username(username)
-        if not target_user:
-            await update.message.reply_text(
-                translate("errors.user_not_found", language),
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+        username = _parse_username(context.args[0])
+        if username is None:
+            await self._reply(update, translate("errors.user_not_found", language), is_admin, language)
             return
 
         try:
-            await self._delete_user_use_case.execute(
-                target_user.telegram_user_id,
-                user.id,
-                user.username
+            # Lookup and delete happen in the use case; no separate pre-fetch here
+            deleted = await self._delete_user_use_case.execute_by_username(
+                username, user.id, user.username
             )
-            await update.message.reply_text(
+            if not deleted:
+                await self._reply(update, translate("errors.user_not_found", language), is_admin, language)
+                return
+            self._leaderboard_texts.clear()
+            await self._reply(
+                update,
                 f"✅ User @{username} has been deleted successfully.",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
+                is_admin,
+                language,
             )
         except PermissionError:
-            await update.message.reply_text(
-                translate("errors.permission_denied", language),
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
-        except UserNotFoundError as e:
-            await update.message.reply_text(
-                f"❌ {str(e)}",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+            await self._reply(update, translate("errors.permission_denied", language), is_admin, language)
         except Exception as e:
-            await update.message.reply_text(
-                f"❌ Error: {str(e)}",
-                reply_markup=InlineKeyboardBuilder.build_main_keyboard(
-                    is_admin=is_admin,
-                    language=language
-                )
-            )
+            await self._reply(update, f"❌ Error: {str(e)}", is_admin, language)
@@ -1,5 +1,9 @@
 """Inline query handler for @BotName queries."""
 
+import asyncio
+from typing import Dict, Tuple
+
+import structlog
 from telegram import Update, InlineQueryResultArticle, InputTextMessageContent
 from telegram.ext import ContextTypes
 
@@ -7,10 +11,77 @@ from ...domain.repositories.user_repository import IUserRepository
 from ...application.services.admin_service import AdminService
 from ...infrastructure.i18n.translations import translate
 
+logger = structlog.get_logger(__name__)
+
+# Seconds Telegram may cache the (per-user) inline results on its side
+INLINE_RESULTS_CACHE_TIME = 300
+
+# Inline answers have their own concurrency budget, separate from message handling
+INLINE_QUERY_CONCURRENCY = 10
+
+# An inline answer that takes longer than this is useless to the typing user
+INLINE_ANSWER_TIMEOUT = 1.0
+
+
+def _build_results(is_admin: bool, language: str = "en") -> Tuple[InlineQueryResultArticle, ...]:
+    """Build the inline result articles (admins also get the admin entries)."""
+    results = [
+        InlineQueryResultArticle(
+            id="stats",
+            title=translate("buttons.my_stats", language),
+            description="Show your statistics",
+            input_message_content=InputTextMessageContent("/me"),
+        ),
+        InlineQueryResultArticle(
+            id="leaderboard",
+            title=translate("buttons.leaderboard", language),
+            description="Show leaderboard",
+            input_message_content=InputTextMessageContent("/leaderboard"),
+        ),
+        InlineQueryResultArticle(
+            id="help",
+            title=translate("buttons.help", language),
+            description="Show help message",
+            input_message_content=InputTextMessageContent("/help"),
+        ),
+    ]
+
+    if is_admin:
+        results.append(
+            InlineQueryResultArticle(
+                id="settings",
+                title=translate("buttons.settings", language),
+                description="Admin settings",
+                input_message_content=InputTextMessageContent("/help"),
+            )
+        )
+        results.append(
+            InlineQueryResultArticle(
+                id="lock_title",
+                title=translate("buttons.lock_title", language),
+                description="Lock user title (admin)",
+                input_message_content=InputTextMessageContent("/lock_title"),
+            )
+        )
+    return tuple(results)
+
+
+# Inline queries fire on every keystroke and the results never vary beyond
+# is_admin (inline queries are always answered in English), so build them once
+_INLINE_RESULTS: Dict[bool, Tuple[InlineQueryResultArticle, ...]] = {
+    is_admin: _build_results(is_admin) for is_admin in (False, True)
+}
+
 
 class InlineQueryHandler:
     """Handler for inline queries when user types @BotName."""
 
+    __slots__ = (
+        "_user_repository",
+        "_admin_service",
+        "_answer_slots",
+    )
+
     def __init__(
         self,
         user_repository: IUserRepository,
@@ -19,6 +90,7 @@ class InlineQueryHandler:
         """Initialize inline query handler with dependencies."""
         self._user_repository = user_repository
         self._admin_service = admin_service
+        self._answer_slots = asyncio.Semaphore(INLINE_QUERY_CONCURRENCY)
 
     async def handle_inline_query(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
@@ -29,49 +101,26 @@ class InlineQueryHandler:
             return
 
         user = inline_query.from_user
-        language = "en"  # Default language for inline queries
-        
-        # Check if user is admin
         is_admin = self._admin_service.is_admin(user.id, user.username)
 
-        # Build result articles
-        results = [
-            InlineQueryResultArticle(
-                id="stats",
-                title=translate("buttons.my_stats", language),
-                description="Show your statistics",
-                input_message_content=InputTextMessageContent("/me"),
-            ),
-            InlineQueryResultArticle(
-                id="leaderboard",
-                title=translate("buttons.leaderboard", language),
-                description="Show leaderboard",
-                input_message_content=InputTextMessageContent("/leaderboard"),
-            ),
-            InlineQueryResultArticle(
-                id="help",
-                title=translate("buttons.help", language),
-                description="Show help message",
-                input_message_content=InputTextMessageContent("/help"),
-            ),
-        ]
-
-        if is_admin:
-            results.append(
-                InlineQueryResultArticle(
-                    id="settings",
-                    title=translate("buttons.settings", language),
-                    description="Admin settings",
-                    input_message_content=InputTextMessageContent("/help"),
+        # is_personal: admins and other users get different result sets
+        async with self._answer_slots:
+            try:
+                await asyncio.wait_for(
+                    inline_query.answer(
+                        _INLINE_RESULTS[is_admin],
+                        cache_time=INLINE_RESULTS_CACHE_TIME,
+                        is_personal=True,
+                    ),
+                    timeout=INLINE_ANSWER_TIMEOUT,
                 )
-            )
-            results.append(
-                InlineQueryResultArticle(
-                    id="lock_title",
-                    title=translate("buttons.lock_title", language),
-                    description="Lock user title (admin)",
-                    input_message_content=InputTextMessageContent("/lock_title"),
+            except asyncio.TimeoutError:
+                # wait_for cancels the in-flight answerInlineQuery request, so Telegram
+                # may or may not have received it; either way the user has typed on
+                # and a later query gets answered instead. Frequent timeouts point at
+                # a saturated connection pool or a slow network, hence WARNING.
+                logger.warning(
+                    "Inline query answer timed out and was cancelled",
+                    user_id=user.id,
+                    timeout=INLINE_ANSWER_TIMEOUT,
                 )
-            )
-
-        await inline_query.answer(results, cache_time=0)
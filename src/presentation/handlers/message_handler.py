@@ -1,29 +1,47 @@
 """Message handler for monitoring @HowGayBot messages."""
 
+import asyncio
 from datetime import date
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from telegram import Update
 from telegram.ext import ContextTypes
 import structlog
 
 from ...domain.repositories.user_repository import IUserRepository
 from ...domain.value_objects.percentage import Percentage
-from ...application.services.message_parser import MessageParser
+from ...application.services.message_parser import HOWGAYBOT_USERNAMES, MessageParser
+from ...application.use_cases.register_user_use_case import RegisterUserUseCase
 from ...application.use_cases.update_title_use_case import UpdateTitleUseCase
 from ...domain.exceptions import TitleLockedError, InvalidPercentageError, UserNotFoundError
 from ..utils.localization import get_user_language
 from ...infrastructure.i18n.translations import translate
+from ...infrastructure.database.batch_loader import BatchLoader
 
 logger = structlog.get_logger(__name__)
 
+# Unknown users seen in @HowGayBot messages are registered together: one bulk
+# insert per window or per this many users, whichever comes first
+AUTO_REGISTER_WINDOW = 0.25
+AUTO_REGISTER_BATCH_SIZE = 100
+
 
 class MessageHandler:
     """Handler for processing messages from @HowGayBot."""
 
+    __slots__ = (
+        "_user_repository",
+        "_update_title_use_case",
+        "_register_user_use_case",
+        "_new_user_profiles",
+        "_new_users",
+        "_chat_locks",
+    )
+
     def __init__(
         self,
         user_repository: IUserRepository,
         update_title_use_case: UpdateTitleUseCase,
+        register_user_use_case: Optional[RegisterUserUseCase] = None,
     ):
         """
         Initialize message handler.
@@ -31,9 +49,24 @@ class MessageHandler:
         Args:
             user_repository: User repository interface
             update_title_use_case: Update title use case
+            register_user_use_case: If given, unknown users are registered
+                automatically instead of being ignored
         """
         self._user_repository = user_repository
         self._update_title_use_case = update_title_use_case
+        self._register_user_use_case = register_user_use_case
+        # telegram_user_id -> (username, display name) of users waiting to be registered
+        self._new_user_profiles: Dict[int, Tuple[Optional[str], Optional[str]]] = {}
+        self._new_users: Optional[BatchLoader[int, bool]] = None
+        if register_user_use_case is not None:
+            self._new_users = BatchLoader(
+                self._register_new_users,
+                max_batch_size=AUTO_REGISTER_BATCH_SIZE,
+                window=AUTO_REGISTER_WINDOW,
+            )
+        # chat_id -> [lock, number of handlers holding or waiting for it]; entries
+        # are dropped when the count reaches zero, so the dict stays small
+        self._chat_locks: Dict[int, List] = {}
 
     async def handle_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle incoming message - filter for @HowGayBot messages."""
@@ -62,56 +95,89 @@ class MessageHandler:
             logger.warning(
                 "Cannot identify target user for @HowGayBot message",
                 message_text=message.text,
-                reply_to_message_id=message.reply_to_message.message_id if message.reply_to_message else None,
-                via_bot=message.via_bot.username if message.via_bot else None
+                reply_to_message_id=getattr(message.reply_to_message, "message_id", None),
+                via_bot=getattr(message.via_bot, "username", None)
             )
             return
 
-        # Check if user exists in database
-        user = await self._user_repository.get_by_telegram_id(target_user.id)
-        if not user:
-            logger.warning(
-                "User not found in database for @HowGayBot message",
-                telegram_user_id=target_user.id,
-                username=target_user.username
-            )
-            return
+        # Messages from one chat are applied in order; different chats run in
+        # parallel (the handler is registered with block=False)
+        chat_id = message.chat_id
+        entry = self._chat_locks.get(chat_id)
+        if entry is None:
+            entry = self._chat_locks[chat_id] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                await self._apply_title_update(message, target_user, percentage)
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._chat_locks[chat_id]
 
-        # Process title update
+    async def _apply_title_update(self, message, target_user, percentage: Percentage) -> None:
+        """Update the target user's title from a parsed @HowGayBot message."""
+        # No separate existence check: the use case loads the user itself and
+        # raises UserNotFoundError for unregistered users
         try:
             message_date = message.date.date() if message.date else date.today()
-            await self._update_title_use_case.execute(
-                telegram_user_id=user.telegram_user_id,
-                percentage=percentage,
-                message_date=message_date
-            )
+            try:
+                await self._update_title_use_case.execute(
+                    telegram_user_id=target_user.id,
+                    percentage=percentage,
+                    message_date=message_date
+                )
+            except UserNotFoundError:
+                if self._new_users is None:
+                    raise
+                self._new_user_profiles[target_user.id] = (
+                    target_user.username, target_user.full_name
+                )
+                await self._new_users.load(target_user.id)
+                await self._update_title_use_case.execute(
+                    telegram_user_id=target_user.id,
+                    percentage=percentage,
+                    message_date=message_date
+                )
             logger.info(
                 "Title updated from @HowGayBot message",
-                user_id=user.id,
-                telegram_user_id=user.telegram_user_id,
-                percentage=int(percentage),
-                new_title=str(user.title)
+                telegram_user_id=target_user.id,
+                percentage=int(percentage)
             )
         except TitleLockedError:
             logger.info(
                 "Title update skipped - title is locked",
-                user_id=user.id,
-                telegram_user_id=user.telegram_user_id
+                telegram_user_id=target_user.id
             )
-        except UserNotFoundError as e:
-            logger.error(
-                "User not found during title update",
-                error=str(e),
-                telegram_user_id=user.telegram_user_id
+        except UserNotFoundError:
+            logger.warning(
+                "User not found in database for @HowGayBot message",
+                telegram_user_id=target_user.id,
+                username=target_user.username
             )
         except Exception as e:
             logger.error(
                 "Error processing @HowGayBot message",
                 error=str(e),
-                telegram_user_id=user.telegram_user_id,
+                telegram_user_id=target_user.id,
                 exc_info=True
             )
 
+    async def _register_new_users(self, telegram_user_ids: List[int]) -> Dict[int, bool]:
+        """Register a batch of unknown users with a single bulk insert."""
+        profiles = self._new_user_profiles
+        candidates = [
+            (telegram_user_id, *profiles.pop(telegram_user_id, (None, None)))
+            for telegram_user_id in telegram_user_ids
+        ]
+        created = await self._register_user_use_case.execute_many(candidates)
+        logger.info(
+            "Auto-registered users from @HowGayBot messages",
+            requested=len(candidates),
+            created=created
+        )
+        return {telegram_user_id: True for telegram_user_id in telegram_user_ids}
+
     async def _identify_target_user(self, message) -> Optional:
         """
         Identify target user from message context.
@@ -127,7 +193,7 @@ class MessageHandler:
             Target user (from_user) or None if cannot identify
         """
         # If message is sent via @HowGayBot, the from_user is the actual user
-        if message.via_bot and message.via_bot.username == "HowGayBot":
+        if getattr(message.via_bot, "username", None) in HOWGAYBOT_USERNAMES:
             if message.from_user:
                 return message.from_user
         
@@ -1,14 +1,21 @@
 """Inline keyboard builder for Telegram bot."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 
 from ...infrastructure.i18n.translations import translate
 
+# Keyboards only depend on their arguments and PTB markups are immutable,
+# so each variant is built once and shared
+_MAIN_KEYBOARDS: Dict[Tuple[str, bool], InlineKeyboardMarkup] = {}
+_BACK_KEYBOARDS: Dict[str, InlineKeyboardMarkup] = {}
+
 
 class InlineKeyboardBuilder:
     """Builder for inline keyboards."""
 
+    __slots__ = ()
+
     @staticmethod
     def build_main_keyboard(
         is_admin: bool = False, language: str = "en"
@@ -23,6 +30,15 @@ class InlineKeyboardBuilder:
         Returns:
             InlineKeyboardMarkup with buttons
         """
+        keyboard = _MAIN_KEYBOARDS.get((language, is_admin))
+        if keyboard is None:
+            keyboard = InlineKeyboardBuilder._build_main_keyboard(is_admin, language)
+            _MAIN_KEYBOARDS[(language, is_admin)] = keyboard
+        return keyboard
+
+    @staticmethod
+    def _build_main_keyboard(is_admin: bool, language: str) -> InlineKeyboardMarkup:
+        """Build the main keyboard (uncached)."""
         buttons: List[List[InlineKeyboardButton]] = [
             [
                 InlineKeyboardButton(
@@ -75,6 +91,10 @@ class InlineKeyboardBuilder:
         Returns:
             InlineKeyboardMarkup with back button
         """
+        keyboard = _BACK_KEYBOARDS.get(language)
+        if keyboard is not None:
+            return keyboard
+
         buttons: List[List[InlineKeyboardButton]] = [
             [
                 InlineKeyboardButton(
@@ -84,7 +104,9 @@ class InlineKeyboardBuilder:
             ]
         ]
         
-        return InlineKeyboardMarkup(buttons)
+        keyboard = InlineKeyboardMarkup(buttons)
+        _BACK_KEYBOARDS[language] = keyboard
+        return keyboard
     
     @staticmethod
     def build_settings_keyboard(language: str = "en") -> InlineKeyboardMarkup:
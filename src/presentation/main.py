@@ -1,13 +1,23 @@
 """Main entry point for Telegram bot application."""
 
 import asyncio
+import hashlib
+import json
 import os
 import signal
+import tempfile
+from dataclasses import dataclass
+from typing import Optional
 import structlog
-from telegram import BotCommand
+from telegram import BotCommand, Update
 from telegram.ext import ApplicationBuilder, CommandHandler, MessageHandler as TelegramMessageHandler, CallbackQueryHandler, InlineQueryHandler as TelegramInlineQueryHandler, filters
 from telegram.error import Conflict
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 from src.infrastructure.config.settings import settings as app_settings
 from src.infrastructure.database.supabase_client import SupabaseClient
 from src.infrastructure.logging.logger import configure_logging, get_logger
@@ -37,10 +47,11 @@ from src.application.use_cases.migrate_users_to_default_title_use_case import Mi
 from src.application.use_cases.delete_user_use_case import DeleteUserUseCase
 
 # Services
-from src.application.services.message_parser import MessageParser
+from src.application.services.message_parser import HOWGAYBOT_USERNAMES, MessageParser
 from src.application.services.admin_service import AdminService
 from src.domain.services.title_calculation_service import TitleCalculationService
 from src.infrastructure.telegram.telegram_user_resolver import TelegramUserResolver
+from src.infrastructure.telegram.send_queue import SendQueue
 
 # Handlers
 from src.presentation.handlers.command_handlers import CommandHandlers
@@ -54,8 +65,82 @@ from src.presentation.errors.error_handler import error_handler
 configure_logging(log_level="INFO")
 logger = get_logger(__name__)
 
-
-def setup_dependencies(bot_instance=None):
+# Update types the registered handlers consume (commands, @HowGayBot and
+# new-member messages, button presses, inline queries); Telegram does not
+# deliver the rest (edits, channel posts, polls, ...)
+ALLOWED_UPDATES = [Update.MESSAGE, Update.CALLBACK_QUERY, Update.INLINE_QUERY]
+
+# (command, CommandHandlers method, block). Bulk admin commands (full-table
+# writes, cascading deletes) run with block=False so they do not hold up other updates.
+COMMAND_HANDLERS = (
+    ("start", "handle_start", True),
+    ("register", "handle_register", True),
+    ("me", "handle_me", True),
+    ("who", "handle_who", True),
+    ("leaderboard", "handle_leaderboard", True),
+    ("stats", "handle_stats", True),
+    ("help", "handle_help", True),
+    ("chat_id", "handle_chat_id", True),
+    ("add_user", "handle_add_user", True),
+    ("set_default_title", "handle_set_default_title", True),
+    ("migrate_users_to_default_title", "handle_migrate_users_to_default_title", False),
+    ("lock_title", "handle_lock_title", True),
+    ("unlock_title", "handle_unlock_title", True),
+    ("set_full_title", "handle_set_full_title", True),
+    ("set_title", "handle_set_full_title", True),  # Alias for set_full_title
+    ("set_full_title_for_all", "handle_set_full_title_for_all", False),
+    ("set_global_average_period", "handle_set_global_average_period", True),
+    ("delete_user", "handle_delete_user", False),
+)
+
+# Command menu shown by Telegram clients (BotCommand objects are immutable)
+BOT_COMMANDS = (
+    BotCommand("start", "Start the bot"),
+    BotCommand("register", "Register yourself with the bot"),
+    BotCommand("me", "Show your stats"),
+    BotCommand("who", "Show user stats"),
+    BotCommand("leaderboard", "Show leaderboard"),
+    BotCommand("stats", "Show statistics"),
+    BotCommand("chat_id", "Show current chat ID"),
+    BotCommand("help", "Show help message"),
+)
+# Fingerprint of BOT_COMMANDS, compared with the one stored at the last registration
+BOT_COMMANDS_HASH = hashlib.sha256(
+    json.dumps([(c.command, c.description) for c in BOT_COMMANDS]).encode()
+).hexdigest()
+# bot_settings key holding the hash of the command menu last sent to Telegram
+BOT_COMMANDS_HASH_KEY = "bot_commands_hash"
+
+# Text messages sent by or via @HowGayBot. Built once; the sender check comes
+# first because it rejects almost every message, so the rest is rarely evaluated.
+HOWGAYBOT_MESSAGE_FILTER = (
+    (filters.User(username=list(HOWGAYBOT_USERNAMES)) | filters.ViaBot(username=list(HOWGAYBOT_USERNAMES)))
+    & filters.TEXT
+    & ~filters.COMMAND
+)
+
+# Held (flock) for the lifetime of the process so a second local instance can
+# detect the first one
+INSTANCE_LOCK_PATH = os.path.join(tempfile.gettempdir(), "check_titles_tg_bot.lock")
+
+
+@dataclass(slots=True)
+class Dependencies:
+    """Objects wired by setup_dependencies that main() needs."""
+
+    command_handlers: CommandHandlers
+    message_handler: MessageHandler
+    callback_handler: CallbackHandler
+    inline_query_handler: InlineQueryHandler
+    chat_member_handler: ChatMemberHandler
+    scheduler: JobScheduler
+    send_queue: Optional[SendQueue]
+    user_repository: SupabaseUserRepository  # Shared with the error handler via bot_data
+    settings_repository: SupabaseSettingsRepository
+    add_user_use_case: Optional[AddUserUseCase]  # May be None if bot_instance not available yet
+
+
+def setup_dependencies(bot_instance=None) -> Dependencies:
     """Setup and wire all dependencies.
     
     Args:
@@ -195,6 +280,7 @@ def setup_dependencies(bot_instance=None):
     message_handler = MessageHandler(
         user_repository=user_repository,
         update_title_use_case=update_title_use_case,
+        register_user_use_case=register_user_use_case if app_settings.AUTO_REGISTER_USERS else None,
     )
 
     callback_handler = CallbackHandler(
@@ -209,56 +295,82 @@ def setup_dependencies(bot_instance=None):
         admin_service=admin_service,
     )
 
-    chat_member_handler = ChatMemberHandler(user_repository=user_repository)
+    # Outgoing message queue (needs the bot; started after polling starts)
+    send_queue = SendQueue(bot_instance) if bot_instance else None
+
+    chat_member_handler = ChatMemberHandler(
+        user_repository=user_repository,
+        send_queue=send_queue,
+    )
+
+    return Dependencies(
+        command_handlers=command_handlers,
+        message_handler=message_handler,
+        callback_handler=callback_handler,
+        inline_query_handler=inline_query_handler,
+        chat_member_handler=chat_member_handler,
+        scheduler=scheduler,
+        send_queue=send_queue,
+        user_repository=user_repository,
+        settings_repository=settings_repository,
+        add_user_use_case=add_user_use_case,
+    )
+
 
-    return {
-        "command_handlers": command_handlers,
-        "message_handler": message_handler,
-        "callback_handler": callback_handler,
-        "inline_query_handler": inline_query_handler,
-        "chat_member_handler": chat_member_handler,
-        "scheduler": scheduler,
-        "add_user_use_case": add_user_use_case,  # Return for potential updates
-    }
+def _acquire_instance_lock() -> Optional[int]:
+    """
+    Take an exclusive, non-blocking flock on INSTANCE_LOCK_PATH.
 
+    The lock is released by the OS when the process exits, however it exits.
 
-async def main():
-    """Main application entry point."""
-    logger.info("Starting Telegram bot application")
+    Returns:
+        The open lock file descriptor (keep it open), or None where flock is
+        unavailable (e.g. Windows)
 
-    # Check for other running instances (warn only, don't block)
-    import subprocess
+    Raises:
+        BlockingIOError: If another local instance holds the lock
+    """
+    if fcntl is None:
+        return None
+    fd = os.open(INSTANCE_LOCK_PATH, os.O_RDWR | os.O_CREAT, 0o644)
     try:
-        result = subprocess.run(
-            ["ps", "aux"],
-            capture_output=True,
-            text=True,
-            timeout=2
-        )
-        bot_processes = [
-            line for line in result.stdout.split('\n')
-            if 'python' in line.lower() and 'bot' in line.lower() and 'grep' not in line
-            and ('src.presentation.main' in line or 'bot.py' in line or 'main.py' in line)
-        ]
-        # Filter out current process
-        bot_processes = [p for p in bot_processes if str(os.getpid()) not in p]
-        
-        if bot_processes:
-            logger.warning(
-                f"⚠️  Found {len(bot_processes)} other bot process(es) that might be running:"
-            )
-            for proc in bot_processes[:3]:  # Show first 3
-                logger.warning(f"   {proc.strip()[:100]}")
-            logger.warning(
-                "   If you get Conflict errors, stop these processes first:"
-            )
-            logger.warning("   pkill -f 'python.*bot' && pkill -f 'src.presentation.main'")
-    except Exception:
-        # If ps command fails, skip the check
-        pass
-
-    # Test database connection
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(fd)
+        raise
+    return fd
+
+
+async def _prepare_database(settings_repository) -> None:
+    """Connect to the database, then preload settings (preload failures are not fatal)."""
+    await _connect_database()
+    try:
+        await settings_repository.preload()
+    except Exception as e:
+        logger.warning("Could not preload settings", error=str(e))
+
+
+async def _register_bot_commands(bot, settings_repository) -> None:
+    """
+    Send the command menu to Telegram if it changed since the last start.
+
+    Telegram keeps the menu server-side, so the setMyCommands call is skipped
+    while the stored hash matches BOT_COMMANDS.
+    """
+    if await settings_repository.get(BOT_COMMANDS_HASH_KEY) == BOT_COMMANDS_HASH:
+        logger.info("Bot commands unchanged, skipping registration")
+        return
+    await bot.set_my_commands(BOT_COMMANDS)
+    await settings_repository.set(
+        BOT_COMMANDS_HASH_KEY, BOT_COMMANDS_HASH, "Hash of the command menu last registered with Telegram"
+    )
+    logger.info("Bot commands registered with Telegram API")
+
+
+async def _connect_database() -> None:
+    """Create the shared database client and test the connection."""
     try:
+        await SupabaseClient.initialize()
         await SupabaseClient.test_connection()
         logger.info("Database connection successful")
     except Exception as e:
@@ -271,55 +383,90 @@ async def main():
             logger.error("Missing Supabase environment variables. Please set SUPABASE_URL and SUPABASE_KEY")
         raise ConnectionError(f"Database connection failed: {str(e)}") from e
 
+
+async def _register_bot_commands_safely(bot, settings_repository) -> None:
+    """_register_bot_commands, logging failures instead of raising (the menu is optional)."""
+    try:
+        await _register_bot_commands(bot, settings_repository)
+    except Exception as e:
+        logger.warning(f"Could not register bot commands: {str(e)}")
+
+
+async def main():
+    """Main application entry point."""
+    logger.info("Starting Telegram bot application")
+
+    # Refuse to start next to another instance on this host (both would poll
+    # getUpdates and fail with Conflict). The descriptor is deliberately never
+    # closed: the lock is held until the process exits and the OS releases it.
+    try:
+        _acquire_instance_lock()
+    except BlockingIOError:
+        logger.error(
+            "❌ Another bot instance is already running on this host",
+            lock_file=INSTANCE_LOCK_PATH
+        )
+        return
+
     # Create Telegram application (app.bot is available after build())
-    app = ApplicationBuilder().token(app_settings.TELEGRAM_BOT_TOKEN).build()
+    # Replies can burst (/leaderboard, /start); a larger pool wait avoids PoolTimeout
+    # errors. getUpdates keeps its own single-connection pool. Updates from
+    # different users are processed concurrently (bounded), so one slow database
+    # call does not hold up everyone else; ordering where it matters (messages in
+    # one chat) is kept by the handlers themselves.
+    app = (
+        ApplicationBuilder()
+        .token(app_settings.TELEGRAM_BOT_TOKEN)
+        .connection_pool_size(app_settings.TELEGRAM_CONNECTION_POOL_SIZE)
+        .pool_timeout(app_settings.TELEGRAM_POOL_TIMEOUT)
+        .get_updates_connection_pool_size(1)
+        .concurrent_updates(app_settings.TELEGRAM_CONCURRENT_UPDATES)
+        .build()
+    )
 
     # Setup dependencies (after app.bot is available for TelegramUserResolver)
     handlers = setup_dependencies(bot_instance=app.bot)
 
+    # Connect to the database and warm the settings cache while the Telegram
+    # application is initialized (both are network-bound and independent)
+    database_ready = asyncio.create_task(_prepare_database(handlers.settings_repository))
+
     # Register command handlers
-    app.add_handler(CommandHandler("start", handlers["command_handlers"].handle_start))
-    app.add_handler(CommandHandler("register", handlers["command_handlers"].handle_register))
-    app.add_handler(CommandHandler("me", handlers["command_handlers"].handle_me))
-    app.add_handler(CommandHandler("who", handlers["command_handlers"].handle_who))
-    app.add_handler(CommandHandler("leaderboard", handlers["command_handlers"].handle_leaderboard))
-    app.add_handler(CommandHandler("stats", handlers["command_handlers"].handle_stats))
-    app.add_handler(CommandHandler("help", handlers["command_handlers"].handle_help))
-    app.add_handler(CommandHandler("chat_id", handlers["command_handlers"].handle_chat_id))
-    app.add_handler(CommandHandler("add_user", handlers["command_handlers"].handle_add_user))
-    app.add_handler(CommandHandler("set_default_title", handlers["command_handlers"].handle_set_default_title))
-    app.add_handler(CommandHandler("migrate_users_to_default_title", handlers["command_handlers"].handle_migrate_users_to_default_title))
-    app.add_handler(CommandHandler("lock_title", handlers["command_handlers"].handle_lock_title))
-    app.add_handler(CommandHandler("unlock_title", handlers["command_handlers"].handle_unlock_title))
-    app.add_handler(CommandHandler("set_full_title", handlers["command_handlers"].handle_set_full_title))
-    app.add_handler(CommandHandler("set_title", handlers["command_handlers"].handle_set_full_title))  # Alias for set_full_title
-    app.add_handler(CommandHandler("set_full_title_for_all", handlers["command_handlers"].handle_set_full_title_for_all))
-    app.add_handler(CommandHandler("set_global_average_period", handlers["command_handlers"].handle_set_global_average_period))
-    app.add_handler(CommandHandler("delete_user", handlers["command_handlers"].handle_delete_user))
+    command_handlers = handlers.command_handlers
+    app.add_handlers([
+        CommandHandler(command, getattr(command_handlers, method), block=blocking)
+        for command, method, blocking in COMMAND_HANDLERS
+    ])
 
     # Register message handler (filter for group messages to monitor @HowGayBot)
+    # (non-blocking; the handler itself keeps messages from one chat in order)
     app.add_handler(
         TelegramMessageHandler(
-            filters.TEXT & (~filters.COMMAND),
-            handlers["message_handler"].handle_message
+            HOWGAYBOT_MESSAGE_FILTER,
+            handlers.message_handler.handle_message,
+            block=False,
         )
     )
 
     # Register callback query handler
-    app.add_handler(CallbackQueryHandler(handlers["callback_handler"].handle_callback))
+    app.add_handler(CallbackQueryHandler(handlers.callback_handler.handle_callback))
 
     # Register inline query handler
-    app.add_handler(TelegramInlineQueryHandler(handlers["inline_query_handler"].handle_inline_query))
+    # Non-blocking: inline answers must not wait behind slower message handlers
+    app.add_handler(
+        TelegramInlineQueryHandler(handlers.inline_query_handler.handle_inline_query, block=False)
+    )
 
     # Register chat member handler for bot-added-to-group events
     app.add_handler(
         TelegramMessageHandler(
             filters.StatusUpdate.NEW_CHAT_MEMBERS,
-            handlers["chat_member_handler"].handle_new_chat_members
+            handlers.chat_member_handler.handle_new_chat_members
         )
     )
 
-    # Register global error handler
+    # Register global error handler (replies in the user's language)
+    app.bot_data["user_repository"] = handlers.user_repository
     app.add_error_handler(error_handler)
 
     logger.info("Bot application configured, starting polling")
@@ -345,50 +492,26 @@ async def main():
         if hasattr(signal, 'SIGTERM'):
             signal.signal(signal.SIGTERM, handle_shutdown)
     
+    # Finish the database setup together with PTB's initialize() (getMe)
+    results = await asyncio.gather(database_ready, app.initialize(), return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            await app.shutdown()
+            raise result
+
     # Use context manager for proper lifecycle management
-    # This automatically handles initialize() and shutdown()
+    # This automatically handles shutdown() (initialize() already ran above)
     async with app:
         # Initialize and start application
         await app.start()
         
-        # Ensure webhook is deleted (in case one was set previously)
-        # This is necessary to avoid conflicts with polling
-        try:
-            webhook_info = await app.bot.get_webhook_info()
-            if webhook_info.url:
-                logger.warning(f"Webhook detected: {webhook_info.url}. Deleting it...")
-                await app.bot.delete_webhook(drop_pending_updates=True)
-                logger.info("Webhook deleted successfully")
-            else:
-                logger.info("No webhook configured, ready for polling")
-        except Exception as e:
-            logger.warning("Could not check/delete webhook", error=str(e))
-            # Try to delete anyway
-            try:
-                await app.bot.delete_webhook(drop_pending_updates=True)
-            except Exception:
-                pass  # Ignore if it fails
-        
-        # Register bot commands with Telegram API (so they appear in the menu)
-        try:
-            commands = [
-                BotCommand("start", "Start the bot"),
-                BotCommand("register", "Register yourself with the bot"),
-                BotCommand("me", "Show your stats"),
-                BotCommand("who", "Show user stats"),
-                BotCommand("leaderboard", "Show leaderboard"),
-                BotCommand("stats", "Show statistics"),
-                BotCommand("chat_id", "Show current chat ID"),
-                BotCommand("help", "Show help message"),
-            ]
-            await app.bot.set_my_commands(commands)
-            logger.info("Bot commands registered with Telegram API")
-        except Exception as e:
-            logger.warning(f"Could not register bot commands: {str(e)}")
+        # Register the command menu. No separate webhook check: start_polling
+        # always calls deleteWebhook (with drop_pending_updates) while bootstrapping
+        await _register_bot_commands_safely(app.bot, handlers.settings_repository)
         
-        # Small delay to allow any previous instance to fully shut down
-        # This helps avoid transient conflicts during container restarts
-        await asyncio.sleep(2)
+        # No startup delay: the instance lock rules out a local instance, and
+        # others (e.g. the old container during a restart) show up as Conflict
+        # errors, which the retry loop below waits out
         
         # Start polling with error handling and retry logic
         max_retries = 3
@@ -397,7 +520,9 @@ async def main():
         
         for attempt in range(1, max_retries + 1):
             try:
-                await app.updater.start_polling(drop_pending_updates=True)
+                await app.updater.start_polling(
+                    drop_pending_updates=True, allowed_updates=ALLOWED_UPDATES
+                )
                 logger.info("Bot polling started successfully")
                 polling_started = True
                 break
@@ -430,8 +555,10 @@ async def main():
             raise RuntimeError("Failed to start polling after all retries")
         
         # Start scheduler (after polling starts)
-        handlers["scheduler"].start()
+        handlers.scheduler.start()
         logger.info("Job scheduler started")
+        if handlers.send_queue:
+            handlers.send_queue.start()
         
         logger.info("Bot is running. Press Ctrl+C to stop.")
         
@@ -441,15 +568,30 @@ async def main():
         finally:
             # Shutdown in reverse order
             logger.info("Shutting down...")
-            handlers["scheduler"].shutdown()
+            handlers.scheduler.shutdown()
             logger.info("Job scheduler stopped")
+            if handlers.send_queue:
+                await handlers.send_queue.stop()
             
             await app.updater.stop()
             await app.stop()
+            await SupabaseClient.close()
             logger.info("Bot application shut down")
 
 
+def _install_uvloop() -> None:
+    """Use uvloop's libuv-based event loop when it is installed (not available on Windows)."""
+    try:
+        import uvloop
+    except ImportError:
+        logger.info("uvloop not installed, using the default asyncio event loop")
+        return
+    uvloop.install()
+    logger.info("Using uvloop event loop", uvloop_version=uvloop.__version__)
+
+
 if __name__ == "__main__":
+    _install_uvloop()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
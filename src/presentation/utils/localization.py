@@ -1,17 +1,16 @@
 """Localization utilities for presentation layer."""
 
-from typing import Optional
-
 from ...domain.repositories.user_repository import IUserRepository
 from ...infrastructure.i18n.translations import translate, format_translated_message
 
 
-async def get_user_language(
-    user_repository: IUserRepository, telegram_user_id: int
-) -> str:
+async def get_user_language(user_repository: IUserRepository, telegram_user_id: int) -> str:
     """
     Get user's language preference from database.
     
+    The repository keeps languages in a bounded TTL cache that is invalidated
+    whenever the user is saved or deleted, so this is usually free.
+
     Args:
         user_repository: User repository interface
         telegram_user_id: Telegram user ID
@@ -19,24 +18,7 @@ async def get_user_language(
     Returns:
         Language code ('en' or 'ru'), default 'en'
     """
-    user = await user_repository.get_by_telegram_id(telegram_user_id)
-    if not user:
-        return "en"
-    return user.language
-
-
-def get_translated_message(
-    user_repository: IUserRepository,
-    telegram_user_id: int,
-    key: str,
-) -> str:
-    """
-    Get translated message for user (async wrapper).
-    
-    Note: This is a synchronous wrapper - use get_translated_message_async for async.
-    """
-    # For sync usage, default to English (async version should be used)
-    return translate(key, "en")
+    return await user_repository.get_language_by_telegram_id(telegram_user_id)
 
 
 async def get_translated_message_async(
@@ -79,3 +61,4 @@ async def format_translated_message_async(
     """
     language = await get_user_language(user_repository, telegram_user_id)
     return format_translated_message(key, language, **kwargs)
+
@@ -0,0 +1,125 @@
+"""Menu texts rendered once per language at import time."""
+
+from typing import Dict, Tuple
+
+from ...infrastructure.i18n.translations import TRANSLATIONS, translate
+
+
+# Argument syntax of commands whose usage hint starts with the translated command name
+_USAGE_SYNTAX: Dict[str, str] = {
+    "who": "/who @username",
+    "lock_title": "/lock_title @username",
+    "unlock_title": "/unlock_title @username",
+    "set_full_title": "/set_full_title @username <full_title>",
+    "set_global_average_period": "/set_global_average_period <days>",
+}
+
+
+def _render_settings_text(language: str) -> str:
+    """Render the admin settings menu text."""
+    return (
+        f"⚙️ {translate('buttons.settings', language)}\n\n"
+        f"{translate('commands.available_commands', language)}:\n"
+        f"• /lock_title @username - {translate('commands.lock_title', language)}\n"
+        f"• /unlock_title @username - {translate('commands.unlock_title', language)}\n"
+        f"• /set_full_title @username <title> - {translate('commands.set_full_title', language)}\n"
+        f"• /set_global_average_period <days> - {translate('commands.set_global_average_period', language)}\n"
+    )
+
+
+def _render_start_text(language: str, is_admin: bool) -> str:
+    """Render the /start reply (admins also get the admin command list)."""
+    lines = [
+        f"👋 {translate('commands.welcome', language)}",
+        "",
+        f"{translate('commands.available_commands', language)}:",
+        "• /register - Register yourself with the bot",
+        f"• /me - {translate('commands.me', language)}",
+        f"• /who @username - {translate('commands.who', language)}",
+        f"• /leaderboard - {translate('commands.leaderboard', language)}",
+        f"• /stats [days] - {translate('commands.stats', language)}",
+        "• /chat_id - Show current chat ID (useful for /add_user)",
+        "• /help - Show help message",
+    ]
+    if is_admin:
+        lines += [
+            "",
+            f"🔧 {translate('commands.admin_commands', language)}:",
+            "• /add_user @username [chat_id] - Add user manually (chat_id optional, defaults to current chat)",
+            "• /delete_user @username - Delete user",
+            "• /set_default_title <title> - Set default title for new users",
+            "• /migrate_users_to_default_title - Migrate all users to default title",
+            f"• /lock_title @username - {translate('commands.lock_title', language)}",
+            f"• /unlock_title @username - {translate('commands.unlock_title', language)}",
+            f"• /set_full_title @username <title> - {translate('commands.set_full_title', language)}",
+            f"• /set_title @username <title> - {translate('commands.set_full_title', language)} (alias)",
+            "• /set_full_title_for_all <title> - Set full title for all users",
+            f"• /set_global_average_period <days> - {translate('commands.set_global_average_period', language)}",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def _render_lock_title_text(language: str) -> str:
+    """Render the lock title help text."""
+    return (
+        f"🔒 {translate('buttons.lock_title', language)}\n\n"
+        "Use /lock_title @username to lock a user's title\n\n"
+        "Example: /lock_title @john_doe"
+    )
+
+
+def _render_stats_templates(language: str) -> Tuple[str, str, str, str]:
+    """Render the user stats header and line templates ({title}, {percentage}, {position})."""
+    return (
+        f"📊 {translate('stats.user_stats', language)}\n",
+        f"{translate('stats.title', language)}: {{title}}",
+        f"{translate('stats.percentage', language)}: {{percentage}}%",
+        f"{translate('stats.position', language)}: #{{position}}",
+    )
+
+
+# Static menu texts per supported language (TRANSLATIONS is immutable at runtime)
+SETTINGS_TEXT_BY_LANG: Dict[str, str] = {
+    language: _render_settings_text(language) for language in TRANSLATIONS
+}
+START_TEXT_BY_LANG: Dict[Tuple[str, bool], str] = {
+    (language, is_admin): _render_start_text(language, is_admin)
+    for language in TRANSLATIONS
+    for is_admin in (False, True)
+}
+USAGE_TEXT_BY_LANG: Dict[Tuple[str, str], str] = {
+    (command, language): f"{translate(f'commands.{command}', language)}: {syntax}"
+    for command, syntax in _USAGE_SYNTAX.items()
+    for language in TRANSLATIONS
+}
+LOCK_TITLE_TEXT_BY_LANG: Dict[str, str] = {
+    language: _render_lock_title_text(language) for language in TRANSLATIONS
+}
+STATS_TEMPLATES_BY_LANG: Dict[str, Tuple[str, str, str, str]] = {
+    language: _render_stats_templates(language) for language in TRANSLATIONS
+}
+
+
+def get_settings_text(language: str) -> str:
+    """Get the settings menu text (English for unsupported languages)."""
+    return SETTINGS_TEXT_BY_LANG.get(language) or SETTINGS_TEXT_BY_LANG["en"]
+
+
+def get_start_text(language: str, is_admin: bool) -> str:
+    """Get the /start reply text (English for unsupported languages)."""
+    return START_TEXT_BY_LANG.get((language, is_admin)) or START_TEXT_BY_LANG[("en", is_admin)]
+
+
+def get_usage_text(command: str, language: str) -> str:
+    """Get the usage hint for a command in _USAGE_SYNTAX (English for unsupported languages)."""
+    return USAGE_TEXT_BY_LANG.get((command, language)) or USAGE_TEXT_BY_LANG[(command, "en")]
+
+
+def get_lock_title_text(language: str) -> str:
+    """Get the lock title help text (English for unsupported languages)."""
+    return LOCK_TITLE_TEXT_BY_LANG.get(language) or LOCK_TITLE_TEXT_BY_LANG["en"]
+
+
+def get_stats_templates(language: str) -> Tuple[str, str, str, str]:
+    """Get (header, title line, percentage line, position line) user stats templates."""
+    return STATS_TEMPLATES_BY_LANG.get(language) or STATS_TEMPLATES_BY_LANG["en"]
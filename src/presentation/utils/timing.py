@@ -0,0 +1,55 @@
+"""Latency instrumentation for update handlers."""
+
+import functools
+import time
+from typing import Any, Awaitable, Callable, TypeVar
+
+import structlog
+from telegram import Update
+from telegram.ext import ContextTypes
+
+logger = structlog.get_logger(__name__)
+
+# Handlers slower than this (seconds) are logged at WARNING, the rest at DEBUG
+SLOW_HANDLER_THRESHOLD = 1.0
+
+HandlerMethod = TypeVar(
+    "HandlerMethod", bound=Callable[[Any, Update, ContextTypes.DEFAULT_TYPE], Awaitable[Any]]
+)
+
+
+def timed(name: str) -> Callable[[HandlerMethod], HandlerMethod]:
+    """
+    Log how long a handler method takes.
+
+    Every call is logged at DEBUG with its duration; calls slower than
+    SLOW_HANDLER_THRESHOLD are logged at WARNING, so hot paths can be found in
+    production logs without enabling DEBUG.
+
+    Args:
+        name: Handler name used in the log entry (e.g. the command)
+    """
+
+    def decorator(method: HandlerMethod) -> HandlerMethod:
+        @functools.wraps(method)
+        async def wrapper(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+            started = time.perf_counter()
+            try:
+                return await method(self, update, context)
+            finally:
+                elapsed = time.perf_counter() - started
+                user = update.effective_user
+                fields = {
+                    "handler": name,
+                    "duration_ms": round(elapsed * 1000, 1),
+                    "user_id": user.id if user else None,
+                    "args_count": len(context.args) if context.args else 0,
+                }
+                if elapsed >= SLOW_HANDLER_THRESHOLD:
+                    logger.warning("Slow handler", **fields)
+                else:
+                    logger.debug("Handler finished", **fields)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -0,0 +1,64 @@
+"""Unit tests for batched repository lookups."""
+
+import asyncio
+
+import pytest
+
+from src.infrastructure.database.batch_loader import BatchLoader
+
+
+class TestBatchLoader:
+    """Test cases for BatchLoader."""
+
+    async def test_concurrent_loads_share_one_batch(self):
+        """Test concurrent loads are deduplicated into one batch call."""
+        calls = []
+
+        async def batch_load(keys):
+            calls.append(keys)
+            return {key: key * 10 for key in keys}
+
+        loader = BatchLoader(batch_load)
+        results = await asyncio.gather(*(loader.load(key) for key in [3, 1, 2, 1]))
+        assert results == [30, 10, 20, 10]
+        assert calls == [[3, 1, 2]]
+
+    async def test_missing_keys_resolve_to_none(self):
+        """Test keys absent from the batch result resolve to None."""
+        async def batch_load(keys):
+            return {key: str(key) for key in keys if key % 2 == 0}
+
+        loader = BatchLoader(batch_load)
+        results = await asyncio.gather(*(loader.load(key) for key in range(4)))
+        assert results == ["0", None, "2", None]
+
+    async def test_batches_are_split_at_max_batch_size(self):
+        """Test no batch call receives more than max_batch_size keys."""
+        calls = []
+
+        async def batch_load(keys):
+            calls.append(keys)
+            return {key: key for key in keys}
+
+        loader = BatchLoader(batch_load, max_batch_size=2)
+        results = await asyncio.gather(*(loader.load(key) for key in range(5)))
+        assert results == [0, 1, 2, 3, 4]
+        assert all(len(keys) <= 2 for keys in calls)
+        assert sorted(key for keys in calls for key in keys) == [0, 1, 2, 3, 4]
+
+    async def test_cancelled_batch_does_not_hang_callers(self):
+        """Test cancelling the batch query (e.g. at shutdown) cancels waiting loads."""
+        started = asyncio.Event()
+
+        async def batch_load(keys):
+            started.set()
+            await asyncio.Event().wait()
+
+        loader = BatchLoader(batch_load)
+        load = asyncio.create_task(loader.load(1))
+        await started.wait()
+
+        for task in list(loader._tasks):
+            task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(load, 1)
@@ -1,21 +1,36 @@
 """Unit tests for message parser."""
 
+from types import SimpleNamespace
+
 import pytest
 from src.application.services.message_parser import MessageParser
 from src.domain.value_objects.percentage import Percentage
 from src.domain.exceptions import InvalidPercentageError
 
 
+def _message(from_username=None, via_username=None):
+    """Minimal stand-in for telegram.Message with the attributes the parser reads."""
+    from_user = SimpleNamespace(username=from_username) if from_username else None
+    via_bot = SimpleNamespace(username=via_username) if via_username else None
+    return SimpleNamespace(from_user=from_user, via_bot=via_bot)
+
+
 class TestMessageParser:
     """Test cases for MessageParser."""
 
     def test_should_process_message_from_howgaybot(self):
         """Test message from @HowGayBot should be processed."""
-        assert MessageParser.should_process_message("HowGayBot") is True
+        assert MessageParser.should_process_message(_message(from_username="HowGayBot")) is True
+
+    def test_should_process_message_via_howgaybot(self):
+        """Test message sent via @HowGayBot should be processed."""
+        message = _message(from_username="someone", via_username="HowGayBot")
+        assert MessageParser.should_process_message(message) is True
 
     def test_should_not_process_message_from_other_bot(self):
         """Test message from other bot should not be processed."""
-        assert MessageParser.should_process_message("OtherBot") is False
+        assert MessageParser.should_process_message(_message(from_username="OtherBot")) is False
+        assert MessageParser.should_process_message(_message()) is False
 
     def test_extract_percentage_valid(self):
         """Test extracting percentage from valid message."""
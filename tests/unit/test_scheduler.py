@@ -0,0 +1,24 @@
+"""Unit tests for job scheduler timing."""
+
+from datetime import datetime, timezone
+
+from src.infrastructure.jobs.scheduler import _next_utc_midnight
+
+
+class TestNextUtcMidnight:
+    """Test cases for the daily snapshot trigger time."""
+
+    def test_mid_day_runs_at_next_midnight(self):
+        """Test a time during the day maps to the following midnight."""
+        now = datetime(2024, 3, 10, 15, 30, 12, 500, tzinfo=timezone.utc)
+        assert _next_utc_midnight(now) == datetime(2024, 3, 11, tzinfo=timezone.utc)
+
+    def test_exact_midnight_runs_a_day_later(self):
+        """Test midnight itself is not due again (strictly after now)."""
+        now = datetime(2024, 3, 10, tzinfo=timezone.utc)
+        assert _next_utc_midnight(now) == datetime(2024, 3, 11, tzinfo=timezone.utc)
+
+    def test_rolls_over_month_and_year(self):
+        """Test month and year boundaries are handled."""
+        now = datetime(2023, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
+        assert _next_utc_midnight(now) == datetime(2024, 1, 1, tzinfo=timezone.utc)
@@ -0,0 +1,89 @@
+"""Unit tests for outgoing message queue."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from telegram.error import RetryAfter
+
+from src.infrastructure.cache import ttl_cache
+from src.infrastructure.telegram import send_queue
+from src.infrastructure.telegram.send_queue import OutgoingMessage, SendQueue
+
+
+class FakeBot:
+    """Bot stub recording sent messages; raises queued errors first."""
+
+    def __init__(self, errors=()):
+        self.sent = []
+        self._errors = list(errors)
+
+    async def send_message(self, chat_id, text, reply_parameters=None):
+        if self._errors:
+            raise self._errors.pop(0)
+        self.sent.append((chat_id, text))
+
+
+class TestSendQueue:
+    """Test cases for SendQueue."""
+
+    async def test_full_queue_applies_backpressure(self):
+        """Test enqueueing waits while the queue is full and resumes once it drains."""
+        bot = FakeBot()
+        queue = SendQueue(bot, workers=1, maxsize=1)
+        await queue.send_message(1, "first")
+
+        blocked = asyncio.create_task(queue.send_message(2, "second"))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        queue.start()
+        await asyncio.wait_for(blocked, 1)
+        await queue.stop()
+        assert bot.sent == [(1, "first"), (2, "second")]
+
+    async def test_retry_after_is_retried(self, monkeypatch):
+        """Test a RetryAfter (429) response is retried after the requested delay."""
+        monkeypatch.setattr(send_queue, "PER_CHAT_SEND_RATE", 1000.0)
+        bot = FakeBot(errors=[RetryAfter(0)])
+        queue = SendQueue(bot)
+
+        await queue._deliver(OutgoingMessage(1, "hello"))
+        assert bot.sent == [(1, "hello")]
+
+    async def test_retry_after_gives_up_after_max_retries(self, monkeypatch):
+        """Test delivery raises once every attempt hit RetryAfter."""
+        monkeypatch.setattr(send_queue, "PER_CHAT_SEND_RATE", 1000.0)
+        bot = FakeBot(errors=[RetryAfter(0)] * 2)
+        queue = SendQueue(bot, max_retries=2)
+
+        with pytest.raises(RetryAfter):
+            await queue._deliver(OutgoingMessage(1, "hello"))
+        assert bot.sent == []
+
+    async def test_failed_delivery_calls_on_error(self, monkeypatch):
+        """Test the worker reports a finally failed message to its on_error hook."""
+        monkeypatch.setattr(send_queue, "PER_CHAT_SEND_RATE", 1000.0)
+        bot = FakeBot(errors=[RetryAfter(0)])
+        queue = SendQueue(bot, workers=1, max_retries=1)
+        errors = []
+        queue.start()
+
+        await queue.send_message(1, "hello", on_error=errors.append)
+        await queue.stop()
+        assert len(errors) == 1
+        assert isinstance(errors[0], RetryAfter)
+
+    def test_busy_chat_keeps_its_bucket(self, monkeypatch):
+        """Test a chat's bucket only expires after a minute without sends."""
+        clock = SimpleNamespace(now=1000.0)
+        monkeypatch.setattr(ttl_cache, "time", SimpleNamespace(monotonic=lambda: clock.now))
+        queue = SendQueue(bot=None)
+
+        bucket = queue._chat_bucket(1)
+        for _ in range(5):
+            clock.now += 30
+            assert queue._chat_bucket(1) is bucket
+
+        clock.now += 61
+        assert queue._chat_bucket(1) is not bucket
@@ -0,0 +1,19 @@
+"""Unit tests for Telegram user resolver error classification."""
+
+from src.infrastructure.telegram.telegram_user_resolver import _classify_bad_request
+
+
+class TestClassifyBadRequest:
+    """Test cases for BadRequest message classification."""
+
+    def test_single_phrase_messages(self):
+        """Test each known phrase maps to its category."""
+        assert _classify_bad_request("Bad Request: user not found") == "user_not_found"
+        assert _classify_bad_request("Bad Request: chat not found") == "chat_not_found"
+        assert _classify_bad_request("Bad Request: invalid user_id specified") == "invalid_user"
+        assert _classify_bad_request("Bad Request: message is too long") is None
+
+    def test_earlier_category_wins_over_earlier_position(self):
+        """Test precedence follows category order, not where phrases appear in the message."""
+        assert _classify_bad_request("Invalid user_id: user not found") == "user_not_found"
+        assert _classify_bad_request("user_id invalid: chat not found") == "chat_not_found"
@@ -0,0 +1,50 @@
+"""Unit tests for asyncio token bucket."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.infrastructure.telegram import token_bucket
+from src.infrastructure.telegram.token_bucket import AsyncTokenBucket
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock; sleeps are recorded and advance it instantly."""
+    state = SimpleNamespace(now=1000.0, sleeps=[])
+
+    async def sleep(seconds):
+        state.sleeps.append(seconds)
+        state.now += seconds
+
+    monkeypatch.setattr(token_bucket, "time", SimpleNamespace(monotonic=lambda: state.now))
+    monkeypatch.setattr(token_bucket, "asyncio", SimpleNamespace(sleep=sleep))
+    return state
+
+
+class TestAsyncTokenBucket:
+    """Test cases for AsyncTokenBucket."""
+
+    async def test_burst_up_to_capacity_does_not_wait(self, clock):
+        """Test the first capacity acquisitions return without sleeping."""
+        bucket = AsyncTokenBucket(rate=1, capacity=5)
+        for _ in range(5):
+            await bucket.acquire()
+        assert clock.sleeps == []
+
+    async def test_acquisitions_beyond_capacity_are_paced(self, clock):
+        """Test acquisitions past the burst wait 1/rate seconds each."""
+        bucket = AsyncTokenBucket(rate=50, capacity=1)
+        for _ in range(6):
+            await bucket.acquire()
+        assert clock.sleeps == pytest.approx([0.02] * 5)
+
+    async def test_idle_time_refills_tokens(self, clock):
+        """Test tokens accumulate while idle, up to capacity."""
+        bucket = AsyncTokenBucket(rate=1, capacity=2)
+        await bucket.acquire()
+        await bucket.acquire()
+        clock.now += 10
+        await bucket.acquire()
+        await bucket.acquire()
+        assert clock.sleeps == []
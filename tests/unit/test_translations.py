@@ -0,0 +1,34 @@
+"""Unit tests for translations."""
+
+from src.infrastructure.i18n.translations import (
+    TRANSLATIONS,
+    format_translated_message,
+    translate,
+)
+
+
+class TestTranslations:
+    """Test cases for translate and format_translated_message."""
+
+    def test_translate_returns_language_string(self):
+        """Test key is translated to the requested language."""
+        assert translate("commands.help", "ru") == TRANSLATIONS["ru"]["commands.help"]
+
+    def test_translate_falls_back_to_english(self):
+        """Test unknown language falls back to English."""
+        assert translate("commands.help", "xx") == TRANSLATIONS["en"]["commands.help"]
+
+    def test_translate_returns_key_when_missing(self):
+        """Test unknown key is returned as is."""
+        assert translate("no.such.key", "en") == "no.such.key"
+
+    def test_translate_is_memoized(self):
+        """Test repeated lookups are served from the cache."""
+        translate.cache_clear()
+        translate("commands.help", "en")
+        translate("commands.help", "en")
+        assert translate.cache_info().hits == 1
+
+    def test_format_keeps_template_on_missing_placeholder(self):
+        """Test formatting with missing placeholders returns the template."""
+        assert format_translated_message("no.such.{key}", "en") == "no.such.{key}"
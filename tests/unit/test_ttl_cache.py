@@ -0,0 +1,136 @@
+"""Unit tests for in-process TTL cache."""
+
+import asyncio
+
+import pytest
+
+from src.infrastructure.cache.ttl_cache import MISSING, SingleFlight, TTLCache
+
+
+class TestTTLCache:
+    """Test cases for TTLCache."""
+
+    def test_get_returns_missing_for_unknown_key(self):
+        """Test a miss is distinguishable from a cached None."""
+        cache = TTLCache(ttl=60)
+        assert cache.get("key") is MISSING
+        cache.set("key", None)
+        assert cache.get("key") is None
+
+    def test_expired_entry_is_dropped(self):
+        """Test entries are not returned after their TTL."""
+        cache = TTLCache(ttl=60)
+        cache.set("key", "value", ttl=0)
+        assert cache.get("key") is MISSING
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test maxsize evicts the least recently used entry."""
+        cache = TTLCache(ttl=60, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("a") == 1
+        assert cache.get("b") is MISSING
+        assert cache.get("c") == 3
+
+    async def test_concurrent_misses_share_one_load(self):
+        """Test concurrent misses for one key issue a single load."""
+        cache = TTLCache(ttl=60)
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(*(cache.get_or_load("key", loader) for _ in range(5)))
+        assert results == ["value"] * 5
+        assert calls == 1
+        assert cache.get("key") == "value"
+
+    async def test_write_during_load_wins(self):
+        """Test a load racing with a write does not overwrite the newer value."""
+        cache = TTLCache(ttl=60)
+
+        async def loader():
+            cache.set("key", "new")
+            return "stale"
+
+        assert await cache.get_or_load("key", loader) == "stale"
+        assert cache.get("key") == "new"
+
+
+class TestSingleFlight:
+    """Test cases for SingleFlight."""
+
+    async def test_concurrent_calls_share_one_result(self):
+        """Test concurrent calls for one key run the loader once and share its value."""
+        flight = SingleFlight()
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return object()
+
+        results = await asyncio.gather(*(flight.run("key", loader) for _ in range(5)))
+        assert calls == 1
+        assert all(result is results[0] for result in results)
+
+    async def test_concurrent_calls_share_one_exception(self):
+        """Test a failing loader raises the same exception in every waiter, once."""
+        flight = SingleFlight()
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            *(flight.run("key", loader) for _ in range(3)), return_exceptions=True
+        )
+        assert calls == 1
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert all(result is results[0] for result in results)
+
+    async def test_cancelled_first_caller_does_not_cancel_others(self):
+        """Test cancelling the caller that started the load leaves it running for the rest."""
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def loader():
+            await release.wait()
+            return "value"
+
+        leader = asyncio.create_task(flight.run("key", loader))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.run("key", loader))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await follower == "value"
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+    async def test_next_call_after_completion_loads_again(self):
+        """Test nothing is cached once the in-flight call finishes."""
+        flight = SingleFlight()
+
+        async def failing():
+            raise RuntimeError("boom")
+
+        async def loader():
+            return "value"
+
+        with pytest.raises(RuntimeError):
+            await flight.run("key", failing)
+        assert await flight.run("key", loader) == "value"
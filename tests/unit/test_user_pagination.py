@@ -0,0 +1,55 @@
+"""Unit tests for keyset pagination in the user repository."""
+
+from types import SimpleNamespace
+
+from src.infrastructure.database.repositories import supabase_user_repository
+from src.infrastructure.database.repositories.supabase_user_repository import SupabaseUserRepository
+
+
+class FakeQuery:
+    """PostgREST query builder stub recording the calls made on it."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        def record(*args, **kwargs):
+            self.calls.append((name, args))
+            return self
+        return record
+
+    async def execute(self):
+        return SimpleNamespace(data=[])
+
+
+class TestKeysetPagination:
+    """Test cases for SupabaseUserRepository keyset paging."""
+
+    async def test_find_all_seeks_past_cursor(self, monkeypatch):
+        """Test after_id filters on the primary key instead of using an offset."""
+        query = FakeQuery()
+        monkeypatch.setattr(
+            supabase_user_repository, "get_supabase_client", lambda: SimpleNamespace(table=lambda name: query)
+        )
+
+        await SupabaseUserRepository().find_all(limit=2, after_id=7)
+        assert ("gt", ("id", 7)) in query.calls
+        assert ("order", ("id",)) in query.calls
+        assert ("limit", (2,)) in query.calls
+        assert not any(name == "offset" for name, _ in query.calls)
+
+    async def test_iter_all_advances_cursor_to_last_id(self):
+        """Test each page starts after the previous page's last id and a short page ends it."""
+        ids = [1, 2, 5, 8, 9]
+        cursors = []
+
+        async def find_all(limit=None, offset=0, after_id=None):
+            cursors.append(after_id)
+            return [SimpleNamespace(id=i) for i in ids if i > after_id][:limit]
+
+        repository = SupabaseUserRepository()
+        repository.find_all = find_all
+        pages = [[user.id for user in page] async for page in repository.iter_all(page_size=2)]
+
+        assert pages == [[1, 2], [5, 8], [9]]
+        assert cursors == [0, 2, 8]